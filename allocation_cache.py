@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Incremental Allocation Cache
+===========================================================
+
+Persistent on-disk cache of calculated allocations, so reruns only
+recompute proposals whose CSV row or vesting configuration changed.
+
+Each entry is keyed by a SHA-256 hash of the approach, the full funded CSV
+row and a fingerprint of the active configuration (ratios, milestones,
+cliff and tail settings). Changing any of them produces a new key, so stale
+entries are never reused; they are simply left behind until compaction.
+
+Storage is a single SQLite file. Every run is recorded with its hit/miss
+counts, and entries remember the last run that used them. A batch over
+several funds is a single run shared by all of its workers.
+
+Usage:
+    python3 token_distribution_hybrid.py --cache .allocation_cache.sqlite
+    python3 allocation_cache.py stats
+    python3 allocation_cache.py compact       # drop entries unused by the latest run
+    python3 allocation_cache.py invalidate --approach hybrid
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_CACHE_PATH = '.allocation_cache.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS allocations (
+    key TEXT PRIMARY KEY,
+    approach TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    last_run INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS allocations_approach ON allocations (approach);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    approach TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def config_fingerprint(config: Any) -> str:
+    """Stable hash of a configuration value (dataclasses, tuples, dicts, numbers)"""
+    encoded = json.dumps(config, sort_keys=True, default=repr)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def row_key(approach: str, row: Dict[str, Any], fingerprint: str) -> str:
+    """Content hash of one funded CSV row under a configuration fingerprint"""
+    # DictReader uses a None key for surplus columns, so keys are stringified
+    items = sorted((str(k), v) for k, v in row.items())
+    encoded = json.dumps([approach, fingerprint, items])
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class AllocationCache:
+    """SQLite-backed store of serialized allocations keyed by content hash"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=60)
+        self.conn.executescript(SCHEMA)
+        self.run_id: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def begin_run(self, approach: str, run_id: Optional[int] = None) -> int:
+        """
+        Record a new run; entries used from now on are stamped with its id.
+
+        With run_id, join an existing run instead (e.g. one batch run shared by
+        every fund's worker), so compaction keeps the entries of all funds.
+        """
+        if run_id is None:
+            with self.conn:
+                cursor = self.conn.execute(
+                    "INSERT INTO runs (approach, started_at) VALUES (?, ?)",
+                    (approach, datetime.now().isoformat())
+                )
+            run_id = cursor.lastrowid
+        self.run_id = run_id
+        self.hits = 0
+        self.misses = 0
+        return self.run_id
+
+    def lookup_many(self, keys: List[str], batch_size: int = 500) -> Dict[str, Dict[str, Any]]:
+        """Fetch cached payloads for keys, stamping hits with the current run"""
+        found: Dict[str, Dict[str, Any]] = {}
+        with self.conn:
+            for start in range(0, len(keys), batch_size):
+                chunk = keys[start:start + batch_size]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT key, payload FROM allocations WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, payload in rows:
+                    found[key] = json.loads(payload)
+                if self.run_id is not None and rows:
+                    self.conn.executemany(
+                        "UPDATE allocations SET last_run = ? WHERE key = ?",
+                        [(self.run_id, key) for key, _ in rows]
+                    )
+
+        self.hits += len(found)
+        self.misses += len(set(keys)) - len(found)
+        return found
+
+    def store_many(self, approach: str, entries: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Insert or replace (key, payload) entries in one transaction"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO allocations (key, approach, payload, last_run) "
+                "VALUES (?, ?, ?, ?)",
+                [(key, approach, json.dumps(payload), self.run_id or 0) for key, payload in entries]
+            )
+
+    def finish_run(self) -> Dict[str, Any]:
+        """Add the hit/miss counts since begin_run to the run's totals and return them"""
+        if self.run_id is not None:
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE runs SET hits = hits + ?, misses = misses + ? WHERE id = ?",
+                    (self.hits, self.misses, self.run_id)
+                )
+        return self.report()
+
+    def report(self) -> Dict[str, Any]:
+        """Hit/miss counts and hit rate of the current run"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def invalidate(self, approach: Optional[str] = None) -> int:
+        """Delete all entries (or those of one approach); returns rows removed"""
+        with self.conn:
+            if approach:
+                cursor = self.conn.execute("DELETE FROM allocations WHERE approach = ?", (approach,))
+            else:
+                cursor = self.conn.execute("DELETE FROM allocations")
+        return cursor.rowcount
+
+    def compact(self) -> int:
+        """
+        Drop entries not used by the latest run of their approach, then VACUUM.
+
+        Entries for changed rows or old configurations are never looked up
+        again, so this reclaims their space. Returns rows removed.
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM allocations WHERE last_run < "
+                "(SELECT COALESCE(MAX(id), 0) FROM runs WHERE runs.approach = allocations.approach)"
+            )
+        removed = cursor.rowcount
+        self.conn.execute("VACUUM")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry counts per approach and the most recent runs"""
+        entries = dict(self.conn.execute(
+            "SELECT approach, COUNT(*) FROM allocations GROUP BY approach"
+        ).fetchall())
+        runs = [
+            {'id': r[0], 'approach': r[1], 'started_at': r[2], 'hits': r[3], 'misses': r[4]}
+            for r in self.conn.execute(
+                "SELECT id, approach, started_at, hits, misses FROM runs ORDER BY id DESC LIMIT 10"
+            )
+        ]
+        return {'path': self.path, 'entries': entries, 'recent_runs': runs}
+
+
+def print_cache_report(report: Dict[str, Any]):
+    """Print the cache line of a run report"""
+    print(f"Allocation cache: {report['hits']} hits, {report['misses']} misses "
+          f"({report['hit_rate'] * 100:.1f}% hit rate)")
+
+
+def main():
+    """Cache maintenance commands"""
+    parser = argparse.ArgumentParser(description="Manage the incremental allocation cache")
+    parser.add_argument('command', choices=['stats', 'compact', 'invalidate'])
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH, help='Cache file path')
+    parser.add_argument('--approach', choices=['pure', 'hybrid'],
+                        help='Only invalidate entries of this approach')
+    args = parser.parse_args()
+
+    with AllocationCache(args.cache) as cache:
+        if args.command == 'stats':
+            print(json.dumps(cache.stats(), indent=2))
+        elif args.command == 'compact':
+            print(f"Removed {cache.compact()} stale entries from {args.cache}")
+        else:
+            print(f"Invalidated {cache.invalidate(args.approach)} entries in {args.cache}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - SQLite Allocation Store
+======================================================
+
+Queryable alternative to the flat CSV / JSON exports. Allocations,
+milestone schedules and monthly timeline snapshots are bulk-loaded into an
+indexed SQLite database, so questions about one project, month, category or
+fund are answered by index lookups instead of re-parsing whole files.
+
+Tables:
+- loads:       one row per (fund, approach) loaded, with the export metadata
+- allocations: one row per project
+- milestones:  one row per (project, milestone, category)
+- snapshots:   one row per (project, month, category) - hybrid timelines
+- categories:  category names; milestone and snapshot rows store the
+               small integer id (the index into vesting_engine.CATEGORIES)
+
+Each load runs in a single transaction with batched executemany inserts;
+loading a (fund, approach) again replaces its previous rows. Milestones and
+snapshots are plain rowid tables whose indexes are dropped while rows are
+appended and rebuilt once afterwards, which is far cheaper than keeping
+a primary key B-tree ordered row by row. ANALYZE then refreshes the planner
+statistics so project lookups are driven by the project's index.
+
+Usage:
+    python3 token_distribution_hybrid.py --sqlite allocations.sqlite
+    python3 allocation_store.py allocations.sqlite funds
+    python3 allocation_store.py allocations.sqlite project "Testnet Cardanoscan Explorer" --month 4
+    python3 allocation_store.py allocations.sqlite month 6 --category participant
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from vesting_engine import CATEGORIES
+
+INSERT_BATCH_SIZE = 1_000  # Projects per executemany round (and per store_batches batch)
+SCHEMA_VERSION = 2  # PRAGMA user_version; 2 = integer categories, rowid bulk tables
+ANALYSIS_LIMIT = 1_000  # Index rows sampled per index by ANALYZE (keeps it cheap on large stores)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS loads (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fund TEXT NOT NULL,
+    approach TEXT NOT NULL,
+    loaded_at TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    UNIQUE (fund, approach)
+);
+CREATE TABLE IF NOT EXISTS allocations (
+    id INTEGER PRIMARY KEY,
+    load_id INTEGER NOT NULL REFERENCES loads (id),
+    proposal_name TEXT NOT NULL,
+    requested_funding_usd REAL NOT NULL,
+    total_tokens REAL NOT NULL,
+    project_tokens REAL NOT NULL,
+    participant_tokens REAL NOT NULL,
+    auditor_tokens REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS milestones (
+    allocation_id INTEGER NOT NULL,
+    milestone_index INTEGER NOT NULL,
+    milestone_name TEXT NOT NULL,
+    category INTEGER NOT NULL,
+    unlock_month INTEGER,
+    vesting_months INTEGER,
+    tokens REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    allocation_id INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    category INTEGER NOT NULL,
+    new_unlocked REAL NOT NULL,
+    vested_this_month REAL NOT NULL,
+    cumulative_vested REAL NOT NULL,
+    vested_pct REAL NOT NULL
+);
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS allocations_load_project ON allocations (load_id, proposal_name);
+CREATE INDEX IF NOT EXISTS allocations_project ON allocations (proposal_name);
+CREATE INDEX IF NOT EXISTS milestones_allocation ON milestones (allocation_id, milestone_index, category);
+CREATE INDEX IF NOT EXISTS snapshots_allocation ON snapshots (allocation_id, month, category);
+CREATE INDEX IF NOT EXISTS snapshots_month ON snapshots (month, category);
+"""
+
+# Indexes on the bulk tables, dropped during a load and rebuilt after it
+BULK_INDEXES = ('milestones_allocation', 'snapshots_allocation', 'snapshots_month')
+
+# Row shapes produced by the processors' store_batches methods; the first
+# field is the allocation id and categories are indexes into CATEGORIES
+AllocationRow = Tuple[int, str, float, float, float, float, float]
+MilestoneRow = Tuple[int, int, str, int, Optional[int], Optional[int], float]
+SnapshotRow = Tuple[int, int, int, float, float, float, float]
+StoreBatch = Tuple[List[AllocationRow], List[MilestoneRow], List[SnapshotRow]]
+
+
+def batches(items: Iterable[Any], size: int = INSERT_BATCH_SIZE) -> Iterator[List[Any]]:
+    """Split items into lists of at most size"""
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def category_id(category: Optional[str]) -> Optional[int]:
+    """Stored id of a category name"""
+    return None if category is None else CATEGORIES.index(category)
+
+
+def fund_name(csv_path: str) -> str:
+    """Fund name of a CSV, as used by the batch runner (file name without extension)"""
+    return os.path.splitext(os.path.basename(csv_path))[0]
+
+
+class AllocationStore:
+    """SQLite database of allocations, milestone schedules and monthly snapshots"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=60)
+        self.conn.row_factory = sqlite3.Row
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        has_tables = self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'loads'").fetchone()
+        if has_tables and version != SCHEMA_VERSION:
+            self.conn.close()
+            raise ValueError(
+                f"{path} uses store schema version {version}, expected {SCHEMA_VERSION}; "
+                "delete it and load the exports again"
+            )
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO categories VALUES (?, ?)", enumerate(CATEGORIES))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def load(
+        self,
+        fund: str,
+        approach: str,
+        metadata: Dict[str, Any],
+        store_batches: Callable[[int], Iterable[StoreBatch]]
+    ) -> Dict[str, int]:
+        """
+        Replace the rows of (fund, approach) with the given allocations.
+
+        store_batches(first_id) yields (allocation rows, milestone rows,
+        snapshot rows) batches whose allocation ids count up from first_id.
+        Everything is written in one transaction; returns row counts.
+        """
+        counts = {'allocations': 0, 'milestones': 0, 'snapshots': 0}
+        conn = self.conn
+        # The store is rebuilt from the exports on failure, so skip fsyncs while loading
+        conn.execute("PRAGMA synchronous = OFF")
+        try:
+            with conn:
+                for index in BULK_INDEXES:
+                    conn.execute(f"DROP INDEX IF EXISTS {index}")
+                self._delete_load(fund, approach)
+                load_id = conn.execute(
+                    "INSERT INTO loads (fund, approach, loaded_at, metadata) VALUES (?, ?, ?, ?)",
+                    (fund, approach, datetime.now().isoformat(), json.dumps(metadata))
+                ).lastrowid
+                first_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM allocations").fetchone()[0]
+
+                for allocation_rows, milestone_rows, snapshot_rows in store_batches(first_id):
+                    conn.executemany(
+                        f"INSERT INTO allocations VALUES (?, {load_id}, ?, ?, ?, ?, ?, ?)", allocation_rows
+                    )
+                    conn.executemany("INSERT INTO milestones VALUES (?, ?, ?, ?, ?, ?, ?)", milestone_rows)
+                    conn.executemany("INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?)", snapshot_rows)
+                    counts['allocations'] += len(allocation_rows)
+                    counts['milestones'] += len(milestone_rows)
+                    counts['snapshots'] += len(snapshot_rows)
+                for statement in INDEXES.strip().splitlines():
+                    conn.execute(statement)
+                # Fresh statistics, so a project/month lookup is driven by the
+                # project (snapshots_allocation) rather than scanning the month
+                conn.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+                conn.execute("ANALYZE")
+        finally:
+            conn.execute("PRAGMA synchronous = FULL")
+        return counts
+
+    def _delete_load(self, fund: str, approach: str):
+        row = self.conn.execute(
+            "SELECT id FROM loads WHERE fund = ? AND approach = ?", (fund, approach)
+        ).fetchone()
+        if row is None:
+            return
+        # A load's allocation ids are one contiguous range, so the bulk tables
+        # (unindexed while loading) are cleared with a single range scan
+        first_id, last_id = self.conn.execute(
+            "SELECT MIN(id), MAX(id) FROM allocations WHERE load_id = ?", (row['id'],)
+        ).fetchone()
+        if first_id is not None:
+            for table in ('snapshots', 'milestones'):
+                self.conn.execute(
+                    f"DELETE FROM {table} WHERE allocation_id BETWEEN ? AND ?", (first_id, last_id)
+                )
+        self.conn.execute("DELETE FROM allocations WHERE load_id = ?", (row['id'],))
+        self.conn.execute("DELETE FROM loads WHERE id = ?", (row['id'],))
+
+    @staticmethod
+    def _filters(fund: Optional[str], approach: Optional[str]) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if fund is not None:
+            clauses.append("l.fund = ?")
+            params.append(fund)
+        if approach is not None:
+            clauses.append("l.approach = ?")
+            params.append(approach)
+        return ''.join(f" AND {clause}" for clause in clauses), params
+
+    def funds(self) -> List[Dict[str, Any]]:
+        """Every loaded (fund, approach) with its project count"""
+        return [dict(row) for row in self.conn.execute(
+            "SELECT l.fund, l.approach, l.loaded_at, COUNT(a.id) AS projects, "
+            "SUM(a.total_tokens) AS total_tokens "
+            "FROM loads l LEFT JOIN allocations a ON a.load_id = l.id "
+            "GROUP BY l.id ORDER BY l.fund, l.approach"
+        )]
+
+    def allocations(self, project: Optional[str] = None, fund: Optional[str] = None,
+                    approach: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Allocations, optionally of one project and / or fund and approach"""
+        where, params = self._filters(fund, approach)
+        if project is not None:
+            where += " AND a.proposal_name = ?"
+            params.append(project)
+        return [dict(row) for row in self.conn.execute(
+            "SELECT l.fund, l.approach, a.* FROM allocations a JOIN loads l ON a.load_id = l.id "
+            f"WHERE 1{where} ORDER BY a.id", params
+        )]
+
+    def milestones(self, project: str, fund: Optional[str] = None, approach: Optional[str] = None,
+                   category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Milestone schedule rows of a project"""
+        where, params = self._filters(fund, approach)
+        if category is not None:
+            where += " AND m.category = ?"
+            params.append(category_id(category))
+        return [dict(row) for row in self.conn.execute(
+            "SELECT l.fund, l.approach, a.proposal_name, m.milestone_index, m.milestone_name, c.name AS category, "
+            "m.unlock_month, m.vesting_months, m.tokens "
+            "FROM allocations a JOIN loads l ON a.load_id = l.id "
+            "JOIN milestones m ON m.allocation_id = a.id JOIN categories c ON c.id = m.category "
+            f"WHERE a.proposal_name = ?{where} ORDER BY a.id, m.milestone_index, m.category",
+            [project] + params
+        )]
+
+    def snapshots(self, project: str, month: Optional[int] = None, category: Optional[str] = None,
+                  fund: Optional[str] = None, approach: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Monthly snapshot rows of a project (one month and / or category when given)"""
+        where, params = self._filters(fund, approach)
+        if month is not None:
+            where += " AND s.month = ?"
+            params.append(month)
+        if category is not None:
+            where += " AND s.category = ?"
+            params.append(category_id(category))
+        return [dict(row) for row in self.conn.execute(
+            "SELECT l.fund, l.approach, a.proposal_name, s.month, c.name AS category, s.new_unlocked, "
+            "s.vested_this_month, s.cumulative_vested, s.vested_pct "
+            "FROM allocations a JOIN loads l ON a.load_id = l.id "
+            "JOIN snapshots s ON s.allocation_id = a.id JOIN categories c ON c.id = s.category "
+            f"WHERE a.proposal_name = ?{where} ORDER BY a.id, s.month, s.category",
+            [project] + params
+        )]
+
+    def month_totals(self, month: int, category: Optional[str] = None, fund: Optional[str] = None,
+                     approach: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Tokens unlocked and vested across all projects in a month, per fund, approach and category"""
+        where, params = self._filters(fund, approach)
+        if category is not None:
+            where += " AND s.category = ?"
+            params.append(category_id(category))
+        return [dict(row) for row in self.conn.execute(
+            "SELECT l.fund, l.approach, c.name AS category, COUNT(*) AS projects, "
+            "SUM(s.new_unlocked) AS new_unlocked, SUM(s.vested_this_month) AS vested_this_month, "
+            "SUM(s.cumulative_vested) AS cumulative_vested "
+            "FROM snapshots s JOIN allocations a ON s.allocation_id = a.id JOIN loads l ON a.load_id = l.id "
+            "JOIN categories c ON c.id = s.category "
+            f"WHERE s.month = ?{where} GROUP BY l.fund, l.approach, s.category "
+            "ORDER BY l.fund, l.approach, s.category",
+            [month] + params
+        )]
+
+
+def print_rows(rows: List[Dict[str, Any]]):
+    """Print query rows as an aligned table"""
+    if not rows:
+        print("No rows")
+        return
+    columns = list(rows[0])
+    cells = [[f"{row[c]:,.2f}" if isinstance(row[c], float) else str(row[c]) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    print('  '.join(c.ljust(w) for c, w in zip(columns, widths)))
+    for r in cells:
+        print('  '.join(v.ljust(w) for v, w in zip(r, widths)))
+
+
+def main():
+    """Query an allocation store"""
+    parser = argparse.ArgumentParser(description="Query the SQLite allocation store")
+    parser.add_argument('database', help='Store written with --sqlite')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('funds', help='Loaded funds and approaches')
+
+    project = sub.add_parser('project', help='Allocation, milestones or snapshots of a project')
+    project.add_argument('name')
+    project.add_argument('--milestones', action='store_true', help='Show the milestone schedule')
+    project.add_argument('--month', type=int, help='Show the snapshot of this month')
+    project.add_argument('--timeline', action='store_true', help='Show every monthly snapshot')
+
+    month = sub.add_parser('month', help='Portfolio totals of a month')
+    month.add_argument('month', type=int)
+
+    for command in (project, month):
+        command.add_argument('--category', choices=CATEGORIES)
+        command.add_argument('--fund')
+        command.add_argument('--approach', choices=('pure', 'hybrid'))
+    args = parser.parse_args()
+
+    with AllocationStore(args.database) as store:
+        if args.command == 'funds':
+            print_rows(store.funds())
+        elif args.command == 'month':
+            print_rows(store.month_totals(args.month, args.category, args.fund, args.approach))
+        elif args.milestones:
+            print_rows(store.milestones(args.name, args.fund, args.approach, args.category))
+        elif args.month is not None or args.timeline:
+            print_rows(store.snapshots(args.name, args.month, args.category, args.fund, args.approach))
+        else:
+            print_rows(store.allocations(args.name, args.fund, args.approach))
+
+
+if __name__ == '__main__':
+    main()
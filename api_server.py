@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Allocation API
+=============================================
+
+Local asyncio HTTP service over both processors (loaded in one pass by the
+unified engine). Unlike `python3 -m http.server`, which ships whole JSON
+files from one thread, it answers per-project and point-in-time questions
+and serves many keep-alive connections concurrently.
+
+Endpoints (GET or HEAD, JSON; approach is 'pure' or 'hybrid'):
+- /api/health
+- /api/{approach}/summary                       metadata and summary
+- /api/{approach}/portfolio                     portfolio vesting series
+- /api/{approach}/projects                      project names and totals
+- /api/{approach}/projects/{name}               one allocation (export form)
+- /api/{approach}/projects/{name}/timeline      monthly timeline (hybrid) or
+                                                cumulative releases (pure)
+- /api/{approach}/projects/{name}/vested?day=D&category=C
+                                                vested / unvested tokens at day D
+- /api/comparison/{name}                        pure vs hybrid comparison
+- /api/cache                                    response cache statistics (never cached)
+
+Project names are URL-encoded. Encoded responses are kept in an LRU cache
+keyed by path and query, with a strong ETag (If-None-Match answers 304) and
+a gzip body built once when a client accepts it. With --static-dir the
+dashboard is served from the same origin.
+
+Usage:
+    python3 api_server.py --port 8080
+    python3 api_server.py --port 8000 --static-dir dashboard
+    curl 'http://localhost:8080/api/hybrid/projects/Testnet%20Cardanoscan%20Explorer/vested?day=95'
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gzip
+import hashlib
+import io
+import json
+import math
+import mimetypes
+import os
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import vesting_engine
+from unified_engine import UnifiedProcessor
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+DEFAULT_CACHE_SIZE = 1024          # Encoded responses kept in memory
+GZIP_MIN_BYTES = 1024              # Smaller bodies are sent uncompressed
+KEEP_ALIVE_TIMEOUT = 15.0          # Seconds an idle connection is kept open
+MAX_HEADER_LINES = 100
+MAX_DISCARDED_BODY = 64 * 1024     # Larger request bodies close the connection instead
+
+APPROACHES = ('pure', 'hybrid')
+
+
+class ApiError(Exception):
+    """Request error answered with a JSON error body"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class CachedResponse:
+    """Encoded response body with its ETag and (lazily built) gzip form"""
+    status: HTTPStatus
+    content_type: str
+    body: bytes
+    etag: str
+    gzipped: Optional[bytes] = None
+
+    def gzip_body(self) -> bytes:
+        if self.gzipped is None:
+            self.gzipped = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self.gzipped
+
+
+def encode_response(status: HTTPStatus, payload: Any) -> CachedResponse:
+    """JSON-encode a payload and tag it"""
+    body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return CachedResponse(status, 'application/json', body, f'"{hashlib.sha1(body).hexdigest()}"')
+
+
+class ResponseCache:
+    """LRU cache of encoded responses"""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries: 'OrderedDict[Any, CachedResponse]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> Optional[CachedResponse]:
+        response = self.entries.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def put(self, key, response: CachedResponse):
+        self.entries[key] = response
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+class AllocationAPI:
+    """Routes API paths to the processors' allocations"""
+
+    def __init__(self, unified: UnifiedProcessor):
+        self.unified = unified
+        self.processors = {'pure': unified.pure, 'hybrid': unified.hybrid}
+        self.configs = {'pure': unified.pure_config, 'hybrid': unified.hybrid_config}
+        self.index = {
+            approach: {alloc.proposal_name: alloc for alloc in processor.allocations}
+            for approach, processor in self.processors.items()
+        }
+
+    def allocation(self, approach: str, name: str):
+        try:
+            return self.index[approach][name]
+        except KeyError:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Unknown project: {name!r}") from None
+
+    def route(self, path: str, query: Dict[str, str]) -> Any:
+        """Payload of an API path (raises ApiError)"""
+        parts = [unquote(part) for part in path.strip('/').split('/')]
+        if parts[:1] != ['api'] or len(parts) < 2:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"No such endpoint: {path}")
+        if parts[1:] == ['health']:
+            return {'status': 'ok', 'projects': len(self.unified.hybrid.allocations)}
+        if parts[1] == 'comparison' and len(parts) == 3:
+            return self.unified.comparison_to_json(self.allocation('pure', parts[2]))
+
+        approach, rest = parts[1], parts[2:]
+        if approach not in APPROACHES:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Unknown approach: {approach!r}")
+        processor = self.processors[approach]
+
+        if rest == ['summary']:
+            return {'metadata': processor.export_metadata(), 'summary': asdict(processor.generate_summary())}
+        if rest == ['portfolio']:
+            return processor.portfolio_series()
+        if rest == ['projects']:
+            return [
+                {'proposal_name': a.proposal_name, 'total_tokens': a.total_tokens}
+                for a in processor.allocations
+            ]
+        if len(rest) >= 2 and rest[0] == 'projects':
+            alloc = self.allocation(approach, rest[1])
+            if len(rest) == 2:
+                return processor.allocation_to_json(alloc)
+            if rest[2:] == ['timeline']:
+                return self.timeline(approach, alloc)
+            if rest[2:] == ['vested']:
+                return self.vested(approach, alloc, query)
+        raise ApiError(HTTPStatus.NOT_FOUND, f"No such endpoint: {path}")
+
+    def timeline(self, approach: str, alloc) -> Any:
+        """Monthly timeline (hybrid) or cumulative milestone releases (pure)"""
+        if approach == 'hybrid':
+            return self.processors['hybrid'].allocation_to_json(alloc)['monthly_timeline']
+        releases = []
+        cumulative = 0.0
+        for name, release in alloc.milestone_releases.items():
+            cumulative += release['total_release']
+            releases.append({'milestone': name, 'released': release, 'cumulative_released': cumulative})
+        return releases
+
+    def vested(self, approach: str, alloc, query: Dict[str, str]) -> Dict[str, Any]:
+        """Vested and unvested tokens of a project category at a day"""
+        try:
+            day = float(query['day'])
+        except (KeyError, ValueError):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "vested needs a numeric 'day' parameter") from None
+        if not math.isfinite(day):
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"'day' must be finite, got {query['day']!r}")
+        category = query.get('category', 'total')
+        if category == 'total':
+            tokens = alloc.total_tokens
+        elif category in vesting_engine.CATEGORIES:
+            tokens = getattr(alloc, f'{category}_tokens')
+        else:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Unknown category: {category!r}")
+        fraction = vesting_engine.vested_fraction_at(self.configs[approach], day)
+        return {
+            'proposal_name': alloc.proposal_name,
+            'approach': approach,
+            'category': category,
+            'day': day,
+            'tokens': tokens,
+            'vested': tokens * fraction,
+            'unvested': tokens * (1 - fraction),
+            'vested_fraction': fraction
+        }
+
+
+class AllocationServer:
+    """asyncio HTTP/1.1 server (keep-alive, ETag, gzip) for the allocation API"""
+
+    def __init__(self, api: AllocationAPI, cache_size: int = DEFAULT_CACHE_SIZE,
+                 static_dir: Optional[str] = None):
+        self.api = api
+        self.cache = ResponseCache(cache_size)
+        self.static_dir = os.path.realpath(static_dir) if static_dir else None
+        self.requests = 0
+
+    def respond(self, target: str) -> CachedResponse:
+        """Response for a request target, from the cache when possible"""
+        url = urlsplit(target)
+        query = dict(parse_qsl(url.query))
+        if url.path == '/api/cache':
+            return encode_response(HTTPStatus.OK, self.cache.stats())
+        if self.static_dir and not url.path.startswith('/api/'):
+            return self.static_file(url.path)
+
+        key = (url.path, tuple(sorted(query.items())))
+        response = self.cache.get(key)
+        if response is None:
+            try:
+                response = encode_response(HTTPStatus.OK, self.api.route(url.path, query))
+            except ApiError as e:
+                return encode_response(e.status, {'error': e.message})
+            except Exception as e:
+                # A route bug must not take the keep-alive connection down with it
+                return encode_response(HTTPStatus.INTERNAL_SERVER_ERROR,
+                                       {'error': f"Internal error: {type(e).__name__}"})
+            self.cache.put(key, response)
+        return response
+
+    def static_file(self, path: str) -> CachedResponse:
+        """A file under static_dir (index.html for directories), cached by path and mtime"""
+        relative = unquote(path).lstrip('/') or 'index.html'
+        full = os.path.realpath(os.path.join(self.static_dir, relative))
+        if os.path.isdir(full):
+            full = os.path.join(full, 'index.html')
+        if not full.startswith(self.static_dir + os.sep) or not os.path.isfile(full):
+            return encode_response(HTTPStatus.NOT_FOUND, {'error': f"Not found: {path}"})
+
+        key = ('static', full, os.path.getmtime(full))
+        response = self.cache.get(key)
+        if response is None:
+            with open(full, 'rb') as f:
+                body = f.read()
+            content_type = mimetypes.guess_type(full)[0] or 'application/octet-stream'
+            response = CachedResponse(HTTPStatus.OK, content_type, body, f'"{hashlib.sha1(body).hexdigest()}"')
+            self.cache.put(key, response)
+        return response
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one connection until it closes or idles out"""
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                headers = {}
+                for _ in range(MAX_HEADER_LINES):
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                else:
+                    # The rest of the headers must not be read as the next request
+                    await self.reply_and_close(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                               'Too many header lines')
+                    break
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                    body_length = int(headers.get('content-length', '0'))
+                    if body_length < 0:
+                        raise ValueError(body_length)
+                except ValueError:
+                    await self.reply_and_close(writer, HTTPStatus.BAD_REQUEST, 'Bad request')
+                    break
+                keep_alive = (
+                    headers.get('connection', '').lower() != 'close'
+                    if version == 'HTTP/1.1' else headers.get('connection', '').lower() == 'keep-alive'
+                )
+                # Request bodies are not used; skip small ones so they are not parsed as the
+                # next request, and close the connection when the body cannot be skipped safely
+                if 'transfer-encoding' in headers or body_length > MAX_DISCARDED_BODY:
+                    keep_alive = False
+                elif body_length:
+                    await reader.readexactly(body_length)
+
+                if method not in ('GET', 'HEAD'):
+                    response = encode_response(HTTPStatus.METHOD_NOT_ALLOWED, {'error': f"{method} not allowed"})
+                else:
+                    response = self.respond(target)
+                self.requests += 1
+                writer.write(self.render(response, headers, method == 'HEAD', keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def reply_and_close(self, writer: asyncio.StreamWriter, status: HTTPStatus, message: str):
+        writer.write(self.render(encode_response(status, {'error': message}), {}, head=False, keep_alive=False))
+        await writer.drain()
+
+    def render(self, response: CachedResponse, headers: Dict[str, str], head: bool, keep_alive: bool) -> bytes:
+        """Status line, headers and body (304 on a matching If-None-Match, gzip when accepted)"""
+        status = response.status
+        body = response.body
+        extra = []
+        if status == HTTPStatus.OK:
+            extra.append(f"ETag: {response.etag}")
+            extra.append("Cache-Control: no-cache")
+            extra.append("Vary: Accept-Encoding")
+            if response.etag in headers.get('if-none-match', ''):
+                status = HTTPStatus.NOT_MODIFIED
+                body = b''
+            elif len(body) >= GZIP_MIN_BYTES and 'gzip' in headers.get('accept-encoding', ''):
+                body = response.gzip_body()
+                extra.append("Content-Encoding: gzip")
+
+        lines = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Content-Type: {response.content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+            "Access-Control-Allow-Origin: *",
+            *extra
+        ]
+        head_bytes = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        return head_bytes if head or status == HTTPStatus.NOT_MODIFIED else head_bytes + body
+
+    async def serve(self, host: str, port: int, ready: Optional[asyncio.Event] = None):
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=1024)
+        async with server:
+            address = server.sockets[0].getsockname()
+            print(f"Allocation API listening on http://{address[0]}:{address[1]}/api/health")
+            if ready is not None:
+                ready.set()
+            await server.serve_forever()
+
+
+def load_api(csv_path: str) -> AllocationAPI:
+    """Process both approaches for a CSV and wrap them in the API"""
+    unified = UnifiedProcessor(csv_path)
+    # The processors report progress on stdout; keep the server log short
+    with contextlib.redirect_stdout(io.StringIO()):
+        unified.process_all_projects()
+    return AllocationAPI(unified)
+
+
+def main():
+    """Run the allocation API"""
+    parser = argparse.ArgumentParser(description="Local asyncio HTTP API for token allocations")
+    parser.add_argument('--csv', default='Project-Catalyst-Fund-5-Developer-Ecosystem.csv',
+                        help='Funded projects CSV')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help='Encoded responses kept in the LRU cache')
+    parser.add_argument('--static-dir', help='Also serve this directory (e.g. dashboard) from the same origin')
+    args = parser.parse_args()
+
+    api = load_api(args.csv)
+    print(f"Loaded {len(api.unified.hybrid.allocations)} projects from {args.csv}")
+    server = AllocationServer(api, args.cache_size, args.static_dir)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Multi-Fund Batch Runner
+======================================================
+
+Runs either processor over many Catalyst fund CSVs at once. Each fund is
+processed by its own worker in a process pool and writes its own CSV/JSON
+outputs; a combined cross-fund summary is written once all funds finish.
+
+Inputs may be CSV files, directories (every *.csv inside) or glob patterns.
+--exact, --columnar, --compact-json and --gzip-json apply to every fund;
+options that name a single output (--run-report, --profile, --dashboard-dir,
+--sqlite) are rejected in batch mode.
+
+Usage:
+    python3 token_distribution.py funds/ --output-dir batch_output
+    python3 token_distribution_hybrid.py 'funds/Fund-*.csv' --workers 8
+"""
+
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Optional
+
+from allocation_cache import AllocationCache, print_cache_report
+
+# Output file suffix per approach, matching the single-fund output names
+APPROACH_SUFFIXES = {
+    'pure': 'token_allocations_output',
+    'hybrid': 'token_allocations_hybrid_output',
+}
+
+# Per-fund options passed through to every worker (argparse dest -> default)
+FUND_OPTIONS = {
+    'exact': False,
+    'columnar': False,
+    'compact_json': False,
+    'gzip_json': False,
+}
+
+# Single-output options that have no per-fund meaning in batch mode
+UNSUPPORTED_BATCH_OPTIONS = ['run_report', 'profile', 'dashboard_dir', 'sqlite']
+
+
+def resolve_inputs(patterns: Iterable[str]) -> List[str]:
+    """Expand files, directories and glob patterns into a sorted list of CSV paths"""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = glob.glob(os.path.join(pattern, '*.csv'))
+        elif glob.has_magic(pattern):
+            matches = glob.glob(pattern)
+        else:
+            matches = [pattern]
+        paths.extend(os.path.normpath(m) for m in matches)
+
+    # Preserve a stable order and drop duplicates from overlapping patterns
+    return sorted(set(paths))
+
+
+def create_processor(approach: str, csv_path: str):
+    """Create the processor for an approach ('pure' or 'hybrid')"""
+    if approach == 'pure':
+        from token_distribution import TokenDistributionProcessor
+        return TokenDistributionProcessor(csv_path)
+    if approach == 'hybrid':
+        from token_distribution_hybrid import HybridVestingProcessor
+        return HybridVestingProcessor(csv_path)
+    raise ValueError(f"Unknown approach: {approach!r}")
+
+
+def process_fund(
+    approach: str,
+    csv_path: str,
+    output_dir: str,
+    cache_path: Optional[str] = None,
+    cache_run_id: Optional[int] = None,
+    options: Optional[Dict[str, bool]] = None
+) -> Dict[str, Any]:
+    """Process one fund CSV and write its outputs (runs inside a worker process)"""
+    options = {**FUND_OPTIONS, **(options or {})}
+    fund = os.path.splitext(os.path.basename(csv_path))[0]
+    prefix = os.path.join(output_dir, f"{fund}_{APPROACH_SUFFIXES[approach]}")
+
+    processor = create_processor(approach, csv_path)
+    processor.exact = options['exact']
+    cache_report = None
+    if cache_path:
+        # Workers share one SQLite cache file; writes are serialized by SQLite
+        with AllocationCache(cache_path) as cache:
+            cache.begin_run(approach, run_id=cache_run_id)
+            processor.process_all_projects(cache)
+            cache_report = cache.finish_run()
+    else:
+        processor.process_all_projects()
+    outputs = [f"{prefix}.csv", f"{prefix}.json" + ('.gz' if options['gzip_json'] else '')]
+    processor.export_to_csv(outputs[0])
+    processor.export_to_json(outputs[1], compact=options['compact_json'], compress=options['gzip_json'])
+    if options['columnar']:
+        outputs.append(f"{prefix}.tdcol")
+        processor.export_to_columnar(outputs[-1])
+
+    result = {
+        'fund': fund,
+        'source_csv': csv_path,
+        'outputs': outputs,
+        'summary': asdict(processor.generate_summary())
+    }
+    if cache_report is not None:
+        result['cache'] = cache_report
+    return result
+
+
+def combine_summaries(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum per-fund summaries into cross-fund totals"""
+    totals: Dict[str, Any] = {}
+    for result in results:
+        for key, value in result['summary'].items():
+            if key.startswith('total_'):
+                totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+def run_batch(
+    approach: str,
+    patterns: Iterable[str],
+    output_dir: str,
+    workers: Optional[int] = None,
+    cache_path: Optional[str] = None,
+    options: Optional[Dict[str, bool]] = None
+) -> Dict[str, Any]:
+    """
+    Process every fund matched by patterns in a process pool.
+
+    Writes per-fund outputs plus <output_dir>/cross_fund_summary_<approach>.json
+    and returns the combined summary. options holds FUND_OPTIONS overrides
+    applied to every fund.
+    """
+    csv_paths = resolve_inputs(patterns)
+    if not csv_paths:
+        raise FileNotFoundError(f"No fund CSVs matched: {', '.join(patterns)}")
+
+    funds = [os.path.splitext(os.path.basename(p))[0] for p in csv_paths]
+    duplicates = sorted({f for f in funds if funds.count(f) > 1})
+    if duplicates:
+        raise ValueError(f"Fund file names must be unique: {', '.join(duplicates)}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    max_workers = min(workers or os.cpu_count() or 1, len(csv_paths))
+
+    cache_run_id = None
+    if cache_path:
+        # One cache run for the whole batch: compaction keeps every fund's entries
+        with AllocationCache(cache_path) as cache:
+            cache_run_id = cache.begin_run(approach)
+
+    print(f"Processing {len(csv_paths)} funds with {max_workers} workers")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(
+            process_fund,
+            [approach] * len(csv_paths),
+            csv_paths,
+            [output_dir] * len(csv_paths),
+            [cache_path] * len(csv_paths),
+            [cache_run_id] * len(csv_paths),
+            [options] * len(csv_paths)
+        ))
+
+    combined = {
+        'metadata': {
+            'generated_at': datetime.now().isoformat(),
+            'approach': approach,
+            'fund_count': len(results)
+        },
+        'totals': combine_summaries(results),
+        'funds': results
+    }
+    if cache_path:
+        hits = sum(r['cache']['hits'] for r in results)
+        misses = sum(r['cache']['misses'] for r in results)
+        combined['cache'] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0
+        }
+
+    summary_path = os.path.join(output_dir, f"cross_fund_summary_{approach}.json")
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(combined, f, indent=2)
+
+    print(f"Cross-fund summary written: {summary_path}")
+    if cache_path:
+        print_cache_report(combined['cache'])
+    return combined
+
+
+def add_batch_arguments(parser):
+    """Register the batch-mode arguments shared by both scripts' main()"""
+    parser.add_argument(
+        'inputs', nargs='*',
+        help='Fund CSV files, directories or glob patterns (enables batch mode)'
+    )
+    parser.add_argument(
+        '--output-dir', default='batch_output',
+        help='Directory for per-fund outputs and the cross-fund summary'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help='Worker processes (default: number of CPU cores)'
+    )
+
+
+def batch_options(parser, args) -> Dict[str, bool]:
+    """Return the per-fund options for batch mode, rejecting single-output ones"""
+    unsupported = [
+        '--' + dest.replace('_', '-')
+        for dest in UNSUPPORTED_BATCH_OPTIONS
+        if getattr(args, dest, None)
+    ]
+    if unsupported:
+        parser.error(f"{', '.join(unsupported)} cannot be used in batch mode")
+    return {dest: bool(getattr(args, dest, default)) for dest, default in FUND_OPTIONS.items()}
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Allocation API Load Test
+========================
+
+Drives the allocation API (api_server.py) with concurrent keep-alive
+connections and reports throughput and latency percentiles.
+
+Each client connection sends requests back to back, picked from a seeded
+mix of summary, project, timeline and point-in-time vested queries over
+every project. Vested days are drawn from --days distinct values, so the
+share of requests answered from the server's response cache can be tuned.
+
+Without --url a server is started on a free local port for the run and
+stopped afterwards.
+
+Usage:
+    python3 benchmarks/api_load_test.py --concurrency 64 --requests 20000
+    python3 benchmarks/api_load_test.py --url http://127.0.0.1:8080 --duration 30 --gzip
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+
+DEFAULT_CONCURRENCY = 32
+DEFAULT_REQUESTS = 10_000
+DEFAULT_DAYS = 50
+SERVER_START_TIMEOUT = 60.0
+
+# Share of each request kind in the mix
+REQUEST_MIX = (('summary', 0.05), ('project', 0.25), ('timeline', 0.2), ('vested', 0.5))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(csv_path: Optional[str]) -> Tuple[subprocess.Popen, str]:
+    """Start api_server.py on a free port and wait until it answers"""
+    port = free_port()
+    command = [sys.executable, os.path.join(REPO_DIR, 'api_server.py'), '--port', str(port)]
+    if csv_path:
+        command += ['--csv', csv_path]
+    process = subprocess.Popen(command, cwd=REPO_DIR, stdout=subprocess.DEVNULL)
+    base_url = f"http://127.0.0.1:{port}"
+
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"api_server.py exited with status {process.returncode}")
+        try:
+            urllib.request.urlopen(base_url + '/api/health', timeout=1).read()
+            return process, base_url
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("api_server.py did not start in time")
+
+
+def request_paths(base_url: str, count: int, days: int, seed: int) -> List[str]:
+    """Seeded request mix over every project"""
+    with urllib.request.urlopen(base_url + '/api/hybrid/projects') as response:
+        names = [p['proposal_name'] for p in json.load(response)]
+    rng = random.Random(seed)
+    kinds, weights = zip(*REQUEST_MIX)
+    paths = []
+    for kind in rng.choices(kinds, weights, k=count):
+        approach = rng.choice(('pure', 'hybrid'))
+        if kind == 'summary':
+            paths.append(f"/api/{approach}/summary")
+            continue
+        project = f"/api/{approach}/projects/{quote(rng.choice(names), safe='')}"
+        if kind == 'project':
+            paths.append(project)
+        elif kind == 'timeline':
+            paths.append(project + '/timeline')
+        else:
+            category = rng.choice(('total', 'project', 'participant', 'auditor'))
+            paths.append(f"{project}/vested?day={rng.randrange(days) * 10}&category={category}")
+    return paths
+
+
+async def client(host: str, port: int, paths: List[str], next_index, deadline: Optional[float],
+                 accept_gzip: bool, latencies: List[float], statuses: Counter):
+    """One keep-alive connection sending requests until the work runs out"""
+    reader, writer = await asyncio.open_connection(host, port)
+    encoding = "Accept-Encoding: gzip\r\n" if accept_gzip else ""
+    try:
+        while True:
+            index = next_index()
+            if index is None or (deadline is not None and time.perf_counter() >= deadline):
+                return
+            path = paths[index % len(paths)]
+            start = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n{encoding}\r\n".encode('latin-1'))
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.lower() == 'content-length':
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            statuses[int(status_line.split()[1])] += 1
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run_load(base_url: str, paths: List[str], concurrency: int, total: Optional[int],
+                   duration: Optional[float], accept_gzip: bool) -> Dict[str, Any]:
+    url = urlsplit(base_url)
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    issued = 0
+
+    def next_index():
+        nonlocal issued
+        if total is not None and issued >= total:
+            return None
+        issued += 1
+        return issued - 1
+
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+    await asyncio.gather(*(
+        client(url.hostname, url.port, paths, next_index, deadline, accept_gzip, latencies, statuses)
+        for _ in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'seconds': elapsed,
+        'requests_per_second': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'latency_ms': {
+            'p50': percentile(latencies, 50) * 1000,
+            'p90': percentile(latencies, 90) * 1000,
+            'p99': percentile(latencies, 99) * 1000,
+            'max': latencies[-1] * 1000 if latencies else 0.0
+        },
+        'statuses': {str(status): count for status, count in sorted(statuses.items())}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the allocation API")
+    parser.add_argument('--url', help='Running server (default: start one on a free port)')
+    parser.add_argument('--csv', help='Funded projects CSV for the started server')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='Keep-alive connections')
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS, help='Total requests to send')
+    parser.add_argument('--duration', type=float, help='Run for this many seconds instead of --requests')
+    parser.add_argument('--days', type=int, default=DEFAULT_DAYS, help='Distinct days in vested queries')
+    parser.add_argument('--gzip', action='store_true', help='Send Accept-Encoding: gzip')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Write the results to this JSON file')
+    args = parser.parse_args()
+
+    process = None
+    base_url = args.url
+    if base_url is None:
+        process, base_url = start_server(args.csv)
+    try:
+        paths = request_paths(base_url, args.requests, args.days, args.seed)
+        total = None if args.duration else args.requests
+        result = asyncio.run(run_load(base_url, paths, args.concurrency, total, args.duration, args.gzip))
+        with urllib.request.urlopen(base_url + '/api/cache') as response:
+            result['server_cache'] = json.load(response)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    result.update({
+        'generated_at': datetime.now().isoformat(),
+        'url': base_url,
+        'concurrency': args.concurrency,
+        'gzip': args.gzip
+    })
+    latency = result['latency_ms']
+    print(f"{result['requests']:,} requests in {result['seconds']:.2f}s with {args.concurrency} connections")
+    print(f"  Throughput:   {result['requests_per_second']:,.0f} requests/s")
+    print(f"  Latency (ms): p50 {latency['p50']:.2f}  p90 {latency['p90']:.2f}  "
+          f"p99 {latency['p99']:.2f}  max {latency['max']:.2f}")
+    print(f"  Statuses:     {result['statuses']}")
+    print(f"  Server cache: {result['server_cache']['hit_rate'] * 100:.1f}% hit rate")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"\nResults written: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Pipeline Scaling Benchmark
+==========================
+
+Times every stage of both processors on synthetic Catalyst-shaped CSVs
+(see synthetic_data.py) and records peak memory, so scaling can be measured
+and regressions caught between runs.
+
+Stages:
+- load:            read and filter the funded rows
+- allocate:        calculate allocations (hybrid: without timelines)
+- timeline:        attach monthly timelines (hybrid only)
+- export_csv / export_json / export_columnar / export_sqlite / export_dashboard
+- typed_ingest:    parse every column of every proposal (fund_schema.py)
+
+Each (approach, size) case runs in a fresh process, so peak_rss_mib is the
+case's own high-water mark of resident memory after each stage. Results are
+written as JSON with the run's environment (git commit, Python, NumPy, CPU
+count); pass an earlier result file as --baseline to compare stage times and
+memory, exiting non-zero when anything regressed beyond --threshold.
+
+Usage:
+    python3 benchmarks/pipeline_benchmark.py --sizes 1000 100000
+    python3 benchmarks/pipeline_benchmark.py --sizes 1000000 --stages load allocate timeline export_csv
+    python3 benchmarks/pipeline_benchmark.py --baseline benchmarks/results/20261017-061500.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCHMARK_DIR)
+
+import fund_schema
+import synthetic_data
+
+APPROACHES = ('pure', 'hybrid')
+STAGES = ('load', 'allocate', 'timeline', 'export_csv', 'export_json', 'export_columnar', 'export_sqlite',
+          'export_dashboard', 'typed_ingest')
+# Dashboard export writes one file per project, and typed ingest (every column of
+# every proposal) is independent of the allocation pipeline, so both are opt-in
+DEFAULT_STAGES = STAGES[:-2]
+DEFAULT_SIZES = [1_000, 100_000]
+DEFAULT_RESULTS_DIR = os.path.join(BENCHMARK_DIR, 'results')
+
+DEFAULT_THRESHOLD = 0.10      # Relative slowdown / memory growth reported as a regression
+MIN_COMPARED_SECONDS = 0.05   # Stages faster than this are too noisy to compare
+
+
+def peak_rss_mib() -> float:
+    """Peak resident memory of this process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+def create_processor(approach: str, csv_path: str):
+    if approach == 'pure':
+        from token_distribution import TokenDistributionProcessor
+        return TokenDistributionProcessor(csv_path)
+    from token_distribution_hybrid import HybridVestingProcessor
+    return HybridVestingProcessor(csv_path)
+
+
+def stage_actions(approach: str, processor, output_dir: str) -> Dict[str, Any]:
+    """Callables per stage; each stage consumes the state left by the previous ones"""
+    state = {}
+    prefix = os.path.join(output_dir, approach)
+
+    def load():
+        state['projects'] = processor.load_funded_projects()
+
+    def allocate():
+        if approach == 'pure':
+            processor.allocations = [processor.calculate_token_allocation(p) for p in state['projects']]
+        else:
+            processor.allocations = [
+                processor.calculate_hybrid_allocation(p, include_timeline=False)
+                for p in state['projects']
+            ]
+
+    actions = {
+        'load': load,
+        'allocate': allocate,
+        'export_csv': lambda: processor.export_to_csv(prefix + '.csv'),
+        'export_json': lambda: processor.export_to_json(prefix + '.json'),
+        'export_columnar': lambda: processor.export_to_columnar(prefix + '.tdcol'),
+        'export_sqlite': lambda: processor.export_to_sqlite(prefix + '.sqlite'),
+        'export_dashboard': lambda: processor.export_dashboard_data(prefix + '-dashboard'),
+        'typed_ingest': lambda: fund_schema.read_fund_table(processor.csv_path),
+    }
+    if approach == 'hybrid':
+        actions['timeline'] = lambda: processor.attach_timelines(processor.allocations)
+    return actions
+
+
+def run_case(approach: str, csv_path: str, stages: List[str]) -> Dict[str, Any]:
+    """Run the selected stages of one approach on one CSV (in a fresh worker process)"""
+    results = []
+    with tempfile.TemporaryDirectory(prefix='tdf-bench-') as output_dir:
+        processor = create_processor(approach, csv_path)
+        actions = stage_actions(approach, processor, output_dir)
+        for stage in stages:
+            if stage not in actions:
+                continue
+            # Processors report progress on stdout; keep the benchmark table readable
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                actions[stage]()
+                elapsed = time.perf_counter() - start
+            results.append({'stage': stage, 'seconds': elapsed, 'peak_rss_mib': peak_rss_mib()})
+        funded = len(processor.allocations)
+
+    for result in results:
+        result['projects_per_second'] = funded / result['seconds'] if result['seconds'] > 0 else None
+    return {'approach': approach, 'funded_projects': funded, 'stages': results}
+
+
+def environment() -> Dict[str, Any]:
+    """Details of the machine and code a run was measured on"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'numpy': numpy_version,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def run_benchmark(sizes: List[int], stages: List[str], approaches: List[str],
+                  data_dir: str, seed: int = 0) -> Dict[str, Any]:
+    """Generate (or reuse) the synthetic inputs and benchmark every case"""
+    os.makedirs(data_dir, exist_ok=True)
+    cases = []
+    for size in sizes:
+        csv_path = synthetic_data.synthetic_csv_path(data_dir, size, seed)
+        if not os.path.exists(csv_path):
+            print(f"Generating {csv_path} ...")
+            synthetic_data.write_synthetic_csv(csv_path, size, seed)
+
+        for approach in approaches:
+            # A fresh process per case keeps peak memory and caches independent
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+                case = pool.submit(run_case, approach, csv_path, stages).result()
+            case['proposals'] = size
+            cases.append(case)
+            print_case(case)
+
+    return {
+        'metadata': {
+            'generated_at': datetime.now().isoformat(),
+            'seed': seed,
+            'sizes': sizes,
+            'stages': stages,
+            'environment': environment()
+        },
+        'cases': cases
+    }
+
+
+def print_case(case: Dict[str, Any]):
+    print(f"\n{case['approach']} - {case['proposals']:,} proposals ({case['funded_projects']:,} funded)")
+    print(f"  {'Stage':<18} {'Seconds':>10} {'Projects/s':>12} {'Peak RSS':>12}")
+    for s in case['stages']:
+        rate = f"{s['projects_per_second']:,.0f}" if s['projects_per_second'] else '-'
+        print(f"  {s['stage']:<18} {s['seconds']:>10.3f} {rate:>12} {s['peak_rss_mib']:>8.1f} MiB")
+
+
+def compare_runs(current: Dict[str, Any], baseline: Dict[str, Any],
+                 threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Stage-by-stage comparison with a baseline run.
+
+    Returns one entry per stage present in both runs, with time and memory
+    ratios (current / baseline) and a regression flag.
+    """
+    baseline_stages = {
+        (case['approach'], case['proposals'], s['stage']): s
+        for case in baseline['cases'] for s in case['stages']
+    }
+    comparison = []
+    for case in current['cases']:
+        for s in case['stages']:
+            base = baseline_stages.get((case['approach'], case['proposals'], s['stage']))
+            if base is None:
+                continue
+            time_ratio = s['seconds'] / base['seconds'] if base['seconds'] > 0 else None
+            memory_ratio = s['peak_rss_mib'] / base['peak_rss_mib'] if base['peak_rss_mib'] > 0 else None
+            slower = (
+                time_ratio is not None
+                and max(s['seconds'], base['seconds']) >= MIN_COMPARED_SECONDS
+                and time_ratio > 1 + threshold
+            )
+            larger = memory_ratio is not None and memory_ratio > 1 + threshold
+            comparison.append({
+                'approach': case['approach'],
+                'proposals': case['proposals'],
+                'stage': s['stage'],
+                'seconds': s['seconds'],
+                'baseline_seconds': base['seconds'],
+                'time_ratio': time_ratio,
+                'peak_rss_mib': s['peak_rss_mib'],
+                'baseline_peak_rss_mib': base['peak_rss_mib'],
+                'memory_ratio': memory_ratio,
+                'regression': slower or larger
+            })
+    return comparison
+
+
+def print_comparison(comparison: List[Dict[str, Any]], baseline_path: str):
+    print(f"\nComparison with {baseline_path}")
+    print(f"  {'Case':<22} {'Stage':<18} {'Time':>8} {'Memory':>8}")
+    for c in comparison:
+        case = f"{c['approach']} {c['proposals']:,}"
+        time_ratio = f"{c['time_ratio']:.2f}x" if c['time_ratio'] is not None else '-'
+        memory_ratio = f"{c['memory_ratio']:.2f}x" if c['memory_ratio'] is not None else '-'
+        flag = '  REGRESSION' if c['regression'] else ''
+        print(f"  {case:<22} {c['stage']:<18} {time_ratio:>8} {memory_ratio:>8}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark both processors on synthetic data")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Synthetic proposal counts (e.g. 1000 100000 1000000)')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(DEFAULT_STAGES))
+    parser.add_argument('--approaches', nargs='+', choices=APPROACHES, default=list(APPROACHES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--data-dir', default=synthetic_data.DEFAULT_OUTPUT_DIR,
+                        help='Where synthetic CSVs are generated and reused')
+    parser.add_argument('--output', help='Result file (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--baseline', help='Earlier result file to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Relative slowdown or memory growth counted as a regression')
+    args = parser.parse_args()
+
+    # Stages run in pipeline order whatever order they were given in
+    stages = [stage for stage in STAGES if stage in args.stages]
+    run = run_benchmark(args.sizes, stages, args.approaches, args.data_dir, args.seed)
+
+    output = args.output
+    if output is None:
+        os.makedirs(DEFAULT_RESULTS_DIR, exist_ok=True)
+        output = os.path.join(DEFAULT_RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}.json")
+
+    regressions = 0
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        comparison = compare_runs(run, baseline, args.threshold)
+        run['comparison'] = {'baseline': args.baseline, 'threshold': args.threshold, 'stages': comparison}
+        print_comparison(comparison, args.baseline)
+        regressions = sum(1 for c in comparison if c['regression'])
+
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(run, f, indent=2)
+    print(f"\nResults written: {output}")
+
+    if regressions:
+        print(f"{regressions} stage(s) regressed beyond {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
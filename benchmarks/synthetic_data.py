@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Synthetic Catalyst Data Generator
+=================================
+
+Writes synthetic proposal CSVs with exactly the columns and value formats of
+Project-Catalyst-Fund-5-Developer-Ecosystem.csv, at any size, for scaling
+benchmarks of both processors.
+
+Proposals are generated in challenges of CHALLENGE_SIZE, like a merged
+multi-challenge export. Within a challenge, proposals are ranked by vote
+result and funded in order while they meet the approval threshold and fit the
+remaining budget; FUND DEPLETION is the budget left after each row, as in the
+real file. Output is deterministic for a given seed and streamed row by row,
+so 1M proposals need no more memory than 1k.
+
+Usage:
+    python3 benchmarks/synthetic_data.py --sizes 1000 100000 1000000
+    python3 benchmarks/synthetic_data.py --sizes 5000 --output-dir /tmp/funds --seed 7
+"""
+
+import argparse
+import csv
+import os
+import random
+import string
+from typing import Iterator, List
+
+# Column order of the Fund 5 CSV
+COLUMNS = [
+    'Proposal', 'Link to ideascale', 'Overall score', 'Unique Yes', 'Unique No',
+    'Votes casted', 'YES', 'NO', 'Result', 'Meets approval threshold',
+    'REQUESTED $', 'STATUS', 'FUND DEPLETION', 'Reason for not funded status'
+]
+
+CHALLENGE_SIZE = 44           # Proposals per challenge (Fund 5 Developer Ecosystem)
+CHALLENGE_BUDGET = 600_000    # USD budget per challenge
+MIN_REQUEST_USD = 2_000
+MAX_REQUEST_USD = 150_000
+APPROVAL_FAIL_SHARE = 0.35    # Share of each challenge below the approval threshold
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+_TITLE_WORDS = [
+    'Cardano', 'Plutus', 'Marlowe', 'NFT', 'DAO', 'Wallet', 'SDK', 'API', 'Explorer',
+    'Oracle', 'Bridge', 'Toolkit', 'Library', 'Indexer', 'Testnet', 'Developer',
+    'Education', 'Governance', 'Identity', 'Metadata', 'Staking', 'DeFi', 'Haskell', 'Rust'
+]
+
+
+def format_usd(amount: int) -> str:
+    """Format like '$50,000'"""
+    return f"${amount:,}"
+
+
+def format_ada(amount: int) -> str:
+    """Format like '₳885,478,111' or '-₳8,418,503'"""
+    return f"-₳{-amount:,}" if amount < 0 else f"₳{amount:,}"
+
+
+def synthetic_challenge(rng: random.Random, first_index: int, size: int) -> List[List[str]]:
+    """Rows of one challenge, ranked by vote result with funding applied"""
+    proposals = []
+    for offset in range(size):
+        index = first_index + offset
+        unique_yes = rng.randint(100, 5000)
+        unique_no = rng.randint(50, 700)
+        yes_ada = rng.randint(15_000_000, 900_000_000)
+        no_ada = rng.randint(15_000_000, 110_000_000)
+        # Log-uniform requests rounded to $100, as requests cluster at small amounts
+        requested = int(MIN_REQUEST_USD * (MAX_REQUEST_USD / MIN_REQUEST_USD) ** rng.random()) // 100 * 100
+        title = ' '.join(rng.sample(_TITLE_WORDS, 3))
+        link_id = ''.join(rng.choices(string.ascii_letters + string.digits, k=4))
+        proposals.append({
+            'Proposal': f"{title} #{index}",
+            'Link to ideascale': f"http://app.ideascale.com/t/UM5UZB{link_id}",
+            'Overall score': f"{rng.uniform(1.5, 5.0):.2f}",
+            'Unique Yes': unique_yes,
+            'Unique No': unique_no,
+            'Votes casted': unique_yes + unique_no + rng.randint(0, 200),
+            'yes': yes_ada,
+            'no': no_ada,
+            'requested': requested
+        })
+
+    proposals.sort(key=lambda p: p['yes'] - p['no'], reverse=True)
+    approved = size - int(size * APPROVAL_FAIL_SHARE)
+    remaining = CHALLENGE_BUDGET
+
+    rows = []
+    for rank, p in enumerate(proposals):
+        meets_threshold = rank < approved
+        if not meets_threshold:
+            status, reason = 'NOT FUNDED', 'Approval Threshold'
+        elif p['requested'] > remaining:
+            status, reason = 'NOT FUNDED', 'Over Budget'
+        else:
+            status, reason = 'FUNDED', ''
+            remaining -= p['requested']
+
+        rows.append([
+            p['Proposal'], p['Link to ideascale'], p['Overall score'],
+            str(p['Unique Yes']), str(p['Unique No']), str(p['Votes casted']),
+            format_ada(p['yes']), format_ada(p['no']), format_ada(p['yes'] - p['no']),
+            'YES' if meets_threshold else 'NO',
+            format_usd(p['requested']), status, format_usd(remaining), reason
+        ])
+    return rows
+
+
+def synthetic_rows(count: int, seed: int = 0) -> Iterator[List[str]]:
+    """Yield count proposal rows (without header) in challenge order"""
+    rng = random.Random(seed)
+    generated = 0
+    while generated < count:
+        size = min(CHALLENGE_SIZE, count - generated)
+        yield from synthetic_challenge(rng, generated, size)
+        generated += size
+
+
+def write_synthetic_csv(output_path: str, count: int, seed: int = 0) -> int:
+    """Write a synthetic proposals CSV; returns the number of funded rows"""
+    funded = 0
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for row in synthetic_rows(count, seed):
+            if row[11] == 'FUNDED':
+                funded += 1
+            writer.writerow(row)
+    return funded
+
+
+def synthetic_csv_path(output_dir: str, count: int, seed: int = 0) -> str:
+    """Conventional path of a generated file"""
+    return os.path.join(output_dir, f"synthetic-{count}-seed{seed}.csv")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic Catalyst-shaped proposal CSVs")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Number of proposals per file')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for size in args.sizes:
+        path = synthetic_csv_path(args.output_dir, size, args.seed)
+        funded = write_synthetic_csv(path, size, args.seed)
+        print(f"{path}: {size:,} proposals, {funded:,} funded")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Timeline Memory Benchmark
+=========================
+
+Compares the memory held by hybrid vesting timelines stored as lists of
+MonthlyVestingSnapshot dataclasses with the columnar ColumnarTimeline
+storage, for synthetic portfolios of 10k and 100k projects.
+
+Usage:
+    python3 benchmarks/timeline_memory.py [--sizes 10000 100000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import vesting_engine
+from token_distribution_hybrid import HybridVestingProcessor
+
+
+def synthetic_projects(count: int):
+    """Funded-row dicts with varied funding amounts"""
+    return [
+        {'Proposal': f'Synthetic Project {i}', 'REQUESTED $': f'${1000 + (i * 7919) % 99000:,}'}
+        for i in range(count)
+    ]
+
+
+def dataclass_timelines(processor, projects):
+    """Reference representation: one list of snapshot dataclasses per project"""
+    timelines = []
+    for project in projects:
+        alloc = processor.calculate_hybrid_allocation(project, include_timeline=False)
+        timelines.append(processor.calculate_monthly_timeline(
+            alloc.project_tokens, alloc.participant_tokens, alloc.auditor_tokens,
+            alloc.milestone_schedule
+        ))
+    return timelines
+
+
+def template_timelines(processor, projects):
+    """Columnar storage built from the cached template (pure Python)"""
+    return [
+        processor.calculate_hybrid_allocation(project).monthly_timeline
+        for project in projects
+    ]
+
+
+def engine_timelines(processor, projects):
+    """Columnar storage viewing the NumPy portfolio arrays"""
+    allocations, _ = processor.calculate_batch(projects)
+    return [alloc.monthly_timeline for alloc in allocations]
+
+
+def measure(build, processor, projects):
+    """Return (retained bytes, seconds) for the timelines produced by build"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    timelines = build(processor, projects)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del timelines
+    return retained, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    processor = HybridVestingProcessor('')
+    representations = [
+        ('dataclass lists', dataclass_timelines),
+        ('columnar (template)', template_timelines),
+    ]
+    if vesting_engine.HAS_NUMPY:
+        representations.append(('columnar (numpy)', engine_timelines))
+
+    print(f"{'Projects':>10}  {'Representation':<22} {'Memory':>12} {'Per project':>12} {'Time':>8}")
+    print("-" * 70)
+    for size in args.sizes:
+        projects = synthetic_projects(size)
+        for name, build in representations:
+            retained, elapsed = measure(build, processor, projects)
+            print(f"{size:>10,}  {name:<22} {retained / 2**20:>9.1f} MiB "
+                  f"{retained / size:>9,.0f} B {elapsed:>7.2f}s")
+        print()
+
+
+if __name__ == '__main__':
+    main()
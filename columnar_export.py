@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Binary Columnar Export
+=====================================================
+
+Compact binary alternative to the JSON exports. Allocations, milestone
+schedules and timelines are written as typed columns that can be
+memory-mapped for reading without parsing.
+
+File layout (.tdcol):
+- 8-byte magic b'TDCOL\\x00\\x00\\x01'
+- 8-byte little-endian header length
+- UTF-8 JSON header: approach, metadata, summary and a block directory
+  (typecode, byte offset, byte length and shape of every column)
+- column blocks, each aligned to 8 bytes
+
+Numeric columns use array typecodes ('d' float64, 'q' int64, 'B' uint8).
+String columns are stored as two blocks: '<name>.offsets' (int64, n + 1)
+and '<name>.data' (UTF-8 bytes).
+
+Usage:
+    python3 columnar_export.py to-json token_allocations_hybrid_output.tdcol out.json
+"""
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Sequence
+
+MAGIC = b'TDCOL\x00\x00\x01'
+FORMAT_VERSION = 1
+ALIGNMENT = 8
+
+
+def _padding(position: int) -> int:
+    return -position % ALIGNMENT
+
+
+def _as_buffer(values, typecode: str):
+    """Return a contiguous buffer of the given typecode for a column"""
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    if hasattr(values, 'dtype') and hasattr(values, 'tobytes'):
+        # NumPy array: write its buffer directly (ascontiguous keeps zero-copy when possible)
+        import numpy as np
+        dtype = {'d': np.float64, 'q': np.int64, 'B': np.uint8}[typecode]
+        return np.ascontiguousarray(values, dtype=dtype)
+    return array(typecode, values)
+
+
+class ColumnarWriter:
+    """Collects column blocks, then writes header and data in one pass"""
+
+    def __init__(self):
+        self.blocks: List[Dict[str, Any]] = []
+
+    def add_column(self, name: str, typecode: str, values, shape: Sequence[int] = None):
+        """Add a numeric column (any iterable, array or NumPy array)"""
+        buffer = _as_buffer(values, typecode)
+        self.blocks.append({'name': name, 'typecode': typecode, 'chunks': [buffer], 'shape': shape})
+
+    def add_chunked_column(self, name: str, typecode: str, chunks: Iterable, shape: Sequence[int]):
+        """Add a numeric column given as consecutive buffers (written without concatenation)"""
+        buffers = [_as_buffer(chunk, typecode) for chunk in chunks]
+        self.blocks.append({'name': name, 'typecode': typecode, 'chunks': buffers, 'shape': shape})
+
+    def add_strings(self, name: str, values: Iterable[str]):
+        """Add a string column as offsets + UTF-8 data blocks"""
+        data = bytearray()
+        offsets = array('q', [0])
+        for value in values:
+            data += value.encode('utf-8')
+            offsets.append(len(data))
+        self.add_column(f'{name}.offsets', 'q', offsets)
+        self.add_column(f'{name}.data', 'B', data)
+
+    def write(self, path: str, header: Dict[str, Any]) -> int:
+        """Write the file; returns bytes written"""
+        directory = {}
+        offset = 0
+        for block in self.blocks:
+            nbytes = sum(memoryview(chunk).nbytes for chunk in block['chunks'])
+            count = nbytes // array(block['typecode']).itemsize
+            directory[block['name']] = {
+                'typecode': block['typecode'],
+                'offset': offset,
+                'nbytes': nbytes,
+                'shape': list(block['shape']) if block['shape'] is not None else [count]
+            }
+            offset += nbytes + _padding(nbytes)
+
+        header = dict(header, format_version=FORMAT_VERSION, byteorder=sys.byteorder, blocks=directory)
+        header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        prefix = len(MAGIC) + 8 + len(header_bytes)
+        header_bytes += b' ' * _padding(prefix)
+
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<Q', len(header_bytes)))
+            f.write(header_bytes)
+            for block in self.blocks:
+                nbytes = 0
+                for chunk in block['chunks']:
+                    nbytes += f.write(memoryview(chunk).cast('B'))
+                f.write(b'\x00' * _padding(nbytes))
+            return f.tell()
+
+
+class ColumnarReader:
+    """Memory-mapped reader; numeric columns are zero-copy memoryviews"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a columnar export file")
+        (header_len,) = struct.unpack_from('<Q', self._mmap, len(MAGIC))
+        header_start = len(MAGIC) + 8
+        self.header = json.loads(bytes(self._mmap[header_start:header_start + header_len]))
+        self._data_start = header_start + header_len
+        self._view = memoryview(self._mmap)
+
+    @property
+    def blocks(self) -> Dict[str, Dict[str, Any]]:
+        return self.header['blocks']
+
+    def column(self, name: str):
+        """A numeric column as a flat memoryview over the mapped file"""
+        block = self.blocks[name]
+        start = self._data_start + block['offset']
+        view = self._view[start:start + block['nbytes']]
+        if block['typecode'] != 'B' and self.header['byteorder'] != sys.byteorder:
+            # Foreign byte order: fall back to a swapped copy
+            values = array(block['typecode'], bytes(view))
+            values.byteswap()
+            return memoryview(values)
+        return view.cast(block['typecode'])
+
+    def shape(self, name: str) -> List[int]:
+        return self.blocks[name]['shape']
+
+    def strings(self, name: str) -> List[str]:
+        """Decode a string column"""
+        offsets = self.column(f'{name}.offsets')
+        data = self.column(f'{name}.data')
+        return [
+            bytes(data[offsets[i]:offsets[i + 1]]).decode('utf-8')
+            for i in range(len(offsets) - 1)
+        ]
+
+    def numpy(self, name: str):
+        """A numeric column as a (zero-copy) NumPy array with its stored shape"""
+        import numpy as np
+        return np.asarray(self.column(name)).reshape(self.shape(name))
+
+
+def columnar_to_json(columnar_path: str, json_path: str):
+    """Derive the regular JSON export from a columnar export file"""
+    reader = ColumnarReader(columnar_path)
+    approach = reader.header['approach']
+    if approach == 'pure':
+        from token_distribution import TokenDistributionProcessor as processor_class
+    elif approach == 'hybrid':
+        from token_distribution_hybrid import HybridVestingProcessor as processor_class
+    else:
+        raise ValueError(f"Unknown approach in {columnar_path}: {approach!r}")
+
+    processor = processor_class.from_columnar(columnar_path)
+    processor.export_to_json(json_path)
+
+
+def main():
+    """Columnar export utilities"""
+    parser = argparse.ArgumentParser(description="Columnar export utilities")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    to_json = subparsers.add_parser('to-json', help='Derive the JSON export from a .tdcol file')
+    to_json.add_argument('columnar_path')
+    to_json.add_argument('json_path')
+    args = parser.parse_args()
+
+    if args.command == 'to-json':
+        columnar_to_json(args.columnar_path, args.json_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -445,6 +445,72 @@ class ChartManager {
         });
     }
 
+    // Create treasury outflow chart (portfolio view, staggered project starts)
+    createTreasuryChart() {
+        const data = window.dataLoader.getTreasuryOutflow();
+        if (!data) return false;
+
+        this.destroyChart('chartTreasury');
+
+        const ctx = document.getElementById('chartTreasury');
+        if (!ctx) return false;
+
+        // Highlight the reported peak periods
+        const peaks = new Set(data.peaks.map(peak => peak.period));
+        const backgroundColors = data.outflow.map((_, i) =>
+            peaks.has(i) ? Utils.getApproachColor(data.approach) : '#E5E7EB'
+        );
+
+        Utils.setText('chartTreasurySubtitle',
+            `Tokens vesting per ${data.period} across ${data.project_count} projects (peaks highlighted)`);
+
+        this.charts.chartTreasury = new Chart(ctx, {
+            type: 'bar',
+            data: {
+                labels: data.labels,
+                datasets: [{
+                    label: 'Tokens Vested',
+                    data: data.outflow,
+                    backgroundColor: backgroundColors,
+                    borderColor: backgroundColors,
+                    borderWidth: 1
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                plugins: {
+                    legend: {
+                        display: false
+                    },
+                    tooltip: {
+                        callbacks: {
+                            label: function(context) {
+                                return Utils.formatNumber(context.parsed.y) + ' tokens';
+                            }
+                        }
+                    }
+                },
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        ticks: {
+                            callback: function(value) {
+                                return Utils.formatNumber(value);
+                            }
+                        }
+                    },
+                    x: {
+                        grid: {
+                            display: false
+                        }
+                    }
+                }
+            }
+        });
+        return true;
+    }
+
     // Update all charts for a project
     updateChartsForProject(projectName, approach = 'pure') {
         this.currentProject = projectName;
@@ -456,7 +522,11 @@ class ChartManager {
             Utils.hide('chartDistribution');
             Utils.hide('chartRateCard');
             Utils.hide('chartCategories');
+            if (this.createTreasuryChart()) {
+                Utils.show('chartTreasuryCard');
+            }
         } else if (approach === 'comparison') {
+            Utils.hide('chartTreasuryCard');
             // Comparison mode
             Utils.hide('chartTimeline');
             Utils.hide('chartDistribution');
@@ -467,6 +537,7 @@ class ChartManager {
         } else {
             // Regular single project view
             Utils.hide('chartComparisonCard');
+            Utils.hide('chartTreasuryCard');
             this.createTimelineChart(projectName, approach);
             this.createDistributionChart(projectName, approach);
             this.createCategoriesChart(projectName, approach);
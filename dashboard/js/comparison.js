@@ -109,8 +109,10 @@ class ComparisonManager {
 
         if (!pureData || !hybridData) return;
 
-        const difference = pureData.vested - hybridData.vested;
-        const diffPercent = pureData.percentage - hybridData.percentage;
+        // Prefer the metrics precomputed by unified_engine.py
+        const precomputed = window.dataLoader.getComparisonData(projectName, this.currentMonth);
+        const difference = precomputed ? precomputed.difference : pureData.vested - hybridData.vested;
+        const diffPercent = precomputed ? precomputed.diffPercent : pureData.percentage - hybridData.percentage;
 
         container.innerHTML = `
             <div style="margin-bottom: 1rem;">
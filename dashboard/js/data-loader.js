@@ -1,28 +1,52 @@
 /**
  * Data Loader for Token Distribution Dashboard
  * Loads and parses both pure milestone and hybrid vesting JSON data
+ *
+ * Prefers the sharded layout written by `--dashboard-dir` (data/<approach>/index.json
+ * plus one shard per project, fetched on demand) and falls back to the single
+ * data/<approach>.json files. Comparison metrics written by unified_engine.py
+ * (data/comparison/) are optional; without them the dashboard computes the
+ * comparison client-side.
  */
 
+const DATA_PATHS = {
+    pure: 'data/pure-milestone',
+    hybrid: 'data/hybrid-vesting',
+    comparison: 'data/comparison'
+};
+
+// Written by treasury_outflow.py --dashboard-dir (optional)
+const TREASURY_OUTFLOW_PATH = 'data/treasury-outflow.json';
+
 class DataLoader {
     constructor() {
         this.pureData = null;
         this.hybridData = null;
+        this.comparisonData = null;
+        this.treasuryOutflow = null;
         this.loaded = false;
+
+        // Full project records keyed by proposal name, filled as shards load
+        this.projectCache = { pure: new Map(), hybrid: new Map(), comparison: new Map() };
+        // Shard URL per proposal name (sharded layout only)
+        this.shardPaths = { pure: new Map(), hybrid: new Map(), comparison: new Map() };
+        // In-flight shard requests, so concurrent lookups share one fetch
+        this.pendingShards = new Map();
     }
 
     async loadAll() {
         try {
-            const [pureResponse, hybridResponse] = await Promise.all([
-                fetch('data/pure-milestone.json'),
-                fetch('data/hybrid-vesting.json')
+            const [pureData, hybridData, comparisonData, treasuryOutflow] = await Promise.all([
+                this.loadApproach('pure'),
+                this.loadApproach('hybrid'),
+                this.loadApproach('comparison').catch(() => null),
+                this.loadTreasuryOutflow()
             ]);
 
-            if (!pureResponse.ok || !hybridResponse.ok) {
-                throw new Error('Failed to load data files');
-            }
-
-            this.pureData = await pureResponse.json();
-            this.hybridData = await hybridResponse.json();
+            this.pureData = pureData;
+            this.hybridData = hybridData;
+            this.comparisonData = comparisonData;
+            this.treasuryOutflow = treasuryOutflow;
             this.loaded = true;
 
             return {
@@ -35,6 +59,71 @@ class DataLoader {
         }
     }
 
+    // Load the index of one approach (or the full file when no index exists)
+    async loadApproach(approach) {
+        const basePath = DATA_PATHS[approach];
+        const cache = this.projectCache[approach];
+        const shardPaths = this.shardPaths[approach];
+        cache.clear();
+        shardPaths.clear();
+
+        const indexResponse = await fetch(`${basePath}/index.json`);
+        if (indexResponse.ok) {
+            const index = await indexResponse.json();
+            index.projects.forEach(p => shardPaths.set(p.proposal_name, `${basePath}/${p.shard}`));
+            return index;
+        }
+
+        const response = await fetch(`${basePath}.json`);
+        if (!response.ok) {
+            throw new Error('Failed to load data files');
+        }
+
+        const data = await response.json();
+        data.allocations.forEach(p => cache.set(p.proposal_name, p));
+        data.projects = data.allocations;
+        return data;
+    }
+
+    // Treasury-wide outflow series (null when not exported)
+    async loadTreasuryOutflow() {
+        try {
+            const response = await fetch(TREASURY_OUTFLOW_PATH);
+            return response.ok ? await response.json() : null;
+        } catch (error) {
+            return null;
+        }
+    }
+
+    getTreasuryOutflow() {
+        return this.treasuryOutflow;
+    }
+
+    // Fetch (once) the shards of a project for both approaches and the comparison
+    async loadProject(projectName) {
+        await Promise.all(['pure', 'hybrid', 'comparison'].map(async approach => {
+            if (this.projectCache[approach].has(projectName)) return;
+
+            const shardPath = this.shardPaths[approach].get(projectName);
+            if (!shardPath) return;
+
+            if (!this.pendingShards.has(shardPath)) {
+                this.pendingShards.set(shardPath, fetch(shardPath)
+                    .then(response => {
+                        if (!response.ok) {
+                            throw new Error(`Failed to load project data: ${shardPath}`);
+                        }
+                        return response.json();
+                    })
+                    .then(project => {
+                        this.projectCache[approach].set(projectName, project);
+                    })
+                    .finally(() => this.pendingShards.delete(shardPath)));
+            }
+            await this.pendingShards.get(shardPath);
+        }));
+    }
+
     getPureData() {
         return this.pureData;
     }
@@ -43,23 +132,37 @@ class DataLoader {
         return this.hybridData;
     }
 
+    // Project lookups only see loaded projects; call loadProject() first
     getPureProject(projectName) {
-        if (!this.pureData) return null;
-        return this.pureData.allocations.find(
-            p => p.proposal_name === projectName
-        );
+        return this.projectCache.pure.get(projectName) || null;
     }
 
     getHybridProject(projectName) {
-        if (!this.hybridData) return null;
-        return this.hybridData.allocations.find(
-            p => p.proposal_name === projectName
-        );
+        return this.projectCache.hybrid.get(projectName) || null;
+    }
+
+    // Precomputed comparison at a month (null when comparison data is absent)
+    getComparisonData(projectName, month) {
+        const project = this.projectCache.comparison.get(projectName);
+        if (!project) return null;
+
+        // Months past the comparison timeline keep their final values
+        const i = Math.min(Math.max(month, 0), project.difference_tokens.length - 1);
+        return {
+            pureVested: project.pure_vested[i],
+            hybridVested: project.hybrid_vested[i],
+            purePercentage: project.pure_vested_pct[i],
+            hybridPercentage: project.hybrid_vested_pct[i],
+            difference: project.difference_tokens[i],
+            diffPercent: project.difference_pct[i],
+            metrics: project.metrics
+        };
     }
 
+    // Index rows: name, funding, tokens and token distribution of every project
     getAllProjects() {
         if (!this.pureData) return [];
-        return this.pureData.allocations;
+        return this.pureData.projects;
     }
 
     getSummary(approach = 'pure') {
@@ -229,6 +332,14 @@ class DataLoader {
         const data = approach === 'pure' ? this.pureData : this.hybridData;
         if (!data) return null;
 
+        // Sharded indexes carry the aggregate precomputed
+        if (data.portfolio) {
+            return {
+                labels: data.portfolio.labels,
+                values: data.portfolio.values
+            };
+        }
+
         if (approach === 'pure') {
             // Aggregate all projects
             const labels = ['M1', 'M2', 'M3', 'M4'];
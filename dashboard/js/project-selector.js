@@ -107,9 +107,20 @@ class ProjectSelector {
         }
     }
 
-    selectProject(projectName) {
+    async selectProject(projectName) {
         this.currentProject = projectName;
 
+        if (projectName !== 'all') {
+            try {
+                await window.dataLoader.loadProject(projectName);
+            } catch (error) {
+                console.error('Error loading project:', error);
+                return;
+            }
+            // Another project was selected while this one loaded
+            if (this.currentProject !== projectName) return;
+        }
+
         if (projectName === 'all') {
             this.showPortfolioView();
         } else {
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Sharded Dashboard Data
+=====================================================
+
+Writes dashboard data as a small index plus one shard per project, so the
+dashboard only downloads the projects a user actually opens.
+
+Layout of an approach directory (e.g. dashboard/data/hybrid-vesting/):
+- index.json:          metadata, summary, portfolio series and one light row
+                       per project (name, funding, tokens, shard path)
+- projects/<id>.json:  the full JSON export entry of one project
+
+Shard ids are a hash of the proposal name, so a project keeps its shard
+path across reruns and browsers can cache shards between exports.
+
+Files are replaced atomically (written to a temporary file, then renamed)
+and left untouched when their content did not change, so a dashboard
+reading while an export runs never sees a partial file. Shards are written
+before the index and stale shards removed after it, so the index never
+points at a missing shard.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable
+
+INDEX_FILENAME = 'index.json'
+SHARD_DIRNAME = 'projects'
+COMPACT_SEPARATORS = (',', ':')
+
+# Fields copied from each allocation into its index row
+INDEX_FIELDS = ('proposal_name', 'requested_funding_usd', 'total_tokens', 'token_distribution')
+
+# Subdirectory of the dashboard data directory per approach
+APPROACH_DIRNAMES = {
+    'pure': 'pure-milestone',
+    'hybrid': 'hybrid-vesting',
+    'comparison': 'comparison',
+}
+
+
+def shard_id(proposal_name: str) -> str:
+    """Stable shard id of a project"""
+    return hashlib.sha1(proposal_name.encode('utf-8')).hexdigest()[:16]
+
+
+@contextlib.contextmanager
+def atomic_path(path: str):
+    """Temporary path next to path, renamed over it when the block succeeds"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp)
+
+
+def write_json_atomic(path: str, payload: Any) -> bool:
+    """Write compact JSON atomically unless the file already holds it; returns True if written"""
+    data = json.dumps(payload, separators=COMPACT_SEPARATORS).encode('utf-8')
+    with contextlib.suppress(FileNotFoundError):
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    with atomic_path(path) as tmp:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+    return True
+
+
+def write_dashboard_data(
+    output_dir: str,
+    header: Dict[str, Any],
+    allocations: Iterable[Dict[str, Any]],
+    portfolio: Dict[str, Any]
+) -> int:
+    """
+    Write index.json and one shard per allocation into output_dir.
+
+    header holds the metadata and summary blocks; portfolio is the aggregate
+    series shown in the dashboard's portfolio view. Shards of projects no
+    longer in the export are removed. Returns the number of shards written.
+    """
+    shard_dir = os.path.join(output_dir, SHARD_DIRNAME)
+    os.makedirs(shard_dir, exist_ok=True)
+
+    rows = []
+    written = set()
+    for alloc in allocations:
+        filename = f"{shard_id(alloc['proposal_name'])}.json"
+        if filename in written:
+            raise ValueError(f"Duplicate proposal name in dashboard export: {alloc['proposal_name']}")
+        written.add(filename)
+        write_json_atomic(os.path.join(shard_dir, filename), alloc)
+
+        row = {key: alloc[key] for key in INDEX_FIELDS}
+        row['shard'] = f"{SHARD_DIRNAME}/{filename}"
+        rows.append(row)
+
+    index = dict(header, portfolio=portfolio, projects=rows)
+    write_json_atomic(os.path.join(output_dir, INDEX_FILENAME), index)
+
+    # Drop stale shards left by earlier exports (once the new index no longer lists them)
+    for filename in os.listdir(shard_dir):
+        if filename.endswith('.json') and filename not in written:
+            os.remove(os.path.join(shard_dir, filename))
+
+    return len(rows)
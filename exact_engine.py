@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Integer Base-Unit Engine
+=======================================================
+
+Exact counterpart of the vectorized vesting engine. Amounts are integers of
+the smallest token unit (BASE_UNITS_PER_TOKEN per token, like lovelace per
+ADA) held in int64 arrays, and every split hands out its remainder
+deterministically (largest remainder first, ties to the earlier part), so:
+
+- category allocations sum exactly to the project total
+- milestone pools plus the tail sum exactly to each category allocation
+- monthly vesting of every pool and of the tail sums exactly to its size
+- cumulative vesting plus unvested units equals each category allocation
+
+Ratios given as floats (category ratios, pool fractions) are first turned
+into small integer weights (integer_weights), so a split never goes through
+floating point. Splits divide before multiplying, so no intermediate value
+exceeds the int64 range for any total an int64 can hold.
+
+Requires NumPy for portfolio arrays; split_exact works without it.
+
+Usage:
+    from exact_engine import compute_exact_portfolio_timeline, to_base_units
+    exact = compute_exact_portfolio_timeline(units, config, (5, 3, 2))
+    assert exact.reconciles()
+    timeline = exact.to_portfolio_timeline()   # float tokens for the exports
+"""
+
+import functools
+import math
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import List, Sequence, Tuple
+
+from vesting_engine import CATEGORIES, TEMPLATE_CACHE_SIZE, PortfolioTimeline, VestingConfig, np, pool_fractions
+
+BASE_UNITS_PER_TOKEN = 10 ** 6
+MAX_WEIGHT_DENOMINATOR = 10 ** 6  # Resolution used to turn float ratios into integer weights
+MAX_TABLE_WEIGHT = 1 << 12        # Largest total weight split through a residue lookup table
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("exact_engine portfolio timelines require NumPy (pip install numpy)")
+
+
+def to_base_units(tokens: float) -> int:
+    """Round a token amount to whole base units"""
+    return round(tokens * BASE_UNITS_PER_TOKEN)
+
+
+def from_base_units(units):
+    """Token amount of base units (scalars or arrays)"""
+    return units / BASE_UNITS_PER_TOKEN
+
+
+@functools.lru_cache(maxsize=None)
+def integer_weights(ratios: Tuple[float, ...], max_denominator: int = MAX_WEIGHT_DENOMINATOR) -> Tuple[int, ...]:
+    """Smallest integer weights proportional to ratios (a tuple), e.g. (0.5, 0.3, 0.2) -> (5, 3, 2)"""
+    fractions = [Fraction(ratio).limit_denominator(max_denominator) for ratio in ratios]
+    if any(f < 0 for f in fractions) or sum(fractions) == 0:
+        raise ValueError(f"Ratios must be non-negative and not all zero: {tuple(ratios)}")
+    scale = math.lcm(*(f.denominator for f in fractions))
+    weights = [int(f * scale) for f in fractions]
+    divisor = math.gcd(*weights)
+    return tuple(w // divisor for w in weights)
+
+
+def split_exact(total: int, weights: Sequence[int]) -> List[int]:
+    """
+    Split an integer amount in proportion to integer weights.
+
+    Every part gets the floor of its share; the units left over go one each
+    to the parts with the largest remainders (ties to the earlier part), so
+    the parts always sum to total.
+    """
+    total_weight = sum(weights)
+    parts = []
+    remainders = []
+    for weight in weights:
+        share, remainder = divmod(total * weight, total_weight)
+        parts.append(share)
+        remainders.append(remainder)
+    leftover = total - sum(parts)
+    if leftover:
+        for i in sorted(range(len(weights)), key=lambda i: -remainders[i])[:leftover]:
+            parts[i] += 1
+    return parts
+
+
+def split_exact_array(totals, weights: Sequence[int]) -> 'np.ndarray':
+    """split_exact for an array of totals; returns (*totals.shape, len(weights)) int64"""
+    _require_numpy()
+    totals = np.asarray(totals, dtype=np.int64)
+    w = np.asarray(weights, dtype=np.int64)
+    total_weight = int(w.sum())
+
+    # totals = q * W + r splits as q * w plus the split of r: only r < W needs
+    # remainder handling, and totals * w is never formed
+    q, r = np.divmod(totals, total_weight)
+    if total_weight <= MAX_TABLE_WEIGHT:
+        # Small total weight: look the split of r up in a table of every residue
+        table = np.array([split_exact(residue, weights) for residue in range(total_weight)], dtype=np.int64)
+        return q[..., None] * w + table[r]
+
+    extra, remainders = np.divmod(r[..., None] * w, total_weight)
+    parts = q[..., None] * w + extra
+    leftover = totals - parts.sum(axis=-1)
+
+    # Rank of each part by remainder, largest first, ties to the earlier part
+    # (pairwise comparison beats sorting for the handful of parts used here)
+    before = np.tri(len(w), k=-1, dtype=bool).T   # before[j, i]: part j precedes part i
+    ahead = (remainders[..., :, None] > remainders[..., None, :]) | (
+        (remainders[..., :, None] == remainders[..., None, :]) & before
+    )
+    rank = ahead.sum(axis=-2)
+    return parts + (rank < leftover[..., None])
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def schedule_pieces(config: VestingConfig):
+    """
+    Integer layout of a configuration's schedule.
+
+    Returns (bucket_weights, buckets) where bucket_weights splits a category
+    allocation into the milestone pools and the tail (last), and each bucket
+    is (unlock month or None for the tail, months the bucket vests in, in
+    order). A month of -1 marks a piece that never vests (pool not unlocked,
+    before the cliff or past the timeline).
+    """
+    num_months = config.num_months
+    past_cliff = [month * config.days_per_month >= config.cliff_period_days for month in range(num_months)]
+    open_month = [month > 0 and past_cliff[month] for month in range(num_months)]
+
+    def vesting_months(start: int, count: int, unlocked: bool = True) -> Tuple[int, ...]:
+        return tuple(
+            month if unlocked and month < num_months and open_month[month] else -1
+            for month in range(start, start + count)
+        )
+
+    buckets = []
+    for _, unlock_month in config.milestones:
+        unlocked = 0 <= unlock_month < num_months and past_cliff[unlock_month]
+        months = vesting_months(max(unlock_month, 1), config.milestone_vesting_months, unlocked)
+        buckets.append((unlock_month if unlocked else -1, months))
+    buckets.append((None, vesting_months(config.milestone_period_months + 1, config.tail_vesting_months)))
+
+    bucket_weights = integer_weights(tuple(pool_fractions(config)) + (config.tail_vesting_ratio,))
+    return bucket_weights, buckets
+
+
+@dataclass
+class ExactPortfolioTimeline:
+    """Portfolio vesting timelines in integer base units"""
+    total_units: 'np.ndarray'         # (projects,)
+    category_units: 'np.ndarray'      # (projects, 3)
+    pool_units: 'np.ndarray'          # (projects, 3, milestones)
+    tail_units: 'np.ndarray'          # (projects, 3)
+    new_unlocked: 'np.ndarray'        # (projects, months, 3)
+    vested_this_month: 'np.ndarray'   # (projects, months, 3)
+    cumulative_vested: 'np.ndarray'   # (projects, months, 3)
+    unvested_units: 'np.ndarray'      # (projects, 3) never vested within the timeline
+    days_elapsed: 'np.ndarray'        # (months,)
+    past_cliff: 'np.ndarray'          # (months,) bool
+    milestones_achieved: List[List[str]]
+
+    def reconciles(self) -> bool:
+        """True when every total adds up exactly at each level"""
+        return bool(
+            (self.category_units.sum(axis=1) == self.total_units).all()
+            and (self.pool_units.sum(axis=2) + self.tail_units == self.category_units).all()
+            and (self.cumulative_vested[:, -1, :] + self.unvested_units == self.category_units).all()
+        )
+
+    def to_portfolio_timeline(self) -> PortfolioTimeline:
+        """Float token view, for the exports and the columnar timelines"""
+        tokens = from_base_units(self.category_units.astype(np.float64))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vested_pct = np.where(
+                self.category_units[:, None, :] > 0,
+                self.cumulative_vested / self.category_units[:, None, :] * 100,
+                0.0
+            )
+            total_vested_pct = np.where(
+                self.total_units[:, None] > 0,
+                self.cumulative_vested.sum(axis=2) / self.total_units[:, None] * 100,
+                0.0
+            )
+        return PortfolioTimeline(
+            category_tokens=tokens,
+            days_elapsed=self.days_elapsed,
+            past_cliff=self.past_cliff,
+            milestones_achieved=self.milestones_achieved,
+            new_unlocked=from_base_units(self.new_unlocked.astype(np.float64)),
+            vested_this_month=from_base_units(self.vested_this_month.astype(np.float64)),
+            cumulative_vested=from_base_units(self.cumulative_vested.astype(np.float64)),
+            vested_pct=vested_pct,
+            total_vested_pct=total_vested_pct
+        )
+
+
+def compute_exact_portfolio_timeline(
+    total_units: Sequence[int],
+    config: VestingConfig,
+    category_weights: Sequence[int]
+) -> ExactPortfolioTimeline:
+    """
+    Compute exact vesting timelines for all projects at once.
+
+    total_units holds each project's allocation in base units;
+    category_weights splits it into project, participant and auditor
+    allocations (see integer_weights).
+    """
+    _require_numpy()
+    totals = np.asarray(total_units, dtype=np.int64).reshape(-1)
+    num_projects = totals.shape[0]
+    num_months = config.num_months
+    num_categories = len(CATEGORIES)
+
+    category_units = split_exact_array(totals, category_weights)
+    bucket_weights, buckets = schedule_pieces(config)
+    bucket_units = split_exact_array(category_units, bucket_weights)   # (projects, 3, buckets)
+
+    new_unlocked = np.zeros((num_projects, num_months, num_categories), dtype=np.int64)
+    vested = np.zeros((num_projects, num_months, num_categories), dtype=np.int64)
+    unvested = np.zeros((num_projects, num_categories), dtype=np.int64)
+    milestones_achieved: List[List[str]] = [[] for _ in range(num_months)]
+
+    for b, (unlock_month, months) in enumerate(buckets):
+        units = bucket_units[:, :, b]
+        if unlock_month is not None and unlock_month >= 0:
+            new_unlocked[:, unlock_month, :] += units
+            milestones_achieved[unlock_month].append(config.milestones[b][0])
+        if not months:
+            unvested += units
+            continue
+        # Equal monthly pieces, the remainder going to the earliest months
+        pieces = split_exact_array(units, (1,) * len(months))
+        for i, month in enumerate(months):
+            if month < 0:
+                unvested += pieces[..., i]
+            else:
+                vested[:, month, :] += pieces[..., i]
+
+    days_elapsed = np.arange(num_months) * config.days_per_month
+    return ExactPortfolioTimeline(
+        total_units=totals,
+        category_units=category_units,
+        pool_units=bucket_units[:, :, :-1],
+        tail_units=bucket_units[:, :, -1],
+        new_unlocked=new_unlocked,
+        vested_this_month=vested,
+        cumulative_vested=np.cumsum(vested, axis=1),
+        unvested_units=unvested,
+        days_elapsed=days_elapsed,
+        past_cliff=days_elapsed >= config.cliff_period_days,
+        milestones_achieved=milestones_achieved
+    )
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Funding Selection
+================================================
+
+Re-derives which proposals are funded from the vote data instead of taking
+the CSV's STATUS as given. Proposals are ranked by their vote result
+(YES - NO ₳, ties in CSV order). Walking down the ranking, each approved
+proposal is funded if its REQUESTED $ still fits the remaining budget and
+skipped as Over Budget otherwise. FUND DEPLETION is the budget left after
+each proposal, as in the Catalyst results sheets.
+
+Approval rules:
+- recorded (default): the CSV's Meets approval threshold column
+- --min-result: YES - NO must reach this many ₳
+- --min-yes-share: YES / (YES + NO) must reach this share
+
+The ranking is sorted once, O(n log n). Every scenario is then one pass
+over the approved proposals, and the pass stops as soon as nothing left
+fits the budget. Grids of budgets x rules are therefore cheap what-if
+batches. The recorded budget (final FUND DEPLETION plus the funded
+requests) reproduces the CSV's own STATUS and FUND DEPLETION.
+
+A selection can be fed straight into the allocation processors
+(funding_overrides) without editing the CSV.
+
+Usage:
+    python3 funding_selection.py
+    python3 funding_selection.py --budget 400000 600000 800000 --min-result 0 5000000 10000000 --output scenarios.csv
+    python3 funding_selection.py --budget 800000 --allocate what_if_800k
+"""
+
+import argparse
+import bisect
+import csv
+import itertools
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from fund_schema import FundTable, read_fund_table
+
+FUNDED = 'FUNDED'
+NOT_FUNDED = 'NOT FUNDED'
+REASON_THRESHOLD = 'Approval Threshold'
+REASON_BUDGET = 'Over Budget'
+
+# Columns rewritten in each row by FundingSelection.row_overrides()
+STATUS_COLUMN = 'STATUS'
+DEPLETION_COLUMN = 'FUND DEPLETION'
+REASON_COLUMN = 'Reason for not funded status'
+
+SCENARIO_FIELDS = (
+    'budget_usd', 'rule', 'approved', 'funded', 'funded_usd', 'remaining_usd', 'newly_funded', 'dropped'
+)
+
+
+def format_usd(amount: float) -> str:
+    """Format like '$592,500' (cents only when present)"""
+    text = f"{abs(amount):,.0f}" if amount == int(amount) else f"{abs(amount):,.2f}"
+    return f"-${text}" if amount < 0 else f"${text}"
+
+
+@dataclass(frozen=True)
+class ApprovalRule:
+    """Approval threshold applied before the budget; no limits means the CSV's recorded flags"""
+    min_result_ada: Optional[float] = None    # YES - NO must reach this
+    min_yes_share: Optional[float] = None     # YES / (YES + NO) must reach this
+
+    @property
+    def recorded(self) -> bool:
+        return self.min_result_ada is None and self.min_yes_share is None
+
+    @property
+    def label(self) -> str:
+        if self.recorded:
+            return 'recorded'
+        parts = []
+        if self.min_result_ada is not None:
+            parts.append(f"result>={self.min_result_ada:,.0f}")
+        if self.min_yes_share is not None:
+            parts.append(f"yes_share>={self.min_yes_share:g}")
+        return ' '.join(parts)
+
+
+class FundingSelector:
+    """Vote ranking of a fund table, reusable across budget and rule scenarios"""
+
+    def __init__(self, table: FundTable):
+        requested = table['requested_usd']
+        missing = [table.lines[i] for i, value in enumerate(requested) if value is None]
+        if missing:
+            raise ValueError(f"{table.path}: no valid REQUESTED $ on line(s) {', '.join(map(str, missing[:10]))}")
+
+        # Vote result, falling back to YES - NO; proposals without votes rank last
+        net = [
+            result if result is not None else
+            (yes - no if yes is not None and no is not None else float('-inf'))
+            for result, yes, no in zip(table['result_ada'], table['yes_ada'], table['no_ada'])
+        ]
+        self.table = table
+        # sorted() is stable with reverse=True, so ties keep CSV order
+        self.order = sorted(range(len(table)), key=net.__getitem__, reverse=True)
+        self.net = [net[i] for i in self.order]
+        self.requested = [requested[i] for i in self.order]
+        self.yes_share = [
+            yes / (yes + no) if yes is not None and no is not None and yes + no > 0 else 0.0
+            for yes, no in ((table['yes_ada'][i], table['no_ada'][i]) for i in self.order)
+        ]
+        self.recorded_flags = [bool(table['meets_threshold'][i]) for i in self.order]
+        self.recorded_funded = set(table.funded_indices())
+        self._neg_net = [-value for value in self.net]
+        self._candidates: Dict[ApprovalRule, Tuple[List[int], List[float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @classmethod
+    def from_csv(cls, csv_path: str) -> 'FundingSelector':
+        return cls(read_fund_table(csv_path))
+
+    def recorded_budget(self) -> float:
+        """Budget implied by the CSV: final FUND DEPLETION plus every funded request"""
+        table = self.table
+        funded_usd = sum(table['requested_usd'][i] for i in self.recorded_funded)
+        depletion = [value for value in table['fund_depletion_usd'] if value is not None]
+        return funded_usd + (min(depletion) if depletion else 0.0)
+
+    def candidates(self, rule: ApprovalRule) -> Tuple[List[int], List[float]]:
+        """
+        Approved rank positions under a rule, with the suffix minimum of their requests.
+
+        The suffix minimum lets selection stop once nothing left can fit.
+        Cached per rule, so budget sweeps share it.
+        """
+        if rule in self._candidates:
+            return self._candidates[rule]
+        if rule.recorded:
+            approved = [k for k, flag in enumerate(self.recorded_flags) if flag]
+        else:
+            # Ranked by result, so a result threshold approves a prefix
+            count = len(self) if rule.min_result_ada is None else bisect.bisect_right(self._neg_net, -rule.min_result_ada)
+            approved = list(range(count))
+            if rule.min_yes_share is not None:
+                approved = [k for k in approved if self.yes_share[k] >= rule.min_yes_share]
+
+        suffix_min = [0.0] * len(approved)
+        lowest = float('inf')
+        for j in range(len(approved) - 1, -1, -1):
+            lowest = min(lowest, self.requested[approved[j]])
+            suffix_min[j] = lowest
+        self._candidates[rule] = (approved, suffix_min)
+        return approved, suffix_min
+
+    def select(self, budget: float, rule: ApprovalRule = ApprovalRule()) -> 'FundingSelection':
+        """Fund approved proposals in rank order while their requests fit the budget"""
+        approved, suffix_min = self.candidates(rule)
+        requested = self.requested
+        remaining = budget
+        funded = []
+        for j, k in enumerate(approved):
+            if remaining < suffix_min[j]:
+                break
+            if requested[k] <= remaining:
+                funded.append(k)
+                remaining -= requested[k]
+        return FundingSelection(self, budget, rule, funded, remaining)
+
+    def sweep(self, budgets: Sequence[float], rules: Sequence[ApprovalRule] = (ApprovalRule(),)
+              ) -> List['FundingSelection']:
+        """Select for every (rule, budget) combination"""
+        return [self.select(budget, rule) for rule, budget in itertools.product(rules, budgets)]
+
+
+@dataclass
+class FundingSelection:
+    """Funded set and running depletion of one budget / rule scenario"""
+    selector: FundingSelector
+    budget: float
+    rule: ApprovalRule
+    funded_ranks: List[int]       # Rank positions of funded proposals
+    remaining_usd: float
+
+    @property
+    def funded_count(self) -> int:
+        return len(self.funded_ranks)
+
+    @property
+    def funded_usd(self) -> float:
+        return self.budget - self.remaining_usd
+
+    def funded_indices(self) -> List[int]:
+        """Table row indices of the funded proposals, in CSV order"""
+        return sorted(self.selector.order[k] for k in self.funded_ranks)
+
+    def statuses(self) -> List[Tuple[str, float, str]]:
+        """(status, fund depletion, reason) of every table row, in CSV order"""
+        selector = self.selector
+        approved = set(selector.candidates(self.rule)[0])
+        funded = set(self.funded_ranks)
+        result: List[Tuple[str, float, str]] = [None] * len(selector)
+        remaining = self.budget
+        for k, index in enumerate(selector.order):
+            if k in funded:
+                remaining -= selector.requested[k]
+                result[index] = (FUNDED, remaining, '')
+            else:
+                result[index] = (NOT_FUNDED, remaining, REASON_BUDGET if k in approved else REASON_THRESHOLD)
+        return result
+
+    def row_overrides(self) -> Dict[int, Dict[str, str]]:
+        """CSV line -> recomputed status columns, for token_model.iter_funded_rows / funding_overrides"""
+        return {
+            line: {STATUS_COLUMN: status, DEPLETION_COLUMN: format_usd(depletion), REASON_COLUMN: reason}
+            for line, (status, depletion, reason) in zip(self.selector.table.lines, self.statuses())
+        }
+
+    def changes(self) -> Tuple[Set[int], Set[int]]:
+        """Table indices newly funded and no longer funded compared with the CSV's STATUS"""
+        selected = {self.selector.order[k] for k in self.funded_ranks}
+        recorded = self.selector.recorded_funded
+        return selected - recorded, recorded - selected
+
+    def summary(self) -> Dict[str, Any]:
+        newly_funded, dropped = self.changes()
+        return {
+            'budget_usd': self.budget,
+            'rule': self.rule.label,
+            'approved': len(self.selector.candidates(self.rule)[0]),
+            'funded': self.funded_count,
+            'funded_usd': self.funded_usd,
+            'remaining_usd': self.remaining_usd,
+            'newly_funded': len(newly_funded),
+            'dropped': len(dropped)
+        }
+
+
+def write_scenarios_csv(output_path: str, selections: Sequence[FundingSelection]):
+    """One summary row per scenario"""
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=SCENARIO_FIELDS)
+        writer.writeheader()
+        writer.writerows(selection.summary() for selection in selections)
+
+
+def write_proposals_csv(output_path: str, selection: FundingSelection):
+    """Recomputed status, depletion and reason of every proposal"""
+    table = selection.selector.table
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Proposal', 'REQUESTED $', 'Recorded STATUS', STATUS_COLUMN, DEPLETION_COLUMN, REASON_COLUMN])
+        for i, (status, depletion, reason) in enumerate(selection.statuses()):
+            writer.writerow([
+                table['proposal'][i], format_usd(table['requested_usd'][i]), table['status'][i],
+                status, format_usd(depletion), reason
+            ])
+
+
+def allocate_selection(csv_path: str, selection: FundingSelection, output_dir: str) -> List[str]:
+    """Run both approaches on a selection's funded set; returns the written files"""
+    from unified_engine import UnifiedProcessor
+
+    os.makedirs(output_dir, exist_ok=True)
+    processor = UnifiedProcessor(csv_path)
+    processor.funding_overrides = selection.row_overrides()
+    processor.process_all_projects()
+    outputs = [os.path.join(output_dir, name) for name in (
+        'token_allocations_output.csv', 'token_allocations_output.json',
+        'token_allocations_hybrid_output.csv', 'token_allocations_hybrid_output.json',
+        'token_allocations_comparison.json'
+    )]
+    processor.pure.export_to_csv(outputs[0])
+    processor.pure.export_to_json(outputs[1])
+    processor.hybrid.export_to_csv(outputs[2])
+    processor.hybrid.export_to_json(outputs[3])
+    processor.export_comparison_json(outputs[4])
+    return outputs
+
+
+def main():
+    """Recompute the funded set for budget and approval-rule scenarios"""
+    parser = argparse.ArgumentParser(description="Re-derive funded proposals from votes, budget and approval rule")
+    parser.add_argument('--csv', default='Project-Catalyst-Fund-5-Developer-Ecosystem.csv',
+                        help='Fund CSV with vote results')
+    parser.add_argument('--budget', type=float, nargs='+',
+                        help='Budgets in USD (default: the budget recorded in the CSV)')
+    parser.add_argument('--min-result', type=float, nargs='+', dest='min_result_ada',
+                        help='Approval: minimum YES - NO in ADA')
+    parser.add_argument('--min-yes-share', type=float, nargs='+', dest='min_yes_share',
+                        help='Approval: minimum YES / (YES + NO)')
+    parser.add_argument('--output', help='Write one summary row per scenario to this CSV')
+    parser.add_argument('--proposals-output', help='Write every proposal\'s recomputed status (one scenario)')
+    parser.add_argument('--allocate', metavar='DIR',
+                        help='Write pure, hybrid and comparison allocations of the funded set (one scenario)')
+    args = parser.parse_args()
+
+    selector = FundingSelector.from_csv(args.csv)
+    budgets = args.budget or [selector.recorded_budget()]
+    if args.min_result_ada is None and args.min_yes_share is None:
+        rules = [ApprovalRule()]
+    else:
+        rules = [ApprovalRule(min_result, min_share) for min_result, min_share in
+                 itertools.product(args.min_result_ada or [None], args.min_yes_share or [None])]
+    if (args.proposals_output or args.allocate) and len(budgets) * len(rules) > 1:
+        parser.error('--proposals-output and --allocate need a single budget and rule')
+
+    selections = selector.sweep(budgets, rules)
+    print(f"{args.csv}: {len(selector)} proposals, recorded budget {format_usd(selector.recorded_budget())}, "
+          f"{len(selections)} scenario(s)")
+    print(f"{'Budget':>14} {'Rule':<32} {'Approved':>8} {'Funded':>6} {'Funded $':>14} {'Remaining $':>12} "
+          f"{'New':>5} {'Dropped':>7}")
+    for selection in selections:
+        row = selection.summary()
+        print(f"{format_usd(row['budget_usd']):>14} {row['rule']:<32} {row['approved']:>8} {row['funded']:>6} "
+              f"{format_usd(row['funded_usd']):>14} {format_usd(row['remaining_usd']):>12} "
+              f"{row['newly_funded']:>5} {row['dropped']:>7}")
+
+    if args.output:
+        write_scenarios_csv(args.output, selections)
+        print(f"\nScenario summary written: {args.output}")
+    if args.proposals_output:
+        write_proposals_csv(args.proposals_output, selections[0])
+        print(f"Proposal statuses written: {args.proposals_output}")
+    if args.allocate:
+        outputs = allocate_selection(args.csv, selections[0], args.allocate)
+        print("Allocations of the selected funded set written:")
+        for path in outputs:
+            print(f"  - {path}")
+
+
+if __name__ == '__main__':
+    main()
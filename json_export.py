@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Streaming JSON Export
+====================================================
+
+Incremental writer for the JSON exports. The document is written as
+metadata, summary, then one allocation at a time, so the full output never
+exists in memory as a single dict or string.
+
+Output is byte-for-byte identical to json.dump(document, f, indent=2) (the
+default, read by dashboard/js/data-loader.js) or, in compact mode, to
+json.dump(document, f, separators=(',', ':')). Either form can be gzipped.
+"""
+
+import gzip
+import json
+from typing import Any, Dict, Iterable
+
+INDENT = 2
+
+
+def open_output(output_path: str, compress: bool = False):
+    """Open a text output file, gzip-compressed when requested"""
+    if compress:
+        return gzip.open(output_path, 'wt', encoding='utf-8')
+    return open(output_path, 'w', encoding='utf-8')
+
+
+def write_json_export(
+    output_path: str,
+    header: Dict[str, Any],
+    allocations: Iterable[Dict[str, Any]],
+    compact: bool = False,
+    compress: bool = False
+) -> int:
+    """
+    Stream {**header, 'allocations': [...]} to output_path.
+
+    header holds the leading keys (metadata, summary) in output order;
+    allocations is consumed lazily. Returns the number of allocations written.
+    """
+    if compact:
+        encoder = json.JSONEncoder(separators=(',', ':'))
+        key_sep, item_sep = ':', ','
+        open_doc, close_doc = '{', '}'
+        key_join = item_prefix = close_list = ''
+    else:
+        encoder = json.JSONEncoder(indent=INDENT)
+        key_sep, item_sep = ': ', ','
+        open_doc, close_doc = '{\n' + ' ' * INDENT, '\n}'
+        key_join = '\n' + ' ' * INDENT
+        item_prefix = '\n' + ' ' * (2 * INDENT)
+        close_list = '\n' + ' ' * INDENT
+
+    def encode(value, depth: int) -> str:
+        """Encode a value nested depth levels deep"""
+        text = encoder.encode(value)
+        if compact:
+            return text
+        return text.replace('\n', '\n' + ' ' * (INDENT * depth))
+
+    count = 0
+    with open_output(output_path, compress) as f:
+        f.write(open_doc)
+        for key, value in header.items():
+            f.write(json.dumps(key) + key_sep + encode(value, 1) + item_sep + key_join)
+
+        f.write(json.dumps('allocations') + key_sep + '[')
+        for alloc in allocations:
+            if count:
+                f.write(item_sep)
+            f.write(item_prefix + encode(alloc, 2))
+            count += 1
+
+        # json.dump writes an empty list as [] on one line
+        f.write((close_list if count else '') + ']' + close_doc)
+
+    return count
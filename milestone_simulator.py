@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Monte Carlo Milestone Simulator
+==============================================================
+
+The hybrid timeline assumes every milestone is hit exactly on its target
+month. This simulator samples milestone delays and failures per project and
+per trial, and reports the resulting distribution of portfolio vesting and
+treasury outflow.
+
+Model (per trial, per project):
+- each milestone is delayed by d months with probability delay_probs[d]
+  and fails with probability failure_prob (MilestoneRisk)
+- milestones keep their order: a milestone never unlocks before the previous one
+- after a failure the project is abandoned: later milestones fail as well and
+  the tail (maintenance) allocation is forfeited
+- an achieved milestone's pool vests exactly as in the deterministic model
+  (only past the cliff, never in month 0, over milestone_vesting_months)
+- forfeited tokens stay in the treasury
+
+Trials are vectorized with NumPy and split into chunks sized from the
+portfolio, each with its own child seed of the run seed, so results are
+reproducible for a seed regardless of how many worker processes evaluate
+the chunks.
+
+Requires NumPy.
+
+Usage:
+    python3 milestone_simulator.py --trials 10000 --seed 7 --output simulation.json
+"""
+
+import argparse
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from vesting_engine import VestingConfig, np, pool_fractions
+
+# Trials per chunk are sized from the portfolio (never from the worker count),
+# so a seed reproduces the same draws however many workers are used
+CHUNK_CELLS = 1 << 20  # Target (trial x project x milestone) cells per chunk
+MAX_CHUNK_TRIALS = 4096
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+DEFAULT_EXTRA_MONTHS = 12  # Horizon beyond the configured timeline for delayed pools
+
+
+@dataclass(frozen=True)
+class MilestoneRisk:
+    """Delay and failure distribution of one milestone"""
+    failure_prob: float = 0.0
+    # delay_probs[d] is the probability of a d-month delay
+    delay_probs: Tuple[float, ...] = (1.0,)
+
+    def __post_init__(self):
+        if not 0.0 <= self.failure_prob <= 1.0:
+            raise ValueError(f"failure_prob must be in [0, 1], got {self.failure_prob}")
+        if not self.delay_probs or any(p < 0 for p in self.delay_probs):
+            raise ValueError("delay_probs must be non-empty and non-negative")
+        if not math.isclose(sum(self.delay_probs), 1.0, abs_tol=1e-9):
+            raise ValueError(f"delay_probs must sum to 1, got {sum(self.delay_probs)}")
+
+    @classmethod
+    def poisson(cls, mean_delay: float, failure_prob: float = 0.0, max_delay: int = 12) -> 'MilestoneRisk':
+        """Poisson-distributed delay in months, truncated (and renormalized) at max_delay"""
+        weights = [math.exp(-mean_delay) * mean_delay ** d / math.factorial(d) for d in range(max_delay + 1)]
+        total = sum(weights)
+        return cls(failure_prob=failure_prob, delay_probs=tuple(w / total for w in weights))
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("milestone_simulator requires NumPy (pip install numpy)")
+
+
+def tail_unit_curve(config: VestingConfig, horizon: int) -> 'np.ndarray':
+    """Fraction of an allocation vesting in each month through the tail"""
+    curve = np.zeros(horizon)
+    if config.tail_vesting_months > 0:
+        rate = config.tail_vesting_ratio / config.tail_vesting_months
+        for month in range(config.milestone_period_months + 1, min(config.num_months, horizon)):
+            if month * config.days_per_month >= config.cliff_period_days:
+                curve[month] = rate
+    return curve
+
+
+def _simulate_chunk(
+    seed: 'np.random.SeedSequence',
+    trials: int,
+    tokens: 'np.ndarray',
+    config: VestingConfig,
+    risks: Tuple[MilestoneRisk, ...],
+    horizon: int
+) -> 'np.ndarray':
+    """Portfolio tokens vesting per month for one chunk of trials, (trials, horizon)"""
+    rng = np.random.default_rng(seed)
+    num_projects = tokens.shape[0]
+    num_milestones = len(config.milestones)
+    targets = np.array([month for _, month in config.milestones])
+
+    delays = np.empty((trials, num_projects, num_milestones), dtype=np.int64)
+    failed = np.empty((trials, num_projects, num_milestones), dtype=bool)
+    for k, risk in enumerate(risks):
+        # Inverse-CDF sampling of the delay distribution
+        cdf = np.cumsum(risk.delay_probs)
+        draws = np.searchsorted(cdf, rng.random((trials, num_projects)), side='right')
+        delays[:, :, k] = np.minimum(draws, len(cdf) - 1)
+        failed[:, :, k] = rng.random((trials, num_projects)) < risk.failure_prob
+
+    # Milestones keep their order, and a failure abandons the rest of the project
+    unlock = np.maximum.accumulate(targets + delays, axis=2)
+    failed = np.logical_or.accumulate(failed, axis=2)
+    vests = ~failed & (unlock >= 0) & (unlock < horizon)
+    vests &= unlock * config.days_per_month >= config.cliff_period_days
+
+    # Each vesting pool adds a constant rate over [start, end): accumulate rate changes
+    monthly_pool_fraction = np.array(pool_fractions(config)) / config.milestone_vesting_months
+    rate = tokens[None, :, None] * monthly_pool_fraction[None, None, :] * vests
+    start = np.maximum(unlock, 1)
+    end = np.minimum(start + config.milestone_vesting_months, horizon)
+    start = np.minimum(start, horizon)
+    width = horizon + 1
+    offsets = (np.arange(trials) * width)[:, None, None]
+    changes = (
+        np.bincount((offsets + start).ravel(), weights=rate.ravel(), minlength=trials * width)
+        - np.bincount((offsets + end).ravel(), weights=rate.ravel(), minlength=trials * width)
+    )
+    pool_vest = np.cumsum(changes.reshape(trials, width)[:, :horizon], axis=1)
+
+    # Tail vests only for projects that were never abandoned
+    completed_tokens = (tokens[None, :] * ~failed[:, :, -1]).sum(axis=1)
+    tail_vest = completed_tokens[:, None] * tail_unit_curve(config, horizon)[None, :]
+    return pool_vest + tail_vest
+
+
+@dataclass
+class SimulationResult:
+    """Monthly portfolio outflow of every trial"""
+    config: VestingConfig
+    total_tokens: float
+    seed: Optional[int]
+    monthly_outflow: 'np.ndarray'   # (trials, months) tokens vesting per month
+
+    @property
+    def trials(self) -> int:
+        return self.monthly_outflow.shape[0]
+
+    @property
+    def num_months(self) -> int:
+        return self.monthly_outflow.shape[1]
+
+    @property
+    def cumulative_vested(self) -> 'np.ndarray':
+        return np.cumsum(self.monthly_outflow, axis=1)
+
+    @property
+    def forfeited_tokens(self) -> 'np.ndarray':
+        """Tokens per trial that never vest within the horizon (stay in the treasury)"""
+        return np.maximum(self.total_tokens - self.monthly_outflow.sum(axis=1), 0.0)
+
+    def percentile_bands(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        """Chart-ready percentile bands of monthly outflow and cumulative vesting"""
+        monthly = np.percentile(self.monthly_outflow, percentiles, axis=0)
+        cumulative = np.percentile(self.cumulative_vested, percentiles, axis=0)
+        return {
+            'labels': [f"M{month}" for month in range(self.num_months)],
+            'percentiles': list(percentiles),
+            'monthly_outflow': {f"p{p:g}": monthly[i].tolist() for i, p in enumerate(percentiles)},
+            'cumulative_vested': {f"p{p:g}": cumulative[i].tolist() for i, p in enumerate(percentiles)},
+            'mean_monthly_outflow': self.monthly_outflow.mean(axis=0).tolist()
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Distribution summaries of per-trial portfolio metrics"""
+        peak = self.monthly_outflow.max(axis=1)
+        vested = self.monthly_outflow.sum(axis=1)
+        vested_pct = vested / self.total_tokens * 100 if self.total_tokens else np.zeros_like(vested)
+        stats = {}
+        for name, values in (('peak_monthly_outflow', peak),
+                             ('vested_pct', vested_pct),
+                             ('forfeited_tokens', self.forfeited_tokens)):
+            stats[name] = {
+                'mean': float(values.mean()),
+                **{f"p{p:g}": float(v) for p, v in zip(DEFAULT_PERCENTILES, np.percentile(values, DEFAULT_PERCENTILES))}
+            }
+        return stats
+
+    def to_dict(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        """JSON-serializable run description, summary and percentile bands"""
+        return {
+            'trials': self.trials,
+            'seed': self.seed,
+            'total_tokens': self.total_tokens,
+            'summary': self.summary(),
+            'bands': self.percentile_bands(percentiles)
+        }
+
+
+def simulate(
+    tokens: Sequence[float],
+    config: VestingConfig,
+    risks: Sequence[MilestoneRisk],
+    trials: int = 1000,
+    seed: Optional[int] = None,
+    horizon_months: Optional[int] = None,
+    workers: Optional[int] = None
+) -> SimulationResult:
+    """
+    Run a Monte Carlo simulation over a portfolio.
+
+    tokens holds each project's total token allocation; risks holds one
+    MilestoneRisk per milestone of config. horizon_months defaults to the
+    configured timeline plus DEFAULT_EXTRA_MONTHS so delayed pools still
+    vest. workers > 1 evaluates trial chunks in a process pool.
+    """
+    _require_numpy()
+    risks = tuple(risks)
+    if len(risks) != len(config.milestones):
+        raise ValueError(f"Expected {len(config.milestones)} milestone risks, got {len(risks)}")
+    if trials < 1:
+        raise ValueError("trials must be at least 1")
+
+    tokens = np.asarray(tokens, dtype=np.float64)
+    horizon = horizon_months or config.num_months + DEFAULT_EXTRA_MONTHS
+    cells_per_trial = max(tokens.shape[0] * len(risks), 1)
+    chunk_trials = max(1, min(MAX_CHUNK_TRIALS, CHUNK_CELLS // cells_per_trial))
+    chunk_sizes = [min(chunk_trials, trials - start) for start in range(0, trials, chunk_trials)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    args = [(s, n, tokens, config, risks, horizon) for s, n in zip(seeds, chunk_sizes)]
+
+    workers = min(workers or 1, len(args))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(_simulate_chunk, *zip(*args)))
+    else:
+        chunks = [_simulate_chunk(*chunk_args) for chunk_args in args]
+
+    return SimulationResult(
+        config=config,
+        total_tokens=float(tokens.sum()),
+        seed=seed,
+        monthly_outflow=np.concatenate(chunks)
+    )
+
+
+def main():
+    """Simulate milestone risk over the Fund 5 portfolio"""
+    from token_distribution_hybrid import HybridVestingProcessor, current_vesting_config
+
+    parser = argparse.ArgumentParser(description="Monte Carlo milestone-achievement simulator")
+    parser.add_argument('--csv', default='Project-Catalyst-Fund-5-Developer-Ecosystem.csv',
+                        help='Funded projects CSV')
+    parser.add_argument('--trials', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--mean-delay', type=float, nargs='+', default=[0.5],
+                        help='Mean Poisson delay (months) per milestone, or one value for all')
+    parser.add_argument('--failure-prob', type=float, nargs='+', default=[0.05],
+                        help='Failure probability per milestone, or one value for all')
+    parser.add_argument('--horizon', type=int, default=None, help='Months to simulate')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--output', help='Write summary and percentile bands to this JSON file')
+    args = parser.parse_args()
+
+    config = current_vesting_config()
+    num_milestones = len(config.milestones)
+
+    def per_milestone(values: List[float], name: str) -> List[float]:
+        if len(values) == 1:
+            return values * num_milestones
+        if len(values) != num_milestones:
+            parser.error(f"{name} takes 1 or {num_milestones} values")
+        return values
+
+    risks = [
+        MilestoneRisk.poisson(mean, failure)
+        for mean, failure in zip(per_milestone(args.mean_delay, '--mean-delay'),
+                                 per_milestone(args.failure_prob, '--failure-prob'))
+    ]
+    processor = HybridVestingProcessor(args.csv)
+    result = simulate(processor.funded_tokens(), config, risks, args.trials, args.seed,
+                      args.horizon, args.workers)
+
+    print(f"Simulated {result.trials} trials over {result.total_tokens:,.0f} tokens")
+    for name, stats in result.summary().items():
+        print(f"  {name:<22} mean {stats['mean']:>12,.1f}   p5 {stats['p5']:>12,.1f}   "
+              f"p50 {stats['p50']:>12,.1f}   p95 {stats['p95']:>12,.1f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result.to_dict(), f, indent=2)
+        print(f"Simulation results written: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Run Instrumentation
+==================================================
+
+Per-stage instrumentation for the processors, emitted as a machine-readable
+JSON run report:
+
+- stages:   wall time, CPU time and (with trace_memory) the tracemalloc peak
+            of each stage (load, calculate, timeline, summary, csv_export, ...)
+- counters: rows read, rows filtered out, projects allocated, bytes written
+            and, with an allocation cache, cache hits, misses and hit rate
+- outputs:  size of every file written
+- profile:  optional cProfile dump of the allocation stage (view it with
+            `python3 -m pstats FILE` or snakeviz)
+
+Every processor owns a RunReport; wall and CPU times are always recorded
+(they are cheap), memory tracing and profiling are opt-in.
+
+Usage:
+    python3 token_distribution_hybrid.py --run-report run.json --profile calculate.prof
+"""
+
+import cProfile
+import json
+import os
+import platform
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+class RunReport:
+    """Stage timings, memory peaks, counters and outputs of one processor run"""
+
+    def __init__(self, approach: str, trace_memory: bool = False, profile_path: Optional[str] = None):
+        self.approach = approach
+        self.trace_memory = trace_memory
+        self.profile_path = profile_path
+        self.started_at = datetime.now().isoformat()
+        self.stages: List[Dict[str, Any]] = []
+        self.counters: Dict[str, float] = {'rows_read': 0, 'rows_filtered': 0, 'bytes_written': 0}
+        self.outputs: Dict[str, int] = {}
+        self._started_tracing = False
+
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextmanager
+    def stage(self, name: str, profile: bool = False):
+        """
+        Measure the enclosed block as a named stage.
+
+        With profile=True and a profile_path set, the block also runs under
+        cProfile and the stats are dumped to profile_path.
+        """
+        profiler = cProfile.Profile() if profile and self.profile_path else None
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(self.profile_path)
+            self.stages.append({
+                'stage': name,
+                'wall_seconds': time.perf_counter() - wall_start,
+                'cpu_seconds': time.process_time() - cpu_start,
+                'peak_memory_bytes': tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+            })
+
+    def count(self, name: str, amount: int = 1):
+        """Add to a counter"""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_cache_stats(self, stats: Dict[str, Any]):
+        """Record allocation cache hits and misses (stats from AllocationCache.finish_run)"""
+        self.count('cache_hits', stats['hits'])
+        self.count('cache_misses', stats['misses'])
+        lookups = self.counters['cache_hits'] + self.counters['cache_misses']
+        self.counters['cache_hit_rate'] = self.counters['cache_hits'] / lookups if lookups else 0.0
+
+    def add_output(self, path: str):
+        """Record a written file (directories count every file inside)"""
+        if os.path.isdir(path):
+            size = sum(
+                os.path.getsize(os.path.join(root, filename))
+                for root, _, filenames in os.walk(path) for filename in filenames
+            )
+        else:
+            size = os.path.getsize(path)
+        self.outputs[path] = size
+        self.count('bytes_written', size)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'approach': self.approach,
+            'started_at': self.started_at,
+            'finished_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'trace_memory': self.trace_memory,
+            'total_wall_seconds': sum(s['wall_seconds'] for s in self.stages),
+            'total_cpu_seconds': sum(s['cpu_seconds'] for s in self.stages),
+            'stages': self.stages,
+            'counters': self.counters,
+            'outputs': self.outputs,
+            'profile': self.profile_path
+        }
+
+    def write(self, output_path: str):
+        """Write the report as JSON and stop memory tracing started by this report"""
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        print(f"Run report written: {output_path}")
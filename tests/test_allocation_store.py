@@ -0,0 +1,104 @@
+"""The SQLite store round-trips allocations and replaces a reloaded fund's rows"""
+
+import pytest
+
+import synthetic_data
+import vesting_engine
+from allocation_store import AllocationStore
+from token_distribution import TokenDistributionProcessor
+from token_distribution_hybrid import HybridVestingProcessor
+
+
+@pytest.fixture(scope='module')
+def hybrid(tmp_path_factory):
+    csv_path = str(tmp_path_factory.mktemp('store') / 'fund.csv')
+    synthetic_data.write_synthetic_csv(csv_path, 2500, seed=5)
+    processor = HybridVestingProcessor(csv_path)
+    processor.process_all_projects()
+    return processor
+
+
+def test_snapshots_match_timelines(hybrid, tmp_path):
+    db = str(tmp_path / 'store.sqlite')
+    hybrid.export_to_sqlite(db)
+    with AllocationStore(db) as store:
+        for alloc in hybrid.allocations[::700] + hybrid.allocations[-1:]:
+            rows = store.snapshots(alloc.proposal_name, category='participant')
+            assert len(rows) == len(alloc.monthly_timeline)
+            for row, snap in zip(rows, alloc.monthly_timeline):
+                assert row['category'] == 'participant'
+                assert row['cumulative_vested'] == snap.cumulative_participant_vested
+                assert row['vested_this_month'] == snap.participant_vested_this_month
+            milestones = store.milestones(alloc.proposal_name)
+            assert [m['category'] for m in milestones[:3]] == ['project', 'participant', 'auditor']
+            assert milestones[1]['tokens'] == alloc.milestone_schedule[0].pool_size_participant
+
+
+def test_reload_replaces_rows_and_keeps_other_funds(hybrid, tmp_path):
+    db = str(tmp_path / 'store.sqlite')
+    hybrid.export_to_sqlite(db, fund='a')
+    hybrid.export_to_sqlite(db, fund='b')
+    with AllocationStore(db) as store:
+        before = store.month_totals(6, fund='a')
+    hybrid.export_to_sqlite(db, fund='a')
+
+    with AllocationStore(db) as store:
+        assert [(f['fund'], f['projects']) for f in store.funds()] == [
+            ('a', len(hybrid.allocations)), ('b', len(hybrid.allocations))
+        ]
+        assert store.month_totals(6, fund='a') == before
+        assert store.month_totals(6, fund='a', category='auditor') == [
+            row for row in before if row['category'] == 'auditor'
+        ]
+        indexes = {row[0] for row in store.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {'milestones_allocation', 'snapshots_allocation', 'snapshots_month'} <= indexes
+
+
+def test_pure_milestones(tmp_path):
+    csv_path = str(tmp_path / 'fund.csv')
+    synthetic_data.write_synthetic_csv(csv_path, 200, seed=6)
+    processor = TokenDistributionProcessor(csv_path)
+    processor.process_all_projects()
+    db = str(tmp_path / 'store.sqlite')
+    processor.export_to_sqlite(db)
+
+    alloc = processor.allocations[0]
+    with AllocationStore(db) as store:
+        rows = store.milestones(alloc.proposal_name, category='auditor')
+        assert [row['tokens'] for row in rows] == [
+            release['auditor_tokens'] for release in alloc.milestone_releases.values()
+        ]
+        assert store.snapshots(alloc.proposal_name) == []
+
+
+def test_snapshot_rows_without_numpy_match(hybrid, monkeypatch):
+    if not vesting_engine.HAS_NUMPY:
+        pytest.skip('NumPy not installed')
+    batch = hybrid.allocations[:50]
+    ids = range(10, 60)
+    columnar = hybrid.store_snapshot_rows(ids, batch)
+    monkeypatch.setattr(vesting_engine, 'HAS_NUMPY', False)
+    assert sorted(hybrid.store_snapshot_rows(ids, batch)) == sorted(columnar)
+
+
+def test_old_schema_rejected(tmp_path):
+    db = str(tmp_path / 'old.sqlite')
+    with AllocationStore(db) as store:
+        store.conn.execute("PRAGMA user_version = 1")
+    with pytest.raises(ValueError, match='schema version 1'):
+        AllocationStore(db)
+
+
+def test_project_month_lookup_uses_allocation_index(hybrid, tmp_path):
+    db = str(tmp_path / 'store.sqlite')
+    hybrid.export_to_sqlite(db)
+    name = hybrid.allocations[100].proposal_name
+    with AllocationStore(db) as store:
+        statements = []
+        store.conn.set_trace_callback(statements.append)
+        assert len(store.snapshots(name, month=4)) == 3
+        store.conn.set_trace_callback(None)
+        select = next(sql for sql in statements if sql.startswith('SELECT'))
+        plan = [row[3] for row in store.conn.execute(f"EXPLAIN QUERY PLAN {select}")]
+    assert any('snapshots_allocation' in step for step in plan), plan
+    assert not any('snapshots_month' in step for step in plan), plan
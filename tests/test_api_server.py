@@ -0,0 +1,85 @@
+"""Bad requests get an error response and never desynchronize a keep-alive connection"""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+import api_server
+from conftest import REPO_DIR
+
+CSV_PATH = os.path.join(REPO_DIR, 'Project-Catalyst-Fund-5-Developer-Ecosystem.csv')
+VESTED = '/api/hybrid/projects/Testnet%20Cardanoscan%20Explorer/vested'
+
+
+@pytest.fixture(scope='module')
+def api():
+    return api_server.load_api(CSV_PATH)
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get('content-length', '0')))
+    return int(status_line.split()[1]), headers, json.loads(body) if body else None
+
+
+def exchange(api, raw: bytes, responses: int = 1):
+    """Send raw bytes on one connection and read the given number of responses"""
+    async def run():
+        server = api_server.AllocationServer(api)
+        listener = await asyncio.start_server(server.handle_connection, '127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(raw)
+        results = [await read_response(reader) for _ in range(responses)]
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return results
+    return asyncio.run(run())
+
+
+def get(path: str) -> bytes:
+    return f"GET {path} HTTP/1.1\r\nHost: test\r\n\r\n".encode('latin-1')
+
+
+@pytest.mark.parametrize('day', ['inf', 'nan', '1e400', '-inf'])
+def test_non_finite_day_is_rejected_and_connection_survives(api, day):
+    (status, _, body), (after, _, _) = exchange(api, get(f"{VESTED}?day={day}") + get('/api/health'), 2)
+    assert status == 400
+    assert 'finite' in body['error']
+    assert after == 200
+
+
+def test_route_errors_become_json_500(api, monkeypatch):
+    def broken(path, query):
+        raise RuntimeError('boom')
+    monkeypatch.setattr(api, 'route', broken)
+    (status, headers, body), = exchange(api, get('/api/health'))
+    assert status == 500
+    assert headers['connection'] == 'keep-alive'
+    assert body == {'error': 'Internal error: RuntimeError'}
+
+
+def test_request_body_is_not_parsed_as_next_request(api):
+    post = b"POST /api/health HTTP/1.1\r\nHost: test\r\nContent-Length: 5\r\n\r\nhello"
+    (status, _, _), (after, _, body) = exchange(api, post + get('/api/health'), 2)
+    assert status == 405
+    assert after == 200
+    assert body['status'] == 'ok'
+
+
+def test_too_many_header_lines_closes_connection(api):
+    headers = ''.join(f"X-Header-{i}: {i}\r\n" for i in range(api_server.MAX_HEADER_LINES + 5))
+    raw = f"GET /api/health HTTP/1.1\r\n{headers}\r\n".encode('latin-1') + get('/api/health')
+    (status, response_headers, _), = exchange(api, raw)
+    assert status == 431
+    assert response_headers['connection'] == 'close'
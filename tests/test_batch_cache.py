@@ -0,0 +1,43 @@
+"""A batch over several funds is one cache run, so compaction keeps every fund's entries"""
+
+import batch_runner
+import synthetic_data
+from allocation_cache import AllocationCache
+
+
+def write_funds(directory, count=3, size=120):
+    for seed in range(count):
+        synthetic_data.write_synthetic_csv(str(directory / f"Fund-{seed}.csv"), size, seed=seed)
+
+
+def test_batch_compact_rerun_has_no_misses(tmp_path):
+    funds = tmp_path / 'funds'
+    funds.mkdir()
+    write_funds(funds)
+    cache_path = str(tmp_path / 'cache.sqlite')
+    output_dir = str(tmp_path / 'out')
+
+    cold = batch_runner.run_batch('hybrid', [str(funds)], output_dir, workers=2, cache_path=cache_path)
+    assert cold['cache']['hits'] == 0
+    entries = cold['cache']['misses']
+    assert entries > 0
+
+    with AllocationCache(cache_path) as cache:
+        assert cache.compact() == 0
+        assert cache.stats()['entries'] == {'hybrid': entries}
+
+    warm = batch_runner.run_batch('hybrid', [str(funds)], output_dir, workers=2, cache_path=cache_path)
+    assert warm['cache'] == {'hits': entries, 'misses': 0, 'hit_rate': 1.0}
+
+
+def test_batch_run_records_combined_counts(tmp_path):
+    funds = tmp_path / 'funds'
+    funds.mkdir()
+    write_funds(funds, count=2)
+    cache_path = str(tmp_path / 'cache.sqlite')
+
+    result = batch_runner.run_batch('pure', [str(funds)], str(tmp_path / 'out'), workers=2, cache_path=cache_path)
+    with AllocationCache(cache_path) as cache:
+        runs = cache.stats()['recent_runs']
+    assert len(runs) == 1
+    assert runs[0]['misses'] == result['cache']['misses']
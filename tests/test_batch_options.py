@@ -0,0 +1,55 @@
+"""Batch mode applies per-fund options to every fund and rejects single-output ones"""
+
+import argparse
+import gzip
+import json
+import os
+
+import pytest
+
+import batch_runner
+import synthetic_data
+
+
+def make_parser():
+    parser = argparse.ArgumentParser()
+    batch_runner.add_batch_arguments(parser)
+    parser.add_argument('--exact', action='store_true')
+    parser.add_argument('--columnar', action='store_true')
+    parser.add_argument('--compact-json', action='store_true')
+    parser.add_argument('--gzip-json', action='store_true')
+    parser.add_argument('--dashboard-dir')
+    parser.add_argument('--sqlite')
+    parser.add_argument('--run-report')
+    parser.add_argument('--profile')
+    return parser
+
+
+def test_options_reach_every_fund(tmp_path):
+    funds = tmp_path / 'funds'
+    funds.mkdir()
+    for seed in range(2):
+        synthetic_data.write_synthetic_csv(str(funds / f"Fund-{seed}.csv"), 80, seed=seed)
+    parser = make_parser()
+    args = parser.parse_args([str(funds), '--exact', '--columnar', '--gzip-json'])
+    options = batch_runner.batch_options(parser, args)
+    assert options == {'exact': True, 'columnar': True, 'compact_json': False, 'gzip_json': True}
+
+    combined = batch_runner.run_batch('pure', args.inputs, str(tmp_path / 'out'), workers=2, options=options)
+    for result in combined['funds']:
+        csv_path, json_path, columnar_path = result['outputs']
+        assert json_path.endswith('.json.gz') and columnar_path.endswith('.tdcol')
+        assert all(os.path.exists(p) for p in result['outputs'])
+        with gzip.open(json_path, 'rt', encoding='utf-8') as f:
+            export = json.load(f)
+        assert 'base_units_per_token' in export['metadata']
+        assert len(export['allocations']) == result['summary']['total_projects']
+
+
+@pytest.mark.parametrize('flag', [['--run-report', 'r.json'], ['--profile', 'p.out'],
+                                  ['--dashboard-dir', 'dash'], ['--sqlite', 's.db']])
+def test_single_output_options_rejected(flag):
+    parser = make_parser()
+    args = parser.parse_args(['funds/'] + flag)
+    with pytest.raises(SystemExit):
+        batch_runner.batch_options(parser, args)
@@ -0,0 +1,46 @@
+"""expand_vesting agrees with vested_at at whole-month days"""
+
+import os
+
+import pytest
+
+import vesting_engine
+from conftest import REPO_DIR
+from token_distribution_hybrid import HybridVestingProcessor, CLIFF_PERIOD_DAYS, current_vesting_config
+
+FUND_CSV = os.path.join(REPO_DIR, 'Project-Catalyst-Fund-5-Developer-Ecosystem.csv')
+
+
+@pytest.fixture(scope='module')
+def processor():
+    processor = HybridVestingProcessor(FUND_CSV)
+    processor.process_all_projects()
+    return processor
+
+
+@pytest.mark.parametrize('category', ['total', 'project', 'participant', 'auditor'])
+@pytest.mark.parametrize('numpy', [True, False])
+def test_whole_month_days_match_vested_at(processor, category, numpy, monkeypatch):
+    if numpy and not vesting_engine.HAS_NUMPY:
+        pytest.skip('NumPy not installed')
+    if not numpy:
+        monkeypatch.setattr('vesting_events.np', None)
+        monkeypatch.setattr(vesting_engine, 'HAS_NUMPY', False)
+    config = current_vesting_config()
+    name = processor.allocations[0].proposal_name
+    days, vested = processor.expand_vesting(
+        name, category, step_days=config.days_per_month,
+        end_day=(config.total_duration_months + 2) * config.days_per_month
+    )
+    expected = [processor.vested_at(name, category, day) for day in days]
+    assert list(vested) == pytest.approx(expected, rel=1e-12, abs=1e-9)
+
+
+def test_nothing_vests_before_cliff(processor):
+    name = processor.allocations[0].proposal_name
+    days, vested = processor.expand_vesting(name, step_days=1, end_day=CLIFF_PERIOD_DAYS)
+    assert list(vested[:-1]) == [0.0] * CLIFF_PERIOD_DAYS
+    assert vested[-1] == pytest.approx(processor.vested_at(name, 'total', CLIFF_PERIOD_DAYS))
+    # Between whole months the curve is interpolated, never past the next month's value
+    _, mid = processor.expand_vesting(name, start_day=45, end_day=45)
+    assert processor.vested_at(name, 'total', 30) < mid[0] < processor.vested_at(name, 'total', 60)
@@ -0,0 +1,21 @@
+"""Padded cells parse the same as unpadded ones for every column kind"""
+
+import pytest
+
+import fund_schema
+
+
+@pytest.mark.parametrize('kind, text, expected', [
+    ('usd', ' $7,500 ', 7500.0),
+    ('ada', ' -₳32,097,728 ', -32097728.0),
+    ('count', ' 4,946 ', 4946),
+    ('decimal', ' 3.5 ', 3.5),
+    ('flag', ' YES ', True),
+    ('flag', '\tno\n', False),
+])
+def test_padded_values_parse(kind, text, expected):
+    assert fund_schema.parse_column([text], kind) == ([expected], [])
+
+
+def test_malformed_flag_still_reported():
+    assert fund_schema.parse_column(['YES', ' MAYBE '], 'flag') == ([True, None], [1])
@@ -0,0 +1,41 @@
+"""REQUESTED $ is parsed once per funded row and reused by the processors"""
+
+import pytest
+
+import synthetic_data
+import token_model
+from allocation_cache import row_key
+from fund_schema import SchemaError
+from token_distribution import TokenDistributionProcessor
+from token_distribution_hybrid import HybridVestingProcessor
+
+
+@pytest.mark.parametrize('processor_cls', [TokenDistributionProcessor, HybridVestingProcessor])
+def test_funding_parsed_once_per_row(processor_cls, tmp_path, monkeypatch):
+    csv_path = str(tmp_path / 'fund.csv')
+    funded = synthetic_data.write_synthetic_csv(csv_path, 300, seed=4)
+    calls = []
+    parse = token_model.parse_funding_amount
+    monkeypatch.setattr(token_model, 'parse_funding_amount', lambda text: calls.append(text) or parse(text))
+
+    processor = processor_cls(csv_path)
+    processor.process_all_projects()
+    assert len(processor.allocations) == funded
+    assert len(calls) == funded
+
+
+def test_funded_row_keeps_plain_row_contents(tmp_path):
+    csv_path = str(tmp_path / 'fund.csv')
+    synthetic_data.write_synthetic_csv(csv_path, 50, seed=4)
+    row = next(token_model.iter_funded_rows(csv_path))
+    plain = dict(row)
+    assert row == plain
+    assert row_key('hybrid', row, 'f') == row_key('hybrid', plain, 'f')
+    assert token_model.funding_usd(row) == token_model.funding_usd(plain) == row.funding_usd
+
+
+def test_malformed_funding_still_raises(tmp_path):
+    csv_path = tmp_path / 'fund.csv'
+    csv_path.write_text('Proposal,REQUESTED $,STATUS\nA,"$1,000",FUNDED\nB,$12x,FUNDED\n', encoding='utf-8')
+    with pytest.raises(SchemaError, match='REQUESTED'):
+        list(token_model.iter_funded_rows(str(csv_path)))
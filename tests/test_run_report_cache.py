@@ -0,0 +1,26 @@
+"""Allocation cache hits and misses are recorded in the run report counters"""
+
+import synthetic_data
+from allocation_cache import AllocationCache
+from token_distribution_hybrid import HybridVestingProcessor
+
+
+def cached_run(csv_path, cache_path):
+    processor = HybridVestingProcessor(csv_path)
+    with AllocationCache(cache_path) as cache:
+        cache.begin_run('hybrid')
+        processor.process_all_projects(cache)
+        processor.report.add_cache_stats(cache.finish_run())
+    return processor.report.to_dict()['counters']
+
+
+def test_cache_counters_in_run_report(tmp_path):
+    csv_path = str(tmp_path / 'fund.csv')
+    funded = synthetic_data.write_synthetic_csv(csv_path, 100, seed=3)
+    cache_path = str(tmp_path / 'cache.sqlite')
+
+    cold = cached_run(csv_path, cache_path)
+    assert (cold['cache_hits'], cold['cache_misses'], cold['cache_hit_rate']) == (0, funded, 0.0)
+
+    warm = cached_run(csv_path, cache_path)
+    assert (warm['cache_hits'], warm['cache_misses'], warm['cache_hit_rate']) == (funded, 0, 1.0)
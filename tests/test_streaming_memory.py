@@ -0,0 +1,48 @@
+"""stream_to_csv keeps peak memory flat as the input CSV grows"""
+
+import csv
+import tracemalloc
+
+import pytest
+
+import synthetic_data
+from token_distribution import TokenDistributionProcessor
+from token_distribution_hybrid import HybridVestingProcessor
+
+SMALL_ROWS = 5000
+LARGE_ROWS = 20000
+
+
+def streaming_peak(processor_cls, csv_path, output_path):
+    tracemalloc.start()
+    try:
+        summary = processor_cls(csv_path).stream_to_csv(output_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return summary, peak
+
+
+@pytest.fixture(scope='module')
+def inputs(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('streaming')
+    paths = {}
+    for rows in (SMALL_ROWS, LARGE_ROWS):
+        path = str(directory / f"fund-{rows}.csv")
+        funded = synthetic_data.write_synthetic_csv(path, rows, seed=rows)
+        paths[rows] = (path, funded)
+    return paths
+
+
+@pytest.mark.parametrize('processor_cls', [TokenDistributionProcessor, HybridVestingProcessor])
+def test_stream_peak_does_not_grow_with_input(processor_cls, inputs, tmp_path):
+    peaks = {}
+    for rows, (path, funded) in inputs.items():
+        output_path = str(tmp_path / f"out-{rows}.csv")
+        summary, peaks[rows] = streaming_peak(processor_cls, path, output_path)
+        assert summary.total_projects == funded
+        with open(output_path, newline='', encoding='utf-8') as f:
+            assert sum(1 for _ in csv.reader(f)) > funded
+
+    # Four times the rows must not cost noticeably more memory
+    assert peaks[LARGE_ROWS] <= peaks[SMALL_ROWS] * 1.25 + 256 * 1024
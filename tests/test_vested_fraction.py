@@ -0,0 +1,34 @@
+"""Closed-form vested fraction at extreme days"""
+
+import pytest
+
+import vesting_engine
+from token_distribution import current_release_config
+from token_distribution_hybrid import current_vesting_config
+
+CONFIGS = [current_vesting_config(), current_release_config()]
+
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_days_past_the_schedule_return_the_flat_final_value(config):
+    end = config.total_duration_months * config.days_per_month
+    final = vesting_engine.vested_fraction_at(config, end)
+    for day in (end + 1, 1e12, 1e300, float('inf')):
+        assert vesting_engine.vested_fraction_at(config, day) == final
+    assert vesting_engine.vested_fraction_at(config, float('-inf')) == 0.0
+
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_nan_day_raises(config):
+    with pytest.raises(ValueError):
+        vesting_engine.vested_fraction_at(config, float('nan'))
+
+
+@pytest.mark.skipif(not vesting_engine.HAS_NUMPY, reason='NumPy not installed')
+@pytest.mark.parametrize('config', CONFIGS)
+def test_batch_matches_scalar_at_extreme_days(config):
+    days = [-float('inf'), -1, 0, 45, 1e12, 1e300, float('inf')]
+    batch = vesting_engine.vested_fraction_batch(config, days)
+    assert list(batch) == pytest.approx([vesting_engine.vested_fraction_at(config, d) for d in days])
+    with pytest.raises(ValueError):
+        vesting_engine.vested_fraction_batch(config, [0, float('nan')])
@@ -21,12 +21,29 @@ Milestone Structure:
 Conversion Rate: 1 USD = 1 Token Unit
 """
 
+import argparse
 import csv
-import json
+import functools
+import os
+from array import array
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+import allocation_cache
+import allocation_store
+import batch_runner
+import dashboard_export
+import exact_engine
+import token_model
+import vesting_engine
+from allocation_cache import AllocationCache
+from allocation_store import AllocationStore
+from columnar_export import ColumnarWriter, ColumnarReader
+from json_export import write_json_export
+from run_report import RunReport
+from vesting_engine import VestingConfig
+
 
 # Configuration Constants
 PROJECT_TOKEN_RATIO = 0.50
@@ -35,6 +52,49 @@ AUDITOR_TOKEN_RATIO = 0.20
 MILESTONES = [0.25, 0.50, 0.75, 1.00]
 MILESTONE_NAMES = ["Milestone 1 (25%)", "Milestone 2 (50%)", "Milestone 3 (75%)", "Milestone 4 (100%)"]
 TOKEN_CONVERSION_RATE = 1.0  # 1 USD = 1 Token
+TEMPLATE_CACHE_SIZE = 128  # Distinct milestone configurations kept in memory
+
+# Columns of the binary columnar export
+ALLOCATION_FLOAT_COLUMNS = (
+    'requested_funding_usd', 'total_tokens', 'project_tokens', 'participant_tokens', 'auditor_tokens'
+)
+RELEASE_COLUMNS = ('project_tokens', 'participant_tokens', 'auditor_tokens', 'total_release')
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def milestone_release_template(
+    milestones: Tuple[float, ...],
+    milestone_names: Tuple[str, ...]
+) -> Tuple[Tuple[str, float], ...]:
+    """Unit release schedule: (milestone name, fraction of tokens released) pairs"""
+    template = []
+    for i, (milestone_pct, milestone_name) in enumerate(zip(milestones, milestone_names)):
+        if i == 0:
+            release_pct = milestone_pct
+        else:
+            release_pct = milestone_pct - milestones[i-1]
+        template.append((milestone_name, release_pct))
+    return tuple(template)
+
+
+def current_release_config() -> VestingConfig:
+    """
+    Pure milestone release as a configuration of the general schedule model.
+    
+    Milestone k unlocks at step k + 1 and is released at once (one-month
+    pools, no cliff, no tail); pool weights are the release increments. Any
+    share beyond the last milestone is a tail that never vests.
+    """
+    releases = milestone_release_template(tuple(MILESTONES), tuple(MILESTONE_NAMES))
+    return VestingConfig(
+        cliff_period_days=0,
+        milestone_period_months=len(releases),
+        tail_vesting_months=0,
+        tail_vesting_ratio=1.0 - MILESTONES[-1],
+        milestone_vesting_months=1,
+        milestones=tuple((name, step + 1) for step, (name, _) in enumerate(releases)),
+        pool_weights=tuple(release_pct for _, release_pct in releases)
+    )
 
 
 @dataclass
@@ -66,26 +126,23 @@ class TokenDistributionProcessor:
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
         self.allocations: List[TokenAllocation] = []
+        self.report = RunReport('pure')
+        # Integer base-unit arithmetic (exact_engine) instead of floats
+        self.exact = False
+        # CSV line -> recomputed STATUS etc. (funding_selection) instead of the CSV's own
+        self.funding_overrides: Optional[Dict[int, Dict[str, str]]] = None
         
     def parse_funding_amount(self, funding_str: str) -> float:
         """Parse funding amount from string format like '$7,500' or '$50,000'"""
-        try:
-            # Remove $, commas, and whitespace
-            cleaned = funding_str.replace('$', '').replace(',', '').strip()
-            return float(cleaned)
-        except (ValueError, AttributeError):
-            return 0.0
+        return token_model.parse_funding_amount(funding_str)
             
+    def iter_funded_projects(self) -> Iterator[Dict[str, Any]]:
+        """Yield funded project rows one at a time without buffering the CSV"""
+        return token_model.iter_funded_rows(self.csv_path, self.report.counters, self.funding_overrides)
+                    
     def load_funded_projects(self) -> List[Dict[str, Any]]:
         """Load and filter funded projects from CSV"""
-        funded_projects = []
-        
-        with open(self.csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Filter for FUNDED status
-                if row.get('STATUS', '').strip().upper() == 'FUNDED':
-                    funded_projects.append(row)
+        funded_projects = list(self.iter_funded_projects())
                     
         print(f"Loaded {len(funded_projects)} funded projects")
         return funded_projects
@@ -93,30 +150,29 @@ class TokenDistributionProcessor:
     def calculate_token_allocation(self, project: Dict[str, Any]) -> TokenAllocation:
         """Calculate token allocation for a single project"""
         proposal_name = project['Proposal']
-        funding_usd = self.parse_funding_amount(project['REQUESTED $'])
+        funding_usd = token_model.funding_usd(project)
         
         # Convert funding to tokens (1:1 ratio)
         total_tokens = funding_usd * TOKEN_CONVERSION_RATE
         
         # Calculate token distribution by category
-        project_tokens = total_tokens * PROJECT_TOKEN_RATIO
-        participant_tokens = total_tokens * PARTICIPANT_TOKEN_RATIO
-        auditor_tokens = total_tokens * AUDITOR_TOKEN_RATIO
-        
-        # Calculate milestone-based releases
-        milestone_releases = {}
-        for i, (milestone_pct, milestone_name) in enumerate(zip(MILESTONES, MILESTONE_NAMES)):
-            if i == 0:
-                release_pct = milestone_pct
-            else:
-                release_pct = milestone_pct - MILESTONES[i-1]
-                
-            milestone_releases[milestone_name] = {
-                'project_tokens': project_tokens * release_pct,
-                'participant_tokens': participant_tokens * release_pct,
-                'auditor_tokens': auditor_tokens * release_pct,
-                'total_release': total_tokens * release_pct
-            }
+        ratios = (PROJECT_TOKEN_RATIO, PARTICIPANT_TOKEN_RATIO, AUDITOR_TOKEN_RATIO)
+        if self.exact:
+            project_tokens, participant_tokens, auditor_tokens = token_model.split_tokens_exact(total_tokens, ratios)
+            milestone_releases = self.exact_milestone_releases((project_tokens, participant_tokens, auditor_tokens))
+        else:
+            project_tokens, participant_tokens, auditor_tokens = token_model.split_tokens(total_tokens, ratios)
+            
+            # Calculate milestone-based releases by scaling the cached unit schedule
+            template = vesting_engine.schedule_template(current_release_config())
+            milestone_releases = {}
+            for milestone_name, _, release_pct, _ in template.pools:
+                milestone_releases[milestone_name] = {
+                    'project_tokens': project_tokens * release_pct,
+                    'participant_tokens': participant_tokens * release_pct,
+                    'auditor_tokens': auditor_tokens * release_pct,
+                    'total_release': total_tokens * release_pct
+                }
             
         return TokenAllocation(
             proposal_name=proposal_name,
@@ -128,13 +184,77 @@ class TokenDistributionProcessor:
             milestone_releases=milestone_releases
         )
         
-    def process_all_projects(self):
+    def exact_milestone_releases(self, category_tokens: Tuple[float, float, float]) -> Dict[str, Dict[str, float]]:
+        """Milestone releases split exactly in base units (releases sum to each category allocation)"""
+        config = current_release_config()
+        bucket_weights, _ = exact_engine.schedule_pieces(config)
+        project, participant, auditor = (
+            exact_engine.split_exact(exact_engine.to_base_units(tokens), bucket_weights)
+            for tokens in category_tokens
+        )
+        
+        milestone_releases = {}
+        for k, (milestone_name, _) in enumerate(config.milestones):
+            milestone_releases[milestone_name] = {
+                'project_tokens': exact_engine.from_base_units(project[k]),
+                'participant_tokens': exact_engine.from_base_units(participant[k]),
+                'auditor_tokens': exact_engine.from_base_units(auditor[k]),
+                'total_release': exact_engine.from_base_units(project[k] + participant[k] + auditor[k])
+            }
+        return milestone_releases
+        
+    def iter_allocations(self) -> Iterator[TokenAllocation]:
+        """Yield token allocations as funded rows are read from the CSV"""
+        for project in self.iter_funded_projects():
+            yield self.calculate_token_allocation(project)
+            
+    def config_fingerprint(self) -> str:
+        """Hash of every setting that affects an allocation (for the allocation cache)"""
+        return allocation_cache.config_fingerprint({
+            'token_conversion_rate': TOKEN_CONVERSION_RATE,
+            'ratios': [PROJECT_TOKEN_RATIO, PARTICIPANT_TOKEN_RATIO, AUDITOR_TOKEN_RATIO],
+            'milestones': MILESTONES,
+            'milestone_names': MILESTONE_NAMES,
+            # Only present in exact mode, so float-mode entries keep their keys
+            **({'base_units_per_token': exact_engine.BASE_UNITS_PER_TOKEN} if self.exact else {})
+        })
+        
+    def allocate_with_cache(
+        self,
+        projects: List[Dict[str, Any]],
+        cache: AllocationCache
+    ) -> List[TokenAllocation]:
+        """Reuse cached allocations for unchanged rows and calculate the rest"""
+        fingerprint = self.config_fingerprint()
+        keys = [allocation_cache.row_key('pure', project, fingerprint) for project in projects]
+        cached = cache.lookup_many(keys)
+        
+        allocations = []
+        new_entries = {}
+        for key, project in zip(keys, projects):
+            if key in cached:
+                allocation = TokenAllocation(**cached[key])
+            else:
+                allocation = self.calculate_token_allocation(project)
+                new_entries[key] = asdict(allocation)
+            allocations.append(allocation)
+            
+        cache.store_many('pure', new_entries.items())
+        return allocations
+        
+    def process_all_projects(self, cache: AllocationCache = None):
         """Process all funded projects and calculate allocations"""
-        funded_projects = self.load_funded_projects()
+        with self.report.stage('load'):
+            funded_projects = self.load_funded_projects()
         
-        for project in funded_projects:
-            allocation = self.calculate_token_allocation(project)
-            self.allocations.append(allocation)
+        with self.report.stage('calculate', profile=True):
+            if cache is not None:
+                self.allocations.extend(self.allocate_with_cache(funded_projects, cache))
+            else:
+                for project in funded_projects:
+                    allocation = self.calculate_token_allocation(project)
+                    self.allocations.append(allocation)
+        self.report.count('projects_allocated', len(funded_projects))
             
         print(f"Calculated token allocations for {len(self.allocations)} projects")
         
@@ -149,8 +269,45 @@ class TokenDistributionProcessor:
             total_auditor_tokens=sum(a.auditor_tokens for a in self.allocations)
         )
         
+    def add_to_summary(self, summary: AllocationSummary, alloc: TokenAllocation):
+        """Add one allocation to a running summary (used by streaming exports)"""
+        summary.total_projects += 1
+        summary.total_funding_usd += alloc.requested_funding_usd
+        summary.total_tokens += alloc.total_tokens
+        summary.total_project_tokens += alloc.project_tokens
+        summary.total_participant_tokens += alloc.participant_tokens
+        summary.total_auditor_tokens += alloc.auditor_tokens
+        
     def export_to_csv(self, output_path: str):
         """Export token allocations to CSV format"""
+        self.write_csv(output_path, self.allocations, self.generate_summary())
+        
+    def stream_to_csv(self, output_path: str) -> AllocationSummary:
+        """
+        Ingest, allocate and export in a single streaming pass.
+        
+        Each funded row is allocated and written as soon as it is read, so
+        memory use does not grow with the size of the input CSV. Allocations
+        are not kept on the processor; the running summary is returned.
+        """
+        summary = AllocationSummary(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        
+        def counted(allocations: Iterable[TokenAllocation]) -> Iterator[TokenAllocation]:
+            for alloc in allocations:
+                self.add_to_summary(summary, alloc)
+                yield alloc
+                
+        # The summary is only read after the last allocation row is written
+        self.write_csv(output_path, counted(self.iter_allocations()), summary)
+        return summary
+        
+    def write_csv(
+        self,
+        output_path: str,
+        allocations: Iterable[TokenAllocation],
+        summary: AllocationSummary
+    ):
+        """Write allocation rows followed by the summary section"""
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             
@@ -178,7 +335,7 @@ class TokenDistributionProcessor:
             writer.writerow(header)
             
             # Write project data
-            for alloc in self.allocations:
+            for alloc in allocations:
                 row = [
                     alloc.proposal_name,
                     f"${alloc.requested_funding_usd:,.2f}",
@@ -200,7 +357,6 @@ class TokenDistributionProcessor:
                 writer.writerow(row)
                 
             # Add summary section with proper column alignment (pad all rows to 18 columns)
-            summary = self.generate_summary()
             empty_cols = [''] * 16  # 16 empty columns to make 18 total
             
             writer.writerow(['SUMMARY STATISTICS'] + empty_cols + [''])
@@ -213,43 +369,161 @@ class TokenDistributionProcessor:
             
         print(f"CSV export completed: {output_path}")
         
-    def export_to_json(self, output_path: str):
-        """Export token allocations to JSON format with hierarchical structure"""
-        output_data = {
-            'metadata': {
-                'generated_at': datetime.now().isoformat(),
-                'framework_version': '1.0',
-                'token_conversion_rate': TOKEN_CONVERSION_RATE,
-                'distribution_ratios': {
-                    'project_tokens': PROJECT_TOKEN_RATIO,
-                    'participant_tokens': PARTICIPANT_TOKEN_RATIO,
-                    'auditor_tokens': AUDITOR_TOKEN_RATIO
-                },
-                'milestones': MILESTONE_NAMES
+    def export_metadata(self) -> Dict[str, Any]:
+        """Metadata block shared by the JSON and columnar exports"""
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'framework_version': '1.0',
+            'token_conversion_rate': TOKEN_CONVERSION_RATE,
+            'distribution_ratios': {
+                'project_tokens': PROJECT_TOKEN_RATIO,
+                'participant_tokens': PARTICIPANT_TOKEN_RATIO,
+                'auditor_tokens': AUDITOR_TOKEN_RATIO
             },
-            'summary': asdict(self.generate_summary()),
-            'allocations': []
+            'milestones': MILESTONE_NAMES,
+            **({'base_units_per_token': exact_engine.BASE_UNITS_PER_TOKEN} if self.exact else {})
         }
         
-        for alloc in self.allocations:
-            alloc_dict = {
-                'proposal_name': alloc.proposal_name,
-                'requested_funding_usd': alloc.requested_funding_usd,
-                'total_tokens': alloc.total_tokens,
-                'token_distribution': {
-                    'project_tokens': alloc.project_tokens,
-                    'participant_tokens': alloc.participant_tokens,
-                    'auditor_tokens': alloc.auditor_tokens
-                },
-                'milestone_releases': alloc.milestone_releases
-            }
-            output_data['allocations'].append(alloc_dict)
-            
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
+    def allocation_to_json(self, alloc: TokenAllocation) -> Dict[str, Any]:
+        """JSON export form of one allocation"""
+        return {
+            'proposal_name': alloc.proposal_name,
+            'requested_funding_usd': alloc.requested_funding_usd,
+            'total_tokens': alloc.total_tokens,
+            'token_distribution': {
+                'project_tokens': alloc.project_tokens,
+                'participant_tokens': alloc.participant_tokens,
+                'auditor_tokens': alloc.auditor_tokens
+            },
+            'milestone_releases': alloc.milestone_releases
+        }
+        
+    def export_to_json(self, output_path: str, compact: bool = False, compress: bool = False):
+        """
+        Export token allocations to JSON format with hierarchical structure.
+        
+        Streams one allocation at a time; compact drops indentation and
+        compress writes gzip.
+        """
+        header = {
+            'metadata': self.export_metadata(),
+            'summary': asdict(self.generate_summary())
+        }
+        write_json_export(
+            output_path,
+            header,
+            (self.allocation_to_json(alloc) for alloc in self.allocations),
+            compact=compact,
+            compress=compress
+        )
             
         print(f"JSON export completed: {output_path}")
         
+    def portfolio_series(self) -> Dict[str, Any]:
+        """Cumulative tokens released across the portfolio after each milestone"""
+        values = []
+        cumulative = 0.0
+        for name in MILESTONE_NAMES:
+            cumulative += sum(alloc.milestone_releases[name]['total_release'] for alloc in self.allocations)
+            values.append(cumulative)
+        return {'labels': [f"M{i + 1}" for i in range(len(MILESTONE_NAMES))], 'values': values}
+        
+    def export_dashboard_data(self, output_dir: str):
+        """Export sharded dashboard data (index plus one file per project)"""
+        header = {
+            'metadata': self.export_metadata(),
+            'summary': asdict(self.generate_summary())
+        }
+        count = dashboard_export.write_dashboard_data(
+            output_dir,
+            header,
+            (self.allocation_to_json(alloc) for alloc in self.allocations),
+            self.portfolio_series()
+        )
+        print(f"Dashboard data exported: {output_dir} ({count} project shards)")
+        
+    def export_to_columnar(self, output_path: str):
+        """Export token allocations and milestone releases as typed binary columns"""
+        allocations = self.allocations
+        writer = ColumnarWriter()
+        
+        writer.add_strings('proposal_name', (a.proposal_name for a in allocations))
+        for name in ALLOCATION_FLOAT_COLUMNS:
+            writer.add_column(name, 'd', [getattr(a, name) for a in allocations])
+            
+        # Milestone releases: one row per (project, milestone), offsets per project
+        offsets = array('q', [0])
+        releases = []
+        for alloc in allocations:
+            releases.extend(alloc.milestone_releases.items())
+            offsets.append(len(releases))
+        writer.add_column('milestone.offsets', 'q', offsets)
+        writer.add_strings('milestone.milestone_name', (name for name, _ in releases))
+        for name in RELEASE_COLUMNS:
+            writer.add_column(f'milestone.{name}', 'd', [release[name] for _, release in releases])
+            
+        writer.write(output_path, {
+            'approach': 'pure',
+            'metadata': self.export_metadata(),
+            'summary': asdict(self.generate_summary())
+        })
+        print(f"Columnar export completed: {output_path}")
+        
+    def store_batches(self, first_id: int) -> Iterator[allocation_store.StoreBatch]:
+        """Allocation and milestone release rows for the SQLite store, one batch at a time (no timeline)"""
+        categories = vesting_engine.CATEGORIES
+        next_id = first_id
+        for batch in allocation_store.batches(self.allocations):
+            ids = range(next_id, next_id + len(batch))
+            next_id += len(batch)
+            allocation_rows = [
+                (allocation_id, a.proposal_name, a.requested_funding_usd, a.total_tokens,
+                 a.project_tokens, a.participant_tokens, a.auditor_tokens)
+                for allocation_id, a in zip(ids, batch)
+            ]
+            milestone_rows = [
+                (allocation_id, k, name, c, None, None, release[f'{category}_tokens'])
+                for allocation_id, a in zip(ids, batch)
+                for k, (name, release) in enumerate(a.milestone_releases.items())
+                for c, category in enumerate(categories)
+            ]
+            yield allocation_rows, milestone_rows, []
+        
+    def export_to_sqlite(self, output_path: str, fund: str = None):
+        """Load allocations and milestone releases into the SQLite store"""
+        fund = fund or allocation_store.fund_name(self.csv_path)
+        with AllocationStore(output_path) as store:
+            counts = store.load(
+                fund, 'pure', self.export_metadata(), self.store_batches
+            )
+        print(f"SQLite export completed: {output_path} ({fund}: {counts['allocations']} projects)")
+        
+    @classmethod
+    def from_columnar(cls, path: str) -> 'TokenDistributionProcessor':
+        """Load allocations from a (memory-mapped) columnar export"""
+        reader = ColumnarReader(path)
+        if reader.header.get('approach') != 'pure':
+            raise ValueError(f"{path} is not a pure milestone export")
+        processor = cls(path)
+        
+        names = reader.strings('proposal_name')
+        floats = {name: reader.column(name) for name in ALLOCATION_FLOAT_COLUMNS}
+        offsets = reader.column('milestone.offsets')
+        milestone_names = reader.strings('milestone.milestone_name')
+        releases = {name: reader.column(f'milestone.{name}') for name in RELEASE_COLUMNS}
+        
+        for i, name in enumerate(names):
+            processor.allocations.append(TokenAllocation(
+                proposal_name=name,
+                **{field_name: floats[field_name][i] for field_name in ALLOCATION_FLOAT_COLUMNS},
+                milestone_releases={
+                    milestone_names[j]: {column: releases[column][j] for column in RELEASE_COLUMNS}
+                    for j in range(offsets[i], offsets[i + 1])
+                }
+            ))
+            
+        return processor
+        
     def print_summary(self):
         """Print summary statistics to console"""
         summary = self.generate_summary()
@@ -269,27 +543,112 @@ class TokenDistributionProcessor:
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Token Distribution Framework Prototype")
+    batch_runner.add_batch_arguments(parser)
+    parser.add_argument('--cache', help='Allocation cache file; reruns only recompute changed rows')
+    parser.add_argument('--columnar', action='store_true',
+                        help='Also write the binary columnar export (.tdcol)')
+    parser.add_argument('--compact-json', action='store_true',
+                        help='Write the JSON export without indentation')
+    parser.add_argument('--gzip-json', action='store_true',
+                        help='Gzip the JSON export (.json.gz)')
+    parser.add_argument('--dashboard-dir',
+                        help='Also write sharded dashboard data under this directory (e.g. dashboard/data)')
+    parser.add_argument('--sqlite',
+                        help='Also load allocations into this indexed SQLite store (see allocation_store.py)')
+    parser.add_argument('--exact', action='store_true',
+                        help='Use exact integer base-unit arithmetic (totals reconcile to the unit)')
+    parser.add_argument('--run-report',
+                        help='Write per-stage timings, memory peaks and counters to this JSON file')
+    parser.add_argument('--profile',
+                        help='Dump cProfile stats of the allocation stage to this file')
+    parser.add_argument('--stream', action='store_true',
+                        help='Write only the CSV export in one streaming pass (flat memory for large inputs)')
+    args = parser.parse_args()
+    if args.stream and (args.inputs or args.cache or args.columnar or args.compact_json
+                        or args.gzip_json or args.dashboard_dir or args.sqlite):
+        parser.error('--stream writes only the CSV export; it cannot be combined with '
+                     'batch inputs, --cache or the JSON/columnar/dashboard/sqlite exports')
+    
+    if args.inputs:
+        # Batch mode: one worker process per fund CSV
+        options = batch_runner.batch_options(parser, args)
+        batch_runner.run_batch('pure', args.inputs, args.output_dir, args.workers, args.cache, options)
+        return
+    
     print("Token Distribution Framework Prototype")
     print("Processing Catalyst Fund 5 Developer Ecosystem Data\n")
     
     # Initialize processor
     csv_path = 'Project-Catalyst-Fund-5-Developer-Ecosystem.csv'
     processor = TokenDistributionProcessor(csv_path)
+    processor.exact = args.exact
+    processor.report = RunReport('pure', trace_memory=bool(args.run_report), profile_path=args.profile)
+    report = processor.report
+    
+    if args.stream:
+        # Allocations are written as rows are read and never held in memory
+        with report.stage('stream_csv'):
+            summary = processor.stream_to_csv('token_allocations_output.csv')
+        report.add_output('token_allocations_output.csv')
+        if args.run_report:
+            report.write(args.run_report)
+        print(f"Streamed {summary.total_projects} projects "
+              f"(${summary.total_funding_usd:,.2f}, {summary.total_tokens:,.2f} tokens)")
+        print("\nProcessing complete!")
+        print("Generated files:")
+        print("  - token_allocations_output.csv")
+        return
     
-    # Process projects
-    processor.process_all_projects()
+    # Process projects (reusing cached allocations when a cache is given)
+    if args.cache:
+        with AllocationCache(args.cache) as cache:
+            cache.begin_run('pure')
+            processor.process_all_projects(cache)
+            cache_stats = cache.finish_run()
+            allocation_cache.print_cache_report(cache_stats)
+            report.add_cache_stats(cache_stats)
+    else:
+        processor.process_all_projects()
     
     # Print summary
-    processor.print_summary()
+    with report.stage('summary'):
+        processor.print_summary()
     
     # Export results
-    processor.export_to_csv('token_allocations_output.csv')
-    processor.export_to_json('token_allocations_output.json')
+    with report.stage('csv_export'):
+        processor.export_to_csv('token_allocations_output.csv')
+    report.add_output('token_allocations_output.csv')
+    json_path = 'token_allocations_output.json' + ('.gz' if args.gzip_json else '')
+    with report.stage('json_export'):
+        processor.export_to_json(json_path, compact=args.compact_json, compress=args.gzip_json)
+    report.add_output(json_path)
+    if args.columnar:
+        with report.stage('columnar_export'):
+            processor.export_to_columnar('token_allocations_output.tdcol')
+        report.add_output('token_allocations_output.tdcol')
+    if args.dashboard_dir:
+        dashboard_dir = os.path.join(args.dashboard_dir, dashboard_export.APPROACH_DIRNAMES['pure'])
+        with report.stage('dashboard_export'):
+            processor.export_dashboard_data(dashboard_dir)
+        report.add_output(dashboard_dir)
+    if args.sqlite:
+        with report.stage('sqlite_export'):
+            processor.export_to_sqlite(args.sqlite)
+        report.add_output(args.sqlite)
+    if args.run_report:
+        report.write(args.run_report)
     
     print("\nProcessing complete!")
     print("Generated files:")
     print("  - token_allocations_output.csv")
-    print("  - token_allocations_output.json")
+    print(f"  - {json_path}")
+    if args.columnar:
+        print("  - token_allocations_output.tdcol")
+    if args.dashboard_dir:
+        print(f"  - {dashboard_dir}/")
+    if args.sqlite:
+        print(f"  - {args.sqlite}")
 
 
 if __name__ == '__main__':
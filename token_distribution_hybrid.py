@@ -22,11 +22,29 @@ Hybrid Vesting Structure:
 Conversion Rate: 1 USD = 1 Token Unit
 """
 
+import argparse
 import csv
-import json
+import os
+from array import array
+from collections.abc import Sequence as SequenceABC
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Any, Tuple, Iterable, Iterator, Optional, Sequence
+from dataclasses import dataclass, asdict, field, fields
+
+import allocation_cache
+import allocation_store
+import batch_runner
+import dashboard_export
+import exact_engine
+import token_model
+import vesting_engine
+import vesting_events
+from allocation_cache import AllocationCache
+from allocation_store import AllocationStore
+from columnar_export import ColumnarWriter, ColumnarReader
+from json_export import write_json_export
+from run_report import RunReport
+from vesting_engine import VestingConfig, PortfolioTimeline
 
 
 # Configuration Constants
@@ -34,6 +52,7 @@ PROJECT_TOKEN_RATIO = 0.50
 PARTICIPANT_TOKEN_RATIO = 0.30
 AUDITOR_TOKEN_RATIO = 0.20
 TOKEN_CONVERSION_RATE = 1.0  # 1 USD = 1 Token
+STREAM_BATCH_SIZE = 1024  # Rows per vectorized batch when streaming
 
 # Hybrid Vesting Configuration
 CLIFF_PERIOD_DAYS = 30  # 1 month cliff
@@ -50,6 +69,21 @@ MILESTONES = [
     {"name": "Milestone 4 (100%)", "completion_pct": 1.00, "target_month": 6}
 ]
 
+# Integer category weights of the exact (base-unit) arithmetic, e.g. (5, 3, 2)
+CATEGORY_WEIGHTS = exact_engine.integer_weights((PROJECT_TOKEN_RATIO, PARTICIPANT_TOKEN_RATIO, AUDITOR_TOKEN_RATIO))
+
+
+def current_vesting_config() -> VestingConfig:
+    """Build a VestingConfig from the module-level vesting constants"""
+    return VestingConfig(
+        cliff_period_days=CLIFF_PERIOD_DAYS,
+        milestone_period_months=MILESTONE_PERIOD_MONTHS,
+        tail_vesting_months=TAIL_VESTING_MONTHS,
+        tail_vesting_ratio=TAIL_VESTING_RATIO,
+        milestone_vesting_months=MILESTONE_VESTING_MONTHS,
+        milestones=tuple((m["name"], m["target_month"]) for m in MILESTONES)
+    )
+
 
 @dataclass
 class MilestoneVestingSchedule:
@@ -99,6 +133,75 @@ class MonthlyVestingSnapshot:
     total_vested_pct: float
 
 
+# Scalar columns of HybridTokenAllocation in the columnar export
+ALLOCATION_FLOAT_COLUMNS = (
+    'requested_funding_usd', 'total_tokens', 'project_tokens', 'participant_tokens',
+    'auditor_tokens', 'milestone_tokens', 'tail_tokens'
+)
+ALLOCATION_INT_COLUMNS = (
+    'cliff_days', 'milestone_period_months', 'tail_vesting_months', 'total_duration_months'
+)
+SCHEDULE_FLOAT_COLUMNS = (
+    'pool_size_project', 'pool_size_participant', 'pool_size_auditor',
+    'monthly_vest_project', 'monthly_vest_participant', 'monthly_vest_auditor'
+)
+MILESTONE_SEPARATOR = '\x1f'  # Joins milestones_achieved names in the columnar export
+
+# Float columns of MonthlyVestingSnapshot, stored column by column
+TIMELINE_FIELDS = tuple(
+    f.name for f in fields(MonthlyVestingSnapshot)
+    if f.name not in ('month', 'days_elapsed', 'past_cliff', 'milestones_achieved')
+)
+# Snapshot fields per category in the SQLite store (new_unlocked, vested_this_month, cumulative_vested, vested_pct)
+STORE_SNAPSHOT_FIELDS = ('new_{}_unlocked', '{}_vested_this_month', 'cumulative_{}_vested', '{}_vested_pct')
+
+
+class ColumnarTimeline(SequenceABC):
+    """
+    Struct-of-arrays monthly timeline for one project.
+    
+    The float fields of every month are kept in one flat column-major buffer
+    (an array('d') or a NumPy view of the portfolio arrays). Per-month data
+    shared by all projects (days, cliff status, milestones) is referenced,
+    not copied. Indexing or iterating builds MonthlyVestingSnapshot rows
+    lazily, so existing callers keep working unchanged.
+    """
+    __slots__ = ('values', 'days_elapsed', 'past_cliff', 'milestones_achieved')
+    
+    def __init__(self, values, days_elapsed, past_cliff, milestones_achieved):
+        self.values = values
+        self.days_elapsed = days_elapsed
+        self.past_cliff = past_cliff
+        self.milestones_achieved = milestones_achieved
+        
+    def __len__(self) -> int:
+        return len(self.days_elapsed)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        num_months = len(self)
+        if index < 0:
+            index += num_months
+        if not 0 <= index < num_months:
+            raise IndexError('timeline index out of range')
+        
+        values = self.values
+        return MonthlyVestingSnapshot(
+            index,
+            int(self.days_elapsed[index]),
+            bool(self.past_cliff[index]),
+            list(self.milestones_achieved[index]),
+            *(float(values[f * num_months + index]) for f in range(len(TIMELINE_FIELDS)))
+        )
+    
+    def column(self, name: str):
+        """All months of one float field (a slice of the underlying buffer)"""
+        num_months = len(self)
+        f = TIMELINE_FIELDS.index(name)
+        return self.values[f * num_months:(f + 1) * num_months]
+
+
 @dataclass
 class HybridTokenAllocation:
     """Represents hybrid vesting allocation for a single project"""
@@ -122,8 +225,8 @@ class HybridTokenAllocation:
     # Milestone vesting schedule
     milestone_schedule: List[MilestoneVestingSchedule] = field(default_factory=list)
     
-    # Monthly vesting timeline
-    monthly_timeline: List[MonthlyVestingSnapshot] = field(default_factory=list)
+    # Monthly vesting timeline (a ColumnarTimeline when built by the processor)
+    monthly_timeline: Sequence[MonthlyVestingSnapshot] = field(default_factory=list)
 
 
 @dataclass
@@ -151,24 +254,37 @@ class HybridVestingProcessor:
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
         self.allocations: List[HybridTokenAllocation] = []
+        self.report = RunReport('hybrid')
+        # Integer base-unit arithmetic (exact_engine) instead of floats
+        self.exact = False
+        # CSV line -> recomputed STATUS etc. (funding_selection) instead of the CSV's own
+        self.funding_overrides: Optional[Dict[int, Dict[str, str]]] = None
+        self.portfolio_timeline: PortfolioTimeline = None
+        self._allocation_index: Dict[str, HybridTokenAllocation] = {}
+        self._indexed_count = 0
         
     def parse_funding_amount(self, funding_str: str) -> float:
         """Parse funding amount from string format like '$7,500' or '$50,000'"""
-        try:
-            cleaned = funding_str.replace('$', '').replace(',', '').strip()
-            return float(cleaned)
-        except (ValueError, AttributeError):
-            return 0.0
+        return token_model.parse_funding_amount(funding_str)
             
+    def iter_funded_projects(self) -> Iterator[Dict[str, Any]]:
+        """Yield funded project rows one at a time without buffering the CSV"""
+        return token_model.iter_funded_rows(self.csv_path, self.report.counters, self.funding_overrides)
+                    
+    def funded_tokens(self) -> List[float]:
+        """Total tokens of each funded project (no allocation or timeline work)"""
+        return [
+            token_model.funding_usd(project) * TOKEN_CONVERSION_RATE
+            for project in self.iter_funded_projects()
+        ]
+        
+    def portfolio_tokens(self) -> float:
+        """Total tokens of all funded projects"""
+        return sum(self.funded_tokens())
+        
     def load_funded_projects(self) -> List[Dict[str, Any]]:
         """Load and filter funded projects from CSV"""
-        funded_projects = []
-        
-        with open(self.csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get('STATUS', '').strip().upper() == 'FUNDED':
-                    funded_projects.append(row)
+        funded_projects = list(self.iter_funded_projects())
                     
         print(f"Loaded {len(funded_projects)} funded projects")
         return funded_projects
@@ -179,44 +295,63 @@ class HybridVestingProcessor:
         participant_tokens: float,
         auditor_tokens: float
     ) -> List[MilestoneVestingSchedule]:
-        """Calculate milestone-based vesting schedule"""
-        
-        # Calculate tokens allocated to milestone vesting (90% of total)
-        milestone_ratio = 1.0 - TAIL_VESTING_RATIO
-        milestone_project = project_tokens * milestone_ratio
-        milestone_participant = participant_tokens * milestone_ratio
-        milestone_auditor = auditor_tokens * milestone_ratio
+        """Calculate milestone-based vesting schedule by scaling the cached template"""
+        template = vesting_engine.schedule_template(current_vesting_config())
+        if self.exact:
+            return self.exact_milestone_schedule(template, (project_tokens, participant_tokens, auditor_tokens))
         
         schedule = []
-        num_milestones = len(MILESTONES)
-        
-        for i, milestone in enumerate(MILESTONES):
-            # Each milestone unlocks equal portion
-            pool_pct = 1.0 / num_milestones
-            
-            pool_project = milestone_project * pool_pct
-            pool_participant = milestone_participant * pool_pct
-            pool_auditor = milestone_auditor * pool_pct
-            
-            # Calculate monthly vesting amounts
-            monthly_project = pool_project / MILESTONE_VESTING_MONTHS
-            monthly_participant = pool_participant / MILESTONE_VESTING_MONTHS
-            monthly_auditor = pool_auditor / MILESTONE_VESTING_MONTHS
-            
+        for name, unlock_month, pool_fraction, monthly_fraction in template.pools:
             schedule.append(MilestoneVestingSchedule(
-                milestone_name=milestone["name"],
-                unlock_month=milestone["target_month"],
-                pool_size_project=pool_project,
-                pool_size_participant=pool_participant,
-                pool_size_auditor=pool_auditor,
-                vesting_months=MILESTONE_VESTING_MONTHS,
-                monthly_vest_project=monthly_project,
-                monthly_vest_participant=monthly_participant,
-                monthly_vest_auditor=monthly_auditor
+                milestone_name=name,
+                unlock_month=unlock_month,
+                pool_size_project=project_tokens * pool_fraction,
+                pool_size_participant=participant_tokens * pool_fraction,
+                pool_size_auditor=auditor_tokens * pool_fraction,
+                vesting_months=template.config.milestone_vesting_months,
+                monthly_vest_project=project_tokens * monthly_fraction,
+                monthly_vest_participant=participant_tokens * monthly_fraction,
+                monthly_vest_auditor=auditor_tokens * monthly_fraction
             ))
             
         return schedule
     
+    def exact_milestone_schedule(
+        self,
+        template: vesting_engine.ScheduleTemplate,
+        category_tokens: Tuple[float, float, float]
+    ) -> List[MilestoneVestingSchedule]:
+        """
+        Milestone schedule with pool sizes split exactly in base units.
+        
+        Pools plus the tail sum exactly to each category allocation; the
+        monthly vest fields are the average rate (early months of a pool get
+        the remainder units, see exact_engine).
+        """
+        bucket_weights, _ = exact_engine.schedule_pieces(template.config)
+        buckets = [
+            [exact_engine.from_base_units(units)
+             for units in exact_engine.split_exact(exact_engine.to_base_units(tokens), bucket_weights)]
+            for tokens in category_tokens
+        ]
+        vesting_months = template.config.milestone_vesting_months
+        
+        schedule = []
+        for k, (name, unlock_month, _, _) in enumerate(template.pools):
+            project, participant, auditor = (category[k] for category in buckets)
+            schedule.append(MilestoneVestingSchedule(
+                milestone_name=name,
+                unlock_month=unlock_month,
+                pool_size_project=project,
+                pool_size_participant=participant,
+                pool_size_auditor=auditor,
+                vesting_months=vesting_months,
+                monthly_vest_project=project / vesting_months,
+                monthly_vest_participant=participant / vesting_months,
+                monthly_vest_auditor=auditor / vesting_months
+            ))
+        return schedule
+    
     def calculate_monthly_timeline(
         self,
         project_tokens: float,
@@ -224,7 +359,7 @@ class HybridVestingProcessor:
         auditor_tokens: float,
         milestone_schedule: List[MilestoneVestingSchedule]
     ) -> List[MonthlyVestingSnapshot]:
-        """Calculate month-by-month vesting timeline"""
+        """Calculate month-by-month vesting timeline by walking an explicit milestone schedule"""
         
         total_duration = MILESTONE_PERIOD_MONTHS + TAIL_VESTING_MONTHS
         timeline = []
@@ -328,33 +463,105 @@ class HybridVestingProcessor:
             timeline.append(snapshot)
         
         return timeline
+    
+    def timeline_from_template(
+        self,
+        project_tokens: float,
+        participant_tokens: float,
+        auditor_tokens: float
+    ) -> ColumnarTimeline:
+        """Build a monthly timeline by scaling the cached unit schedule"""
+        template = vesting_engine.schedule_template(current_vesting_config())
+        total_tokens = project_tokens + participant_tokens + auditor_tokens
+        category_tokens = (project_tokens, participant_tokens, auditor_tokens)
         
-    def calculate_hybrid_allocation(self, project: Dict[str, Any]) -> HybridTokenAllocation:
+        # Columns in TIMELINE_FIELDS order: unlocked, vested, cumulative, pct, total pct
+        values = array('d')
+        for fractions in (template.unlock_fraction, template.vest_fraction, template.cumulative_fraction):
+            for tokens in category_tokens:
+                values.extend(tokens * fraction for fraction in fractions)
+        for tokens in category_tokens:
+            values.extend(fraction * 100 if tokens > 0 else 0.0 for fraction in template.cumulative_fraction)
+        values.extend(fraction * 100 if total_tokens > 0 else 0.0 for fraction in template.cumulative_fraction)
+        
+        return ColumnarTimeline(
+            values, template.days_elapsed, template.past_cliff, template.milestones_achieved
+        )
+    
+    def calculate_portfolio_timeline(
+        self,
+        allocations: List[HybridTokenAllocation]
+    ) -> PortfolioTimeline:
+        """Calculate vesting timelines for all allocations at once (NumPy engine)"""
+        if self.exact:
+            total_units = [exact_engine.to_base_units(a.total_tokens) for a in allocations]
+            exact = exact_engine.compute_exact_portfolio_timeline(
+                total_units, current_vesting_config(), CATEGORY_WEIGHTS
+            )
+            return exact.to_portfolio_timeline()
+        category_tokens = [
+            (a.project_tokens, a.participant_tokens, a.auditor_tokens)
+            for a in allocations
+        ]
+        return vesting_engine.compute_portfolio_timeline(category_tokens, current_vesting_config())
+    
+    def timeline_from_portfolio(
+        self,
+        portfolio: PortfolioTimeline,
+        index: int
+    ) -> ColumnarTimeline:
+        """Columnar timeline view of one project over the portfolio arrays (no copy)"""
+        return ColumnarTimeline(
+            portfolio.snapshot_columns[index].ravel(),
+            portfolio.days_elapsed,
+            portfolio.past_cliff,
+            portfolio.milestones_achieved
+        )
+        
+    def calculate_hybrid_allocation(
+        self,
+        project: Dict[str, Any],
+        include_timeline: bool = True
+    ) -> HybridTokenAllocation:
         """Calculate hybrid vesting allocation for a single project"""
         proposal_name = project['Proposal']
-        funding_usd = self.parse_funding_amount(project['REQUESTED $'])
+        funding_usd = token_model.funding_usd(project)
         
         # Convert funding to tokens
         total_tokens = funding_usd * TOKEN_CONVERSION_RATE
         
         # Calculate token distribution by category
-        project_tokens = total_tokens * PROJECT_TOKEN_RATIO
-        participant_tokens = total_tokens * PARTICIPANT_TOKEN_RATIO
-        auditor_tokens = total_tokens * AUDITOR_TOKEN_RATIO
-        
-        # Calculate milestone vs tail split
-        milestone_tokens = total_tokens * (1.0 - TAIL_VESTING_RATIO)
-        tail_tokens = total_tokens * TAIL_VESTING_RATIO
+        ratios = (PROJECT_TOKEN_RATIO, PARTICIPANT_TOKEN_RATIO, AUDITOR_TOKEN_RATIO)
+        if self.exact:
+            project_tokens, participant_tokens, auditor_tokens = token_model.split_tokens_exact(total_tokens, ratios)
+        else:
+            project_tokens, participant_tokens, auditor_tokens = token_model.split_tokens(total_tokens, ratios)
         
         # Calculate milestone schedule
         milestone_schedule = self.calculate_milestone_schedule(
             project_tokens, participant_tokens, auditor_tokens
         )
         
-        # Calculate monthly timeline
-        monthly_timeline = self.calculate_monthly_timeline(
-            project_tokens, participant_tokens, auditor_tokens, milestone_schedule
-        )
+        # Calculate milestone vs tail split
+        if self.exact:
+            pool_tokens = sum(
+                ms.pool_size_project + ms.pool_size_participant + ms.pool_size_auditor
+                for ms in milestone_schedule
+            )
+            milestone_tokens = exact_engine.from_base_units(exact_engine.to_base_units(pool_tokens))
+            tail_tokens = exact_engine.from_base_units(
+                exact_engine.to_base_units(total_tokens) - exact_engine.to_base_units(pool_tokens)
+            )
+        else:
+            milestone_tokens = total_tokens * (1.0 - TAIL_VESTING_RATIO)
+            tail_tokens = total_tokens * TAIL_VESTING_RATIO
+        
+        # Scale the cached unit timeline (skipped when the portfolio engine fills it in)
+        monthly_timeline: Sequence[MonthlyVestingSnapshot] = []
+        if include_timeline:
+            monthly_timeline = self.timeline_from_template(
+                project_tokens, participant_tokens, auditor_tokens
+            )
         
         total_duration = MILESTONE_PERIOD_MONTHS + TAIL_VESTING_MONTHS
         
@@ -375,16 +582,198 @@ class HybridVestingProcessor:
             monthly_timeline=monthly_timeline
         )
         
-    def process_all_projects(self):
+    def calculate_batch(
+        self,
+        projects: List[Dict[str, Any]]
+    ) -> Tuple[List[HybridTokenAllocation], PortfolioTimeline]:
+        """Calculate allocations for a batch of projects with one engine pass"""
+        allocations = [
+            self.calculate_hybrid_allocation(project, include_timeline=False)
+            for project in projects
+        ]
+        portfolio = self.calculate_portfolio_timeline(allocations)
+        for i, allocation in enumerate(allocations):
+            allocation.monthly_timeline = self.timeline_from_portfolio(portfolio, i)
+        return allocations, portfolio
+        
+    def iter_allocations(self, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[HybridTokenAllocation]:
+        """
+        Yield hybrid allocations as funded rows are read from the CSV.
+        
+        With NumPy, rows are grouped into batches of batch_size so each batch
+        shares one engine pass; memory stays bounded by the batch size.
+        """
+        if not vesting_engine.HAS_NUMPY:
+            for project in self.iter_funded_projects():
+                yield self.calculate_hybrid_allocation(project)
+            return
+            
+        batch = []
+        for project in self.iter_funded_projects():
+            batch.append(project)
+            if len(batch) >= batch_size:
+                yield from self.calculate_batch(batch)[0]
+                batch = []
+        if batch:
+            yield from self.calculate_batch(batch)[0]
+            
+    def config_fingerprint(self) -> str:
+        """Hash of every setting that affects an allocation (for the allocation cache)"""
+        return allocation_cache.config_fingerprint({
+            'token_conversion_rate': TOKEN_CONVERSION_RATE,
+            'ratios': [PROJECT_TOKEN_RATIO, PARTICIPANT_TOKEN_RATIO, AUDITOR_TOKEN_RATIO],
+            'vesting': current_vesting_config(),
+            # Only present in exact mode, so float-mode entries keep their keys
+            **({'base_units_per_token': exact_engine.BASE_UNITS_PER_TOKEN} if self.exact else {})
+        })
+        
+    def allocation_to_payload(self, alloc: HybridTokenAllocation) -> Dict[str, Any]:
+        """Serializable form of an allocation without its (derived) monthly timeline"""
+        payload = {
+            f.name: getattr(alloc, f.name) for f in fields(alloc)
+            if f.name not in ('milestone_schedule', 'monthly_timeline')
+        }
+        payload['milestone_schedule'] = [asdict(ms) for ms in alloc.milestone_schedule]
+        return payload
+    
+    def allocation_from_payload(self, payload: Dict[str, Any]) -> HybridTokenAllocation:
+        """Rebuild a cached allocation; its timeline is attached by the caller"""
+        payload = dict(payload)
+        payload['milestone_schedule'] = [
+            MilestoneVestingSchedule(**ms) for ms in payload['milestone_schedule']
+        ]
+        return HybridTokenAllocation(**payload)
+        
+    def allocate_with_cache(
+        self,
+        projects: List[Dict[str, Any]],
+        cache: AllocationCache
+    ) -> List[HybridTokenAllocation]:
+        """Reuse cached allocations for unchanged rows and calculate the rest (no timelines)"""
+        fingerprint = self.config_fingerprint()
+        keys = [allocation_cache.row_key('hybrid', project, fingerprint) for project in projects]
+        cached = cache.lookup_many(keys)
+        
+        allocations = []
+        new_entries = {}
+        for key, project in zip(keys, projects):
+            if key in cached:
+                allocation = self.allocation_from_payload(cached[key])
+            else:
+                allocation = self.calculate_hybrid_allocation(project, include_timeline=False)
+                new_entries[key] = self.allocation_to_payload(allocation)
+            allocations.append(allocation)
+            
+        cache.store_many('hybrid', new_entries.items())
+        return allocations
+        
+    def process_all_projects(self, cache: AllocationCache = None):
         """Process all funded projects and calculate hybrid allocations"""
-        funded_projects = self.load_funded_projects()
+        with self.report.stage('load'):
+            funded_projects = self.load_funded_projects()
+        
+        with self.report.stage('calculate', profile=True):
+            if cache is not None:
+                allocations = self.allocate_with_cache(funded_projects, cache)
+            else:
+                allocations = [
+                    self.calculate_hybrid_allocation(project, include_timeline=False)
+                    for project in funded_projects
+                ]
         
-        for project in funded_projects:
-            allocation = self.calculate_hybrid_allocation(project)
-            self.allocations.append(allocation)
+        with self.report.stage('timeline'):
+            self.attach_timelines(allocations)
+        self.allocations.extend(allocations)
+        self.report.count('projects_allocated', len(allocations))
             
         print(f"Calculated hybrid vesting for {len(self.allocations)} projects")
         
+    def attach_timelines(self, allocations: List[HybridTokenAllocation]):
+        """Fill in monthly timelines of allocations calculated without them"""
+        if vesting_engine.HAS_NUMPY or self.exact:
+            # Vectorized path: one array pass for every project's timeline
+            self.portfolio_timeline = self.calculate_portfolio_timeline(allocations)
+            for i, allocation in enumerate(allocations):
+                allocation.monthly_timeline = self.timeline_from_portfolio(self.portfolio_timeline, i)
+        else:
+            for allocation in allocations:
+                allocation.monthly_timeline = self.timeline_from_template(
+                    allocation.project_tokens, allocation.participant_tokens, allocation.auditor_tokens
+                )
+        
+    def get_allocation(self, proposal_name: str) -> HybridTokenAllocation:
+        """Look up an allocation by proposal name (index rebuilt when allocations change)"""
+        if self._indexed_count != len(self.allocations):
+            self._allocation_index = {a.proposal_name: a for a in self.allocations}
+            self._indexed_count = len(self.allocations)
+        try:
+            return self._allocation_index[proposal_name]
+        except KeyError:
+            raise KeyError(f"Unknown project: {proposal_name!r}") from None
+            
+    def category_tokens(self, alloc: HybridTokenAllocation, category: str) -> float:
+        """Token allocation of a category ('project', 'participant', 'auditor' or 'total')"""
+        if category == 'total':
+            return alloc.total_tokens
+        if category not in vesting_engine.CATEGORIES:
+            raise ValueError(f"Unknown category: {category!r}")
+        return getattr(alloc, f"{category}_tokens")
+        
+    def vested_at(self, project: str, category: str, day: float) -> float:
+        """
+        Tokens of one project's category vested at a given day.
+        
+        Evaluated in closed form from the cliff, milestone pools and tail
+        parameters; the monthly timeline is never built or scanned.
+        """
+        tokens = self.category_tokens(self.get_allocation(project), category)
+        return tokens * vesting_engine.vested_fraction_at(current_vesting_config(), day)
+        
+    def vested_at_batch(
+        self,
+        projects: Sequence[str],
+        days: Sequence[float],
+        category: str = 'total'
+    ):
+        """
+        Vested tokens for many projects at many days.
+        
+        Returns a (projects x days) NumPy array when NumPy is available,
+        otherwise a list of per-project lists.
+        """
+        config = current_vesting_config()
+        tokens = [self.category_tokens(self.get_allocation(p), category) for p in projects]
+        
+        if vesting_engine.HAS_NUMPY:
+            fractions = vesting_engine.vested_fraction_batch(config, days)
+            return vesting_engine.np.outer(tokens, fractions)
+        
+        fractions = [vesting_engine.vested_fraction_at(config, day) for day in days]
+        return [[t * f for f in fractions] for t in tokens]
+        
+    def expand_vesting(
+        self,
+        project: str,
+        category: str = 'total',
+        step_days: float = 1.0,
+        start_day: float = 0.0,
+        end_day: float = None
+    ):
+        """
+        Cumulative vested tokens of one project at any resolution.
+        
+        Expands the sparse event schedule on demand, e.g. step_days=1 for
+        daily output or step_days=vesting_events.DAYS_PER_SLOT for slots.
+        Returns (days, vested tokens) as NumPy arrays, or lists without NumPy.
+        """
+        tokens = self.category_tokens(self.get_allocation(project), category)
+        schedule = vesting_events.event_schedule(current_vesting_config())
+        days, fractions = schedule.expand(start_day, end_day, step_days)
+        
+        if vesting_engine.HAS_NUMPY:
+            return days, fractions * tokens
+        return days, [tokens * f for f in fractions]
+        
     def generate_summary(self) -> HybridAllocationSummary:
         """Generate summary statistics"""
         return HybridAllocationSummary(
@@ -400,8 +789,51 @@ class HybridVestingProcessor:
             cliff_period_days=CLIFF_PERIOD_DAYS
         )
         
+    def add_to_summary(self, summary: HybridAllocationSummary, alloc: HybridTokenAllocation):
+        """Add one allocation to a running summary (used by streaming exports)"""
+        summary.total_projects += 1
+        summary.total_funding_usd += alloc.requested_funding_usd
+        summary.total_tokens += alloc.total_tokens
+        summary.total_project_tokens += alloc.project_tokens
+        summary.total_participant_tokens += alloc.participant_tokens
+        summary.total_auditor_tokens += alloc.auditor_tokens
+        summary.total_milestone_tokens += alloc.milestone_tokens
+        summary.total_tail_tokens += alloc.tail_tokens
+        
     def export_to_csv(self, output_path: str):
         """Export hybrid vesting to CSV format"""
+        self.write_csv(output_path, self.allocations, self.generate_summary())
+        
+    def stream_to_csv(self, output_path: str) -> HybridAllocationSummary:
+        """
+        Ingest, allocate and export in a single streaming pass.
+        
+        Allocations are written as funded rows arrive and are not kept on
+        the processor, so memory use does not grow with the size of the
+        input CSV. The running summary is returned.
+        """
+        summary = HybridAllocationSummary(
+            0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
+            avg_project_duration_months=MILESTONE_PERIOD_MONTHS + TAIL_VESTING_MONTHS,
+            cliff_period_days=CLIFF_PERIOD_DAYS
+        )
+        
+        def counted(allocations: Iterable[HybridTokenAllocation]) -> Iterator[HybridTokenAllocation]:
+            for alloc in allocations:
+                self.add_to_summary(summary, alloc)
+                yield alloc
+                
+        # The summary is only read after the last allocation row is written
+        self.write_csv(output_path, counted(self.iter_allocations()), summary)
+        return summary
+        
+    def write_csv(
+        self,
+        output_path: str,
+        allocations: Iterable[HybridTokenAllocation],
+        summary: HybridAllocationSummary
+    ):
+        """Write allocation rows followed by the summary section"""
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             
@@ -430,7 +862,7 @@ class HybridVestingProcessor:
             writer.writerow(header)
             
             # Project data
-            for alloc in self.allocations:
+            for alloc in allocations:
                 row = [
                     alloc.proposal_name,
                     f"${alloc.requested_funding_usd:,.2f}",
@@ -457,7 +889,6 @@ class HybridVestingProcessor:
                 writer.writerow(row)
             
             # Summary section
-            summary = self.generate_summary()
             empty_cols = [''] * (len(header) - 2)
             
             writer.writerow([''] * len(header))
@@ -472,103 +903,327 @@ class HybridVestingProcessor:
             
         print(f"CSV export completed: {output_path}")
         
-    def export_to_json(self, output_path: str):
-        """Export hybrid vesting to JSON format"""
-        output_data = {
-            'metadata': {
-                'generated_at': datetime.now().isoformat(),
-                'framework_version': '2.0-hybrid',
-                'vesting_type': 'Cliff + Milestone + Linear',
-                'token_conversion_rate': TOKEN_CONVERSION_RATE,
-                'distribution_ratios': {
-                    'project_tokens': PROJECT_TOKEN_RATIO,
-                    'participant_tokens': PARTICIPANT_TOKEN_RATIO,
-                    'auditor_tokens': AUDITOR_TOKEN_RATIO
-                },
-                'vesting_configuration': {
-                    'cliff_period_days': CLIFF_PERIOD_DAYS,
-                    'milestone_period_months': MILESTONE_PERIOD_MONTHS,
-                    'tail_vesting_months': TAIL_VESTING_MONTHS,
-                    'tail_vesting_ratio': TAIL_VESTING_RATIO,
-                    'milestone_vesting_months': MILESTONE_VESTING_MONTHS
-                }
+    def export_metadata(self) -> Dict[str, Any]:
+        """Metadata block shared by the JSON and columnar exports"""
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'framework_version': '2.0-hybrid',
+            'vesting_type': 'Cliff + Milestone + Linear',
+            'token_conversion_rate': TOKEN_CONVERSION_RATE,
+            'distribution_ratios': {
+                'project_tokens': PROJECT_TOKEN_RATIO,
+                'participant_tokens': PARTICIPANT_TOKEN_RATIO,
+                'auditor_tokens': AUDITOR_TOKEN_RATIO
             },
-            'summary': asdict(self.generate_summary()),
-            'allocations': []
+            'vesting_configuration': {
+                'cliff_period_days': CLIFF_PERIOD_DAYS,
+                'milestone_period_months': MILESTONE_PERIOD_MONTHS,
+                'tail_vesting_months': TAIL_VESTING_MONTHS,
+                'tail_vesting_ratio': TAIL_VESTING_RATIO,
+                'milestone_vesting_months': MILESTONE_VESTING_MONTHS
+            },
+            **({'base_units_per_token': exact_engine.BASE_UNITS_PER_TOKEN} if self.exact else {})
         }
         
-        for alloc in self.allocations:
-            alloc_dict = {
-                'proposal_name': alloc.proposal_name,
-                'requested_funding_usd': alloc.requested_funding_usd,
-                'total_tokens': alloc.total_tokens,
-                'token_distribution': {
-                    'project_tokens': alloc.project_tokens,
-                    'participant_tokens': alloc.participant_tokens,
-                    'auditor_tokens': alloc.auditor_tokens
-                },
-                'vesting_structure': {
-                    'cliff_days': alloc.cliff_days,
-                    'total_duration_months': alloc.total_duration_months,
-                    'milestone_tokens': alloc.milestone_tokens,
-                    'tail_tokens': alloc.tail_tokens
-                },
-                'milestone_schedule': [
-                    {
-                        'milestone_name': ms.milestone_name,
-                        'unlock_month': ms.unlock_month,
-                        'pool_sizes': {
-                            'project': ms.pool_size_project,
-                            'participant': ms.pool_size_participant,
-                            'auditor': ms.pool_size_auditor
-                        },
-                        'vesting_months': ms.vesting_months,
-                        'monthly_vest': {
-                            'project': ms.monthly_vest_project,
-                            'participant': ms.monthly_vest_participant,
-                            'auditor': ms.monthly_vest_auditor
-                        }
+    def allocation_to_json(self, alloc: HybridTokenAllocation) -> Dict[str, Any]:
+        """JSON export form of one allocation"""
+        return {
+            'proposal_name': alloc.proposal_name,
+            'requested_funding_usd': alloc.requested_funding_usd,
+            'total_tokens': alloc.total_tokens,
+            'token_distribution': {
+                'project_tokens': alloc.project_tokens,
+                'participant_tokens': alloc.participant_tokens,
+                'auditor_tokens': alloc.auditor_tokens
+            },
+            'vesting_structure': {
+                'cliff_days': alloc.cliff_days,
+                'total_duration_months': alloc.total_duration_months,
+                'milestone_tokens': alloc.milestone_tokens,
+                'tail_tokens': alloc.tail_tokens
+            },
+            'milestone_schedule': [
+                {
+                    'milestone_name': ms.milestone_name,
+                    'unlock_month': ms.unlock_month,
+                    'pool_sizes': {
+                        'project': ms.pool_size_project,
+                        'participant': ms.pool_size_participant,
+                        'auditor': ms.pool_size_auditor
+                    },
+                    'vesting_months': ms.vesting_months,
+                    'monthly_vest': {
+                        'project': ms.monthly_vest_project,
+                        'participant': ms.monthly_vest_participant,
+                        'auditor': ms.monthly_vest_auditor
                     }
-                    for ms in alloc.milestone_schedule
-                ],
-                'monthly_timeline': [
-                    {
-                        'month': snap.month,
-                        'days_elapsed': snap.days_elapsed,
-                        'past_cliff': snap.past_cliff,
-                        'milestones_achieved': snap.milestones_achieved,
-                        'new_unlocked': {
-                            'project': snap.new_project_unlocked,
-                            'participant': snap.new_participant_unlocked,
-                            'auditor': snap.new_auditor_unlocked
-                        },
-                        'vested_this_month': {
-                            'project': snap.project_vested_this_month,
-                            'participant': snap.participant_vested_this_month,
-                            'auditor': snap.auditor_vested_this_month
-                        },
-                        'cumulative_vested': {
-                            'project': snap.cumulative_project_vested,
-                            'participant': snap.cumulative_participant_vested,
-                            'auditor': snap.cumulative_auditor_vested
-                        },
-                        'vested_percentages': {
-                            'project': snap.project_vested_pct,
-                            'participant': snap.participant_vested_pct,
-                            'auditor': snap.auditor_vested_pct,
-                            'total': snap.total_vested_pct
-                        }
+                }
+                for ms in alloc.milestone_schedule
+            ],
+            'monthly_timeline': [
+                {
+                    'month': snap.month,
+                    'days_elapsed': snap.days_elapsed,
+                    'past_cliff': snap.past_cliff,
+                    'milestones_achieved': snap.milestones_achieved,
+                    'new_unlocked': {
+                        'project': snap.new_project_unlocked,
+                        'participant': snap.new_participant_unlocked,
+                        'auditor': snap.new_auditor_unlocked
+                    },
+                    'vested_this_month': {
+                        'project': snap.project_vested_this_month,
+                        'participant': snap.participant_vested_this_month,
+                        'auditor': snap.auditor_vested_this_month
+                    },
+                    'cumulative_vested': {
+                        'project': snap.cumulative_project_vested,
+                        'participant': snap.cumulative_participant_vested,
+                        'auditor': snap.cumulative_auditor_vested
+                    },
+                    'vested_percentages': {
+                        'project': snap.project_vested_pct,
+                        'participant': snap.participant_vested_pct,
+                        'auditor': snap.auditor_vested_pct,
+                        'total': snap.total_vested_pct
                     }
-                    for snap in alloc.monthly_timeline
-                ]
-            }
-            output_data['allocations'].append(alloc_dict)
-            
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
+                }
+                for snap in alloc.monthly_timeline
+            ]
+        }
+        
+    def export_to_json(self, output_path: str, compact: bool = False, compress: bool = False):
+        """
+        Export hybrid vesting to JSON format.
+        
+        Streams one allocation at a time; compact drops indentation and
+        compress writes gzip.
+        """
+        header = {
+            'metadata': self.export_metadata(),
+            'summary': asdict(self.generate_summary())
+        }
+        write_json_export(
+            output_path,
+            header,
+            (self.allocation_to_json(alloc) for alloc in self.allocations),
+            compact=compact,
+            compress=compress
+        )
             
         print(f"JSON export completed: {output_path}")
         
+    def timeline_values(self, timeline: Sequence[MonthlyVestingSnapshot]):
+        """Column-major float buffer of a timeline (no copy for ColumnarTimeline)"""
+        if isinstance(timeline, ColumnarTimeline):
+            return timeline.values
+        values = array('d')
+        for name in TIMELINE_FIELDS:
+            values.extend(getattr(snap, name) for snap in timeline)
+        return values
+        
+    def portfolio_series(self) -> Dict[str, Any]:
+        """Cumulative tokens vested across the portfolio in each month"""
+        totals: List[float] = []
+        for alloc in self.allocations:
+            for i, snap in enumerate(alloc.monthly_timeline):
+                vested = (snap.cumulative_project_vested + snap.cumulative_participant_vested
+                          + snap.cumulative_auditor_vested)
+                if i < len(totals):
+                    totals[i] += vested
+                else:
+                    totals.append(vested)
+        return {'labels': [f"M{month}" for month in range(len(totals))], 'values': totals}
+        
+    def export_dashboard_data(self, output_dir: str):
+        """Export sharded dashboard data (index plus one file per project)"""
+        header = {
+            'metadata': self.export_metadata(),
+            'summary': asdict(self.generate_summary())
+        }
+        count = dashboard_export.write_dashboard_data(
+            output_dir,
+            header,
+            (self.allocation_to_json(alloc) for alloc in self.allocations),
+            self.portfolio_series()
+        )
+        print(f"Dashboard data exported: {output_dir} ({count} project shards)")
+        
+    def export_to_columnar(self, output_path: str):
+        """Export allocations, milestone schedules and timelines as typed binary columns"""
+        allocations = self.allocations
+        writer = ColumnarWriter()
+        
+        writer.add_strings('proposal_name', (a.proposal_name for a in allocations))
+        for name in ALLOCATION_FLOAT_COLUMNS:
+            writer.add_column(name, 'd', [getattr(a, name) for a in allocations])
+        for name in ALLOCATION_INT_COLUMNS:
+            writer.add_column(name, 'q', [getattr(a, name) for a in allocations])
+        
+        # Milestone schedules: one row per (project, milestone), offsets per project
+        offsets = array('q', [0])
+        schedules = []
+        for alloc in allocations:
+            schedules.extend(alloc.milestone_schedule)
+            offsets.append(len(schedules))
+        writer.add_column('milestone.offsets', 'q', offsets)
+        writer.add_strings('milestone.milestone_name', (ms.milestone_name for ms in schedules))
+        writer.add_column('milestone.unlock_month', 'q', [ms.unlock_month for ms in schedules])
+        writer.add_column('milestone.vesting_months', 'q', [ms.vesting_months for ms in schedules])
+        for name in SCHEDULE_FLOAT_COLUMNS:
+            writer.add_column(f'milestone.{name}', 'd', [getattr(ms, name) for ms in schedules])
+        
+        # Timelines: per-month data is shared, float fields form a (projects, fields, months) block
+        first = allocations[0].monthly_timeline if allocations else []
+        num_months = len(first)
+        if any(len(a.monthly_timeline) != num_months for a in allocations):
+            raise ValueError("Columnar export requires timelines of equal length")
+        writer.add_column('timeline.days_elapsed', 'q', [snap.days_elapsed for snap in first])
+        writer.add_column('timeline.past_cliff', 'B', [snap.past_cliff for snap in first])
+        writer.add_strings(
+            'timeline.milestones_achieved',
+            (MILESTONE_SEPARATOR.join(snap.milestones_achieved) for snap in first)
+        )
+        writer.add_chunked_column(
+            'timeline.values', 'd',
+            (self.timeline_values(a.monthly_timeline) for a in allocations),
+            shape=(len(allocations), len(TIMELINE_FIELDS), num_months)
+        )
+        
+        writer.write(output_path, {
+            'approach': 'hybrid',
+            'metadata': self.export_metadata(),
+            'summary': asdict(self.generate_summary())
+        })
+        print(f"Columnar export completed: {output_path}")
+        
+    def store_batches(self, first_id: int) -> Iterator[allocation_store.StoreBatch]:
+        """Allocation, milestone and snapshot rows for the SQLite store, one batch of projects at a time"""
+        categories = vesting_engine.CATEGORIES
+        next_id = first_id
+        for batch in allocation_store.batches(self.allocations):
+            ids = range(next_id, next_id + len(batch))
+            next_id += len(batch)
+            allocation_rows = [
+                (allocation_id, a.proposal_name, a.requested_funding_usd, a.total_tokens,
+                 a.project_tokens, a.participant_tokens, a.auditor_tokens)
+                for allocation_id, a in zip(ids, batch)
+            ]
+            milestone_rows = [
+                (allocation_id, k, ms.milestone_name, c, ms.unlock_month, ms.vesting_months,
+                 getattr(ms, f'pool_size_{category}'))
+                for allocation_id, a in zip(ids, batch)
+                for k, ms in enumerate(a.milestone_schedule)
+                for c, category in enumerate(categories)
+            ]
+            yield allocation_rows, milestone_rows, self.store_snapshot_rows(ids, batch)
+            
+    def store_snapshot_rows(self, ids: Sequence[int], batch: List[HybridTokenAllocation]) -> List[tuple]:
+        """
+        Snapshot rows of a batch of allocations, built column by column.
+        
+        With NumPy the batch's timeline buffers (views of the portfolio
+        arrays) are stacked into one (projects, fields, months) block and each
+        stored field becomes a single list; zip then assembles the rows
+        (tolist gives plain floats, which sqlite3 binds fastest).
+        """
+        # Row of each stored field, per category, in the column-major timeline buffer
+        field_rows = [
+            [TIMELINE_FIELDS.index(name.format(category)) for name in STORE_SNAPSHOT_FIELDS]
+            for category in vesting_engine.CATEGORIES
+        ]
+        num_months = len(batch[0].monthly_timeline) if batch else 0
+        rows = []
+        if vesting_engine.HAS_NUMPY and all(len(a.monthly_timeline) == num_months for a in batch):
+            np = vesting_engine.np
+            block = np.stack([
+                np.asarray(self.timeline_values(a.monthly_timeline)).reshape(-1, num_months)
+                for a in batch
+            ])
+            id_column = np.repeat(np.asarray(ids), num_months).tolist()
+            month_column = list(range(num_months)) * len(batch)
+            for c, category_rows in enumerate(field_rows):
+                rows.extend(zip(
+                    id_column, month_column, [c] * len(id_column),
+                    *(block[:, f, :].ravel().tolist() for f in category_rows)
+                ))
+            return rows
+        
+        for allocation_id, alloc in zip(ids, batch):
+            num_months = len(alloc.monthly_timeline)
+            values = self.timeline_values(alloc.monthly_timeline).tolist()
+            for c, category_rows in enumerate(field_rows):
+                rows.extend(zip(
+                    [allocation_id] * num_months, range(num_months), [c] * num_months,
+                    *(values[f * num_months:(f + 1) * num_months] for f in category_rows)
+                ))
+        return rows
+        
+    def export_to_sqlite(self, output_path: str, fund: str = None):
+        """Load allocations, milestone schedules and monthly snapshots into the SQLite store"""
+        fund = fund or allocation_store.fund_name(self.csv_path)
+        with AllocationStore(output_path) as store:
+            counts = store.load(
+                fund, 'hybrid', self.export_metadata(), self.store_batches
+            )
+        print(f"SQLite export completed: {output_path} ({fund}: {counts['allocations']} projects, "
+              f"{counts['snapshots']} snapshot rows)")
+        
+    @classmethod
+    def from_columnar(cls, path: str) -> 'HybridVestingProcessor':
+        """
+        Load allocations from a columnar export.
+        
+        The file is memory-mapped; each timeline is a ColumnarTimeline over a
+        zero-copy slice of the mapped float block.
+        """
+        reader = ColumnarReader(path)
+        if reader.header.get('approach') != 'hybrid':
+            raise ValueError(f"{path} is not a hybrid vesting export")
+        processor = cls(path)
+        
+        names = reader.strings('proposal_name')
+        floats = {name: reader.column(name) for name in ALLOCATION_FLOAT_COLUMNS}
+        ints = {name: reader.column(name) for name in ALLOCATION_INT_COLUMNS}
+        
+        offsets = reader.column('milestone.offsets')
+        milestone_names = reader.strings('milestone.milestone_name')
+        unlock_months = reader.column('milestone.unlock_month')
+        vesting_months = reader.column('milestone.vesting_months')
+        schedule_floats = {name: reader.column(f'milestone.{name}') for name in SCHEDULE_FLOAT_COLUMNS}
+        
+        days_elapsed = tuple(reader.column('timeline.days_elapsed'))
+        past_cliff = tuple(bool(flag) for flag in reader.column('timeline.past_cliff'))
+        milestones_achieved = tuple(
+            tuple(joined.split(MILESTONE_SEPARATOR)) if joined else ()
+            for joined in reader.strings('timeline.milestones_achieved')
+        )
+        values = reader.column('timeline.values')
+        _, num_fields, num_months = reader.shape('timeline.values')
+        stride = num_fields * num_months
+        
+        for i, name in enumerate(names):
+            schedule = [
+                MilestoneVestingSchedule(
+                    milestone_name=milestone_names[j],
+                    unlock_month=unlock_months[j],
+                    vesting_months=vesting_months[j],
+                    **{field_name: schedule_floats[field_name][j] for field_name in SCHEDULE_FLOAT_COLUMNS}
+                )
+                for j in range(offsets[i], offsets[i + 1])
+            ]
+            processor.allocations.append(HybridTokenAllocation(
+                proposal_name=name,
+                **{field_name: floats[field_name][i] for field_name in ALLOCATION_FLOAT_COLUMNS},
+                **{field_name: ints[field_name][i] for field_name in ALLOCATION_INT_COLUMNS},
+                milestone_schedule=schedule,
+                monthly_timeline=ColumnarTimeline(
+                    values[i * stride:(i + 1) * stride], days_elapsed, past_cliff, milestones_achieved
+                )
+            ))
+            
+        return processor
+        
     def print_summary(self):
         """Print summary statistics to console"""
         summary = self.generate_summary()
@@ -637,6 +1292,39 @@ class HybridVestingProcessor:
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Token Distribution Framework - Hybrid Vesting")
+    batch_runner.add_batch_arguments(parser)
+    parser.add_argument('--cache', help='Allocation cache file; reruns only recompute changed rows')
+    parser.add_argument('--columnar', action='store_true',
+                        help='Also write the binary columnar export (.tdcol)')
+    parser.add_argument('--compact-json', action='store_true',
+                        help='Write the JSON export without indentation')
+    parser.add_argument('--gzip-json', action='store_true',
+                        help='Gzip the JSON export (.json.gz)')
+    parser.add_argument('--dashboard-dir',
+                        help='Also write sharded dashboard data under this directory (e.g. dashboard/data)')
+    parser.add_argument('--sqlite',
+                        help='Also load allocations into this indexed SQLite store (see allocation_store.py)')
+    parser.add_argument('--exact', action='store_true',
+                        help='Use exact integer base-unit arithmetic (totals reconcile to the unit)')
+    parser.add_argument('--run-report',
+                        help='Write per-stage timings, memory peaks and counters to this JSON file')
+    parser.add_argument('--profile',
+                        help='Dump cProfile stats of the allocation stage to this file')
+    parser.add_argument('--stream', action='store_true',
+                        help='Write only the CSV export in one streaming pass (flat memory for large inputs)')
+    args = parser.parse_args()
+    if args.stream and (args.inputs or args.cache or args.columnar or args.compact_json
+                        or args.gzip_json or args.dashboard_dir or args.sqlite):
+        parser.error('--stream writes only the CSV export; it cannot be combined with '
+                     'batch inputs, --cache or the JSON/columnar/dashboard/sqlite exports')
+    
+    if args.inputs:
+        # Batch mode: one worker process per fund CSV
+        options = batch_runner.batch_options(parser, args)
+        batch_runner.run_batch('hybrid', args.inputs, args.output_dir, args.workers, args.cache, options)
+        return
+    
     print("Token Distribution Framework - Hybrid Vesting")
     print("Implementation: Cliff + Milestone + Linear")
     print("Processing Catalyst Fund 5 Developer Ecosystem Data\n")
@@ -644,24 +1332,74 @@ def main():
     # Initialize processor
     csv_path = 'Project-Catalyst-Fund-5-Developer-Ecosystem.csv'
     processor = HybridVestingProcessor(csv_path)
+    processor.exact = args.exact
+    processor.report = RunReport('hybrid', trace_memory=bool(args.run_report), profile_path=args.profile)
+    report = processor.report
     
-    # Process projects
-    processor.process_all_projects()
+    if args.stream:
+        # Allocations are written as rows are read and never held in memory
+        with report.stage('stream_csv'):
+            summary = processor.stream_to_csv('token_allocations_hybrid_output.csv')
+        report.add_output('token_allocations_hybrid_output.csv')
+        if args.run_report:
+            report.write(args.run_report)
+        print(f"Streamed {summary.total_projects} projects "
+              f"(${summary.total_funding_usd:,.2f}, {summary.total_tokens:,.2f} tokens)")
+        print("\nProcessing complete!")
+        print("Generated files:")
+        print("  - token_allocations_hybrid_output.csv")
+        return
     
-    # Print summary
-    processor.print_summary()
+    # Process projects (reusing cached allocations when a cache is given)
+    if args.cache:
+        with AllocationCache(args.cache) as cache:
+            cache.begin_run('hybrid')
+            processor.process_all_projects(cache)
+            cache_stats = cache.finish_run()
+            allocation_cache.print_cache_report(cache_stats)
+            report.add_cache_stats(cache_stats)
+    else:
+        processor.process_all_projects()
     
-    # Print example
-    processor.print_example_project()
+    # Print summary and example
+    with report.stage('summary'):
+        processor.print_summary()
+        processor.print_example_project()
     
     # Export results
-    processor.export_to_csv('token_allocations_hybrid_output.csv')
-    processor.export_to_json('token_allocations_hybrid_output.json')
+    with report.stage('csv_export'):
+        processor.export_to_csv('token_allocations_hybrid_output.csv')
+    report.add_output('token_allocations_hybrid_output.csv')
+    json_path = 'token_allocations_hybrid_output.json' + ('.gz' if args.gzip_json else '')
+    with report.stage('json_export'):
+        processor.export_to_json(json_path, compact=args.compact_json, compress=args.gzip_json)
+    report.add_output(json_path)
+    if args.columnar:
+        with report.stage('columnar_export'):
+            processor.export_to_columnar('token_allocations_hybrid_output.tdcol')
+        report.add_output('token_allocations_hybrid_output.tdcol')
+    if args.dashboard_dir:
+        dashboard_dir = os.path.join(args.dashboard_dir, dashboard_export.APPROACH_DIRNAMES['hybrid'])
+        with report.stage('dashboard_export'):
+            processor.export_dashboard_data(dashboard_dir)
+        report.add_output(dashboard_dir)
+    if args.sqlite:
+        with report.stage('sqlite_export'):
+            processor.export_to_sqlite(args.sqlite)
+        report.add_output(args.sqlite)
+    if args.run_report:
+        report.write(args.run_report)
     
     print("\nProcessing complete!")
     print("Generated files:")
     print("  - token_allocations_hybrid_output.csv")
-    print("  - token_allocations_hybrid_output.json")
+    print(f"  - {json_path}")
+    if args.columnar:
+        print("  - token_allocations_hybrid_output.tdcol")
+    if args.dashboard_dir:
+        print(f"  - {dashboard_dir}/")
+    if args.sqlite:
+        print(f"  - {args.sqlite}")
 
 
 if __name__ == '__main__':
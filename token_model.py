@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Shared Allocation Model
+======================================================
+
+Input parsing and token split shared by the pure milestone, hybrid and
+unified processors: funded-row filtering, funding amount parsing and the
+Project / Participant / Auditor category split.
+
+Values are parsed with the declared column kinds of fund_schema; a funded
+row with a malformed or blank REQUESTED $ raises fund_schema.SchemaError
+with its line and column instead of being allocated 0 tokens. The amount is
+parsed once while filtering and carried on the yielded FundedRow.
+"""
+
+import csv
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple
+
+import exact_engine
+import fund_schema
+from fund_schema import ParseIssue, SchemaError
+
+FUNDING_COLUMN = 'REQUESTED $'
+
+
+def parse_funding_amount(funding_str: str) -> float:
+    """Parse funding amount from string format like '$7,500' or '$50,000' (ValueError if malformed)"""
+    amount = fund_schema.parse_usd(funding_str)
+    if amount is None:
+        raise ValueError(f"blank funding amount {funding_str!r}")
+    return amount
+
+
+class FundedRow(dict):
+    """A funded CSV row (column -> raw value) carrying its parsed REQUESTED $ amount"""
+    __slots__ = ('funding_usd',)
+
+
+def funding_usd(project: Mapping[str, Any]) -> float:
+    """REQUESTED $ of a project row in USD (already parsed for rows from iter_funded_rows)"""
+    if isinstance(project, FundedRow):
+        return project.funding_usd
+    return parse_funding_amount(project[FUNDING_COLUMN])
+
+
+def iter_funded_rows(csv_path: str, counters: Optional[Dict[str, int]] = None,
+                     overrides: Optional[Mapping[int, Dict[str, str]]] = None) -> Iterator[FundedRow]:
+    """
+    Yield funded project rows one at a time without buffering the CSV.
+
+    When counters is given, its rows_read and rows_filtered (rows dropped as
+    not funded) entries are incremented once the rows have been consumed.
+    overrides maps CSV line numbers to replacement column values (e.g. a
+    recomputed STATUS from funding_selection), applied before filtering.
+    """
+    rows_read = rows_filtered = 0
+    try:
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                rows_read += 1
+                if overrides is not None and reader.line_num in overrides:
+                    row.update(overrides[reader.line_num])
+                # Filter for FUNDED status
+                if row.get('STATUS', '').strip().upper() == 'FUNDED':
+                    funded = FundedRow(row)
+                    funded.funding_usd = check_funding(csv_path, reader, row)
+                    yield funded
+                else:
+                    rows_filtered += 1
+    finally:
+        if counters is not None:
+            counters['rows_read'] = counters.get('rows_read', 0) + rows_read
+            counters['rows_filtered'] = counters.get('rows_filtered', 0) + rows_filtered
+
+
+def check_funding(csv_path: str, reader: csv.DictReader, row: Dict[str, Any]) -> float:
+    """Parse the row's funding amount; SchemaError (with line and column) if it does not parse"""
+    value = row.get(FUNDING_COLUMN)
+    try:
+        return parse_funding_amount(value)
+    except ValueError:
+        position = reader.fieldnames.index(FUNDING_COLUMN) + 1 if FUNDING_COLUMN in reader.fieldnames else 0
+        raise SchemaError(csv_path, [ParseIssue(reader.line_num, FUNDING_COLUMN, position, value or '', 'usd')]) from None
+
+
+def split_tokens(total_tokens: float, ratios: Sequence[float]) -> Tuple[float, ...]:
+    """Split a token allocation into categories (project, participant, auditor)"""
+    return tuple(total_tokens * ratio for ratio in ratios)
+
+
+def split_tokens_exact(total_tokens: float, ratios: Sequence[float]) -> Tuple[float, ...]:
+    """split_tokens in whole base units; the categories sum exactly to the rounded total"""
+    units = exact_engine.split_exact(exact_engine.to_base_units(total_tokens), exact_engine.integer_weights(tuple(ratios)))
+    return tuple(exact_engine.from_base_units(u) for u in units)
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Treasury Outflow
+===============================================
+
+Aggregate token outflow of the whole treasury when projects start on
+different dates. Each project's schedule is shifted by its start day, and
+the portfolio answers "how many tokens vest (and unlock) across the
+treasury in each day / week / month".
+
+No per-project arrays are built. Allocations are first summed per start
+day, then every distinct start day is swept once over the sparse unit
+schedule of the configuration (the months in which anything vests or
+unlocks). The cost is O(distinct start days x schedule events), whatever
+the number of projects. Cumulative totals and rolling windows come from
+prefix sums over the period series.
+
+Start days come from a CSV column holding either ISO dates (YYYY-MM-DD,
+counted from --epoch or the earliest date) or integer day offsets; rows
+without one start on day 0. --stagger-days spreads start days by CSV order
+instead, for files without dates.
+
+Peak detection reports the periods with the largest outflow and the
+heaviest run of consecutive periods (--peak-window).
+
+Usage:
+    python3 treasury_outflow.py --stagger-days 14 --period week
+    python3 treasury_outflow.py --csv funds.csv --start-column "FUNDED DATE" --dashboard-dir dashboard/data
+"""
+
+import argparse
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import token_model
+import vesting_engine
+from vesting_engine import VestingConfig
+
+PERIODS = ('day', 'week', 'month')
+DEFAULT_PEAK_COUNT = 5
+DEFAULT_PEAK_WINDOW = 3
+DASHBOARD_FILENAME = 'treasury-outflow.json'
+
+
+def period_days(period: str, config: VestingConfig) -> int:
+    """Length of a reporting period in days (months follow the model's days_per_month)"""
+    if period == 'day':
+        return 1
+    if period == 'week':
+        return 7
+    if period == 'month':
+        return config.days_per_month
+    raise ValueError(f"Unknown period: {period!r}")
+
+
+def parse_start_day(value: Optional[str], epoch: Optional[date]) -> Optional[int]:
+    """Start day of a row: an integer day offset or an ISO date relative to epoch"""
+    if value is None or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    day = date.fromisoformat(value)
+    if epoch is None:
+        raise ValueError("Start dates need an epoch to be converted into day offsets")
+    return (day - epoch).days
+
+
+def schedule_events(config: VestingConfig) -> Tuple[Tuple[int, float], Tuple[int, float]]:
+    """
+    Sparse unit schedule of a configuration.
+
+    Returns (vest_events, unlock_events): (day offset from project start,
+    fraction of the allocation) for every month in which anything vests or
+    unlocks. Month m is credited on day m * days_per_month, as in
+    vesting_engine.vested_fraction_at.
+    """
+    template = vesting_engine.schedule_template(config)
+    vest = tuple(
+        (month * config.days_per_month, fraction)
+        for month, fraction in enumerate(template.vest_fraction) if fraction
+    )
+    unlock = tuple(
+        (month * config.days_per_month, fraction)
+        for month, fraction in enumerate(template.unlock_fraction) if fraction
+    )
+    return vest, unlock
+
+
+@dataclass
+class TreasuryOutflow:
+    """Treasury-wide vesting and unlock series per period"""
+    period: str
+    period_days: int
+    first_day: int                  # Day (from epoch) on which period 0 starts
+    epoch: Optional[date]
+    outflow: List[float]            # Tokens vesting in each period
+    unlocked: List[float]           # Tokens unlocked by milestones in each period
+    cumulative: List[float]         # Tokens vested by the end of each period
+    total_tokens: float
+    project_count: int
+
+    def __len__(self) -> int:
+        return len(self.outflow)
+
+    def period_start(self, index: int) -> int:
+        return self.first_day + index * self.period_days
+
+    def label(self, index: int) -> str:
+        """ISO date of the period start when an epoch is known, else day offset"""
+        start = self.period_start(index)
+        if self.epoch is not None:
+            return (self.epoch + timedelta(days=start)).isoformat()
+        return f"Day {start}"
+
+    def labels(self) -> List[str]:
+        return [self.label(i) for i in range(len(self))]
+
+    def peak_periods(self, count: int = DEFAULT_PEAK_COUNT) -> List[Dict[str, Any]]:
+        """The count periods with the largest outflow, largest first (ties: earliest first)"""
+        order = sorted(range(len(self)), key=lambda i: (-self.outflow[i], i))[:count]
+        return [
+            {
+                'period': i,
+                'label': self.label(i),
+                'outflow': self.outflow[i],
+                'share_pct': self.outflow[i] / self.total_tokens * 100 if self.total_tokens else 0.0
+            }
+            for i in order if self.outflow[i] > 0
+        ]
+
+    def peak_window(self, window: int = DEFAULT_PEAK_WINDOW) -> Optional[Dict[str, Any]]:
+        """Heaviest run of window consecutive periods (prefix sums, earliest on ties)"""
+        if not self.outflow:
+            return None
+        window = min(window, len(self))
+        prefix = [0.0]
+        for value in self.outflow:
+            prefix.append(prefix[-1] + value)
+        start = max(range(len(self) - window + 1), key=lambda i: (prefix[i + window] - prefix[i], -i))
+        outflow = prefix[start + window] - prefix[start]
+        return {
+            'periods': window,
+            'start_period': start,
+            'start_label': self.label(start),
+            'end_label': self.label(start + window - 1),
+            'outflow': outflow,
+            'share_pct': outflow / self.total_tokens * 100 if self.total_tokens else 0.0
+        }
+
+    def to_dict(self, peak_count: int = DEFAULT_PEAK_COUNT, peak_window: int = DEFAULT_PEAK_WINDOW) -> Dict[str, Any]:
+        return {
+            'period': self.period,
+            'period_days': self.period_days,
+            'epoch': self.epoch.isoformat() if self.epoch else None,
+            'first_day': self.first_day,
+            'total_tokens': self.total_tokens,
+            'project_count': self.project_count,
+            'labels': self.labels(),
+            'outflow': self.outflow,
+            'unlocked': self.unlocked,
+            'cumulative': self.cumulative,
+            'peaks': self.peak_periods(peak_count),
+            'peak_window': self.peak_window(peak_window)
+        }
+
+
+def treasury_outflow(
+    projects: Iterable[Tuple[int, float]],
+    config: VestingConfig,
+    period: str = 'month',
+    epoch: Optional[date] = None
+) -> TreasuryOutflow:
+    """
+    Aggregate outflow of projects given as (start day, total tokens) pairs.
+
+    Every project follows config shifted by its start day. Periods are
+    aligned on the earliest start day.
+    """
+    length = period_days(period, config)
+    vest_events, unlock_events = schedule_events(config)
+
+    # Sum allocations per start day: the sweep below only sees distinct days
+    tokens_by_start: Dict[int, float] = defaultdict(float)
+    project_count = 0
+    for start_day, tokens in projects:
+        tokens_by_start[start_day] += tokens
+        project_count += 1
+    if not tokens_by_start:
+        return TreasuryOutflow(period, length, 0, epoch, [], [], [], 0.0, 0)
+
+    first_day = min(tokens_by_start)
+    last_offset = max([offset for offset, _ in vest_events + unlock_events] or [0])
+    num_periods = (max(tokens_by_start) + last_offset - first_day) // length + 1
+
+    outflow = [0.0] * num_periods
+    unlocked = [0.0] * num_periods
+    for start_day, tokens in tokens_by_start.items():
+        for offset, fraction in vest_events:
+            outflow[(start_day + offset - first_day) // length] += tokens * fraction
+        for offset, fraction in unlock_events:
+            unlocked[(start_day + offset - first_day) // length] += tokens * fraction
+
+    cumulative = []
+    running = 0.0
+    for value in outflow:
+        running += value
+        cumulative.append(running)
+
+    return TreasuryOutflow(
+        period=period,
+        period_days=length,
+        first_day=first_day,
+        epoch=epoch,
+        outflow=outflow,
+        unlocked=unlocked,
+        cumulative=cumulative,
+        total_tokens=sum(tokens_by_start.values()),
+        project_count=project_count
+    )
+
+
+def funded_project_starts(
+    csv_path: str,
+    token_rate: float,
+    start_column: Optional[str] = None,
+    epoch: Optional[date] = None,
+    stagger_days: int = 0
+) -> Tuple[List[Tuple[int, float]], Optional[date]]:
+    """
+    (start day, total tokens) of every funded row, plus the epoch used.
+
+    Without an epoch, ISO start dates are counted from the earliest one.
+    """
+    rows = list(token_model.iter_funded_rows(csv_path))
+    values = [row.get(start_column) if start_column else None for row in rows]
+
+    if epoch is None:
+        dates = []
+        for value in values:
+            try:
+                dates.append(date.fromisoformat(value.strip()))
+            except (AttributeError, ValueError):
+                continue
+        epoch = min(dates) if dates else None
+
+    projects = []
+    for i, (row, value) in enumerate(zip(rows, values)):
+        start_day = parse_start_day(value, epoch)
+        if start_day is None:
+            start_day = i * stagger_days
+        tokens = token_model.funding_usd(row) * token_rate
+        projects.append((start_day, tokens))
+    return projects, epoch
+
+
+def print_outflow(outflow: TreasuryOutflow, peak_count: int, peak_window: int):
+    print(f"Treasury outflow: {outflow.project_count} projects, "
+          f"{outflow.total_tokens:,.0f} tokens, {len(outflow)} {outflow.period} periods")
+    print(f"\nTop {peak_count} {outflow.period}s by outflow:")
+    for peak in outflow.peak_periods(peak_count):
+        print(f"  {peak['label']:<12} {peak['outflow']:>14,.0f} tokens ({peak['share_pct']:.1f}%)")
+    window = outflow.peak_window(peak_window)
+    if window:
+        print(f"\nHeaviest {window['periods']} consecutive {outflow.period}s: "
+              f"{window['start_label']} - {window['end_label']}, "
+              f"{window['outflow']:,.0f} tokens ({window['share_pct']:.1f}%)")
+
+
+def main():
+    """Treasury outflow of the funded projects"""
+    parser = argparse.ArgumentParser(description="Treasury-wide token outflow with staggered project starts")
+    parser.add_argument('--csv', default='Project-Catalyst-Fund-5-Developer-Ecosystem.csv',
+                        help='Funded projects CSV')
+    parser.add_argument('--approach', choices=('hybrid', 'pure'), default='hybrid')
+    parser.add_argument('--start-column', help='CSV column with ISO start dates or day offsets')
+    parser.add_argument('--epoch', type=date.fromisoformat,
+                        help='Date of day 0 (default: earliest start date)')
+    parser.add_argument('--stagger-days', type=int, default=0,
+                        help='Start rows without a start date this many days apart (CSV order)')
+    parser.add_argument('--period', choices=PERIODS, default='month')
+    parser.add_argument('--peaks', type=int, default=DEFAULT_PEAK_COUNT, help='Peak periods to report')
+    parser.add_argument('--peak-window', type=int, default=DEFAULT_PEAK_WINDOW,
+                        help='Consecutive periods for the heaviest-window report')
+    parser.add_argument('--output', help='Write the outflow series and peaks to this JSON file')
+    parser.add_argument('--dashboard-dir',
+                        help=f'Also write {DASHBOARD_FILENAME} for the dashboard under this directory')
+    args = parser.parse_args()
+
+    if args.approach == 'hybrid':
+        from token_distribution_hybrid import TOKEN_CONVERSION_RATE, current_vesting_config as current_config
+    else:
+        from token_distribution import TOKEN_CONVERSION_RATE, current_release_config as current_config
+
+    projects, epoch = funded_project_starts(
+        args.csv, TOKEN_CONVERSION_RATE, args.start_column, args.epoch, args.stagger_days
+    )
+    outflow = treasury_outflow(projects, current_config(), args.period, epoch)
+    print_outflow(outflow, args.peaks, args.peak_window)
+
+    report = dict(outflow.to_dict(args.peaks, args.peak_window), approach=args.approach)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nTreasury outflow written: {args.output}")
+    if args.dashboard_dir:
+        path = os.path.join(args.dashboard_dir, DASHBOARD_FILENAME)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, separators=(',', ':'))
+        print(f"Dashboard data exported: {path}")
+
+
+if __name__ == '__main__':
+    main()
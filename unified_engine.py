@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Unified Engine
+=============================================
+
+Produces the pure milestone and hybrid vesting outputs, plus their
+comparison, from a single pass over the funded projects CSV.
+
+Both approaches are configurations of the same schedule model
+(vesting_engine.VestingConfig):
+
+- Pure milestone: no cliff, no tail, pool k released at once at step k + 1,
+  pool weights equal to the milestone release increments
+  (token_distribution.current_release_config)
+- Hybrid: cliff, milestone pools vesting over several months and a tail
+  (token_distribution_hybrid.current_vesting_config)
+
+Comparison metrics follow the dashboard's scenario view: at month m the pure
+approach has completed min(m, milestones) milestones, the hybrid approach
+reports its cumulative vesting at month m. Every amount is linear in a
+project's tokens, so both unit curves are computed once and scaled per
+project.
+
+Usage:
+    python3 unified_engine.py
+    python3 unified_engine.py --dashboard-dir dashboard/data --compact-json
+"""
+
+import argparse
+import os
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import allocation_cache
+import dashboard_export
+import token_model
+import vesting_engine
+from allocation_cache import AllocationCache
+from json_export import write_json_export
+from token_distribution import TokenDistributionProcessor, TokenAllocation, current_release_config
+from token_distribution_hybrid import HybridVestingProcessor, current_vesting_config
+
+FULL_VESTING_TOLERANCE = 1e-9  # Cumulative fraction counted as fully vested
+
+
+def first_month_at(cumulative: List[float], fraction: float) -> int:
+    """First month whose cumulative unit fraction reaches fraction (-1 if never)"""
+    for month, value in enumerate(cumulative):
+        if value >= fraction - FULL_VESTING_TOLERANCE:
+            return month
+    return -1
+
+
+class UnifiedProcessor:
+    """Single-pass processor for both vesting approaches and their comparison"""
+
+    def __init__(self, csv_path: str):
+        self.csv_path = csv_path
+        self.pure = TokenDistributionProcessor(csv_path)
+        self.hybrid = HybridVestingProcessor(csv_path)
+        self.pure_config = current_release_config()
+        self.hybrid_config = current_vesting_config()
+        self.pure_curve, self.hybrid_curve = self.unit_curves()
+        # CSV line -> recomputed STATUS etc. (funding_selection) instead of the CSV's own
+        self.funding_overrides: Optional[Dict[int, Dict[str, str]]] = None
+
+    def process_all_projects(self, cache: AllocationCache = None):
+        """
+        Read the CSV once and calculate both allocation sets.
+
+        With a cache, only rows that changed since it was filled are
+        recalculated (one cache run per approach).
+        """
+        hybrid_allocations = []
+        if cache is not None:
+            projects = list(token_model.iter_funded_rows(self.csv_path, overrides=self.funding_overrides))
+            cache.begin_run('pure')
+            self.pure.allocations.extend(self.pure.allocate_with_cache(projects, cache))
+            cache_stats = cache.finish_run()
+            allocation_cache.print_cache_report(cache_stats)
+            self.pure.report.add_cache_stats(cache_stats)
+            cache.begin_run('hybrid')
+            hybrid_allocations = self.hybrid.allocate_with_cache(projects, cache)
+            cache_stats = cache.finish_run()
+            allocation_cache.print_cache_report(cache_stats)
+            self.hybrid.report.add_cache_stats(cache_stats)
+        else:
+            for project in token_model.iter_funded_rows(self.csv_path, overrides=self.funding_overrides):
+                self.pure.allocations.append(self.pure.calculate_token_allocation(project))
+                hybrid_allocations.append(
+                    self.hybrid.calculate_hybrid_allocation(project, include_timeline=False)
+                )
+
+        self.hybrid.attach_timelines(hybrid_allocations)
+        self.hybrid.allocations.extend(hybrid_allocations)
+
+        print(f"Calculated pure and hybrid allocations for {len(self.pure.allocations)} projects")
+
+    def unit_curves(self) -> Tuple[List[float], List[float]]:
+        """
+        Cumulative vested fraction per month of both approaches.
+
+        Curves span the hybrid timeline; the pure curve stays flat once every
+        milestone has been released.
+        """
+        pure = vesting_engine.schedule_template(self.pure_config).cumulative_fraction
+        hybrid = vesting_engine.schedule_template(self.hybrid_config).cumulative_fraction
+        num_months = max(len(pure), len(hybrid))
+        pad = lambda curve: list(curve) + [curve[-1]] * (num_months - len(curve))
+        return pad(pure), pad(hybrid)
+
+    def compare(self, total_tokens: float) -> Dict[str, Any]:
+        """Month-by-month comparison of both approaches for an allocation size"""
+        pure_curve, hybrid_curve = self.pure_curve, self.hybrid_curve
+        pure_vested = [total_tokens * f for f in pure_curve]
+        hybrid_vested = [total_tokens * f for f in hybrid_curve]
+        difference = [p - h for p, h in zip(pure_vested, hybrid_vested)]
+        max_month = max(range(len(difference)), key=lambda m: difference[m])
+
+        return {
+            'pure_vested': pure_vested,
+            'hybrid_vested': hybrid_vested,
+            'pure_vested_pct': [f * 100 for f in pure_curve],
+            'hybrid_vested_pct': [f * 100 for f in hybrid_curve],
+            'difference_tokens': difference,
+            'difference_pct': [(p - h) * 100 for p, h in zip(pure_curve, hybrid_curve)],
+            'metrics': {
+                'months_pure_ahead': sum(1 for d in difference if d > 0),
+                'max_difference_tokens': difference[max_month],
+                'max_difference_month': max_month,
+                'pure_full_vesting_month': first_month_at(pure_curve, 1.0),
+                'hybrid_full_vesting_month': first_month_at(hybrid_curve, 1.0),
+                'pure_half_vesting_month': first_month_at(pure_curve, 0.5),
+                'hybrid_half_vesting_month': first_month_at(hybrid_curve, 0.5)
+            }
+        }
+
+    def comparison_to_json(self, alloc: TokenAllocation) -> Dict[str, Any]:
+        """Comparison export entry of one project"""
+        return {
+            'proposal_name': alloc.proposal_name,
+            'requested_funding_usd': alloc.requested_funding_usd,
+            'total_tokens': alloc.total_tokens,
+            'token_distribution': {
+                'project_tokens': alloc.project_tokens,
+                'participant_tokens': alloc.participant_tokens,
+                'auditor_tokens': alloc.auditor_tokens
+            },
+            **self.compare(alloc.total_tokens)
+        }
+
+    def comparison_metadata(self) -> Dict[str, Any]:
+        """Metadata block of the comparison exports"""
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'framework_version': '2.0-unified',
+            'pure_configuration': asdict(self.pure_config),
+            'hybrid_configuration': asdict(self.hybrid_config),
+            'month_labels': [f"M{month}" for month in range(len(self.pure_curve))]
+        }
+
+    def comparison_summary(self) -> Dict[str, Any]:
+        """Portfolio-level comparison"""
+        total_tokens = sum(a.total_tokens for a in self.pure.allocations)
+        return {
+            'total_projects': len(self.pure.allocations),
+            'total_tokens': total_tokens,
+            **self.compare(total_tokens)
+        }
+
+    def export_comparison_json(self, output_path: str, compact: bool = False, compress: bool = False):
+        """Export per-project and portfolio comparison metrics"""
+        header = {
+            'metadata': self.comparison_metadata(),
+            'summary': self.comparison_summary()
+        }
+        write_json_export(
+            output_path,
+            header,
+            (self.comparison_to_json(alloc) for alloc in self.pure.allocations),
+            compact=compact,
+            compress=compress
+        )
+        print(f"JSON export completed: {output_path}")
+
+    def export_dashboard_data(self, output_dir: str):
+        """Export sharded dashboard data for both approaches and the comparison"""
+        dirnames = dashboard_export.APPROACH_DIRNAMES
+        self.pure.export_dashboard_data(os.path.join(output_dir, dirnames['pure']))
+        self.hybrid.export_dashboard_data(os.path.join(output_dir, dirnames['hybrid']))
+
+        summary = self.comparison_summary()
+        comparison_dir = os.path.join(output_dir, dirnames['comparison'])
+        count = dashboard_export.write_dashboard_data(
+            comparison_dir,
+            {'metadata': self.comparison_metadata(), 'summary': summary},
+            (self.comparison_to_json(alloc) for alloc in self.pure.allocations),
+            {
+                'labels': [f"M{month}" for month in range(len(self.pure_curve))],
+                'pure': summary['pure_vested'],
+                'hybrid': summary['hybrid_vested']
+            }
+        )
+        print(f"Dashboard data exported: {comparison_dir} ({count} project shards)")
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Token Distribution Framework - Unified Engine")
+    parser.add_argument('--csv', default='Project-Catalyst-Fund-5-Developer-Ecosystem.csv',
+                        help='Funded projects CSV')
+    parser.add_argument('--compact-json', action='store_true',
+                        help='Write the JSON exports without indentation')
+    parser.add_argument('--gzip-json', action='store_true',
+                        help='Gzip the JSON exports (.json.gz)')
+    parser.add_argument('--dashboard-dir',
+                        help='Also write sharded dashboard data under this directory (e.g. dashboard/data)')
+    parser.add_argument('--cache', help='Allocation cache file; reruns only recompute changed rows')
+    args = parser.parse_args()
+
+    print("Token Distribution Framework - Unified Engine")
+    print("Pure Milestone + Hybrid Vesting in one pass\n")
+
+    processor = UnifiedProcessor(args.csv)
+    if args.cache:
+        with AllocationCache(args.cache) as cache:
+            processor.process_all_projects(cache)
+    else:
+        processor.process_all_projects()
+
+    suffix = '.json' + ('.gz' if args.gzip_json else '')
+    json_options = {'compact': args.compact_json, 'compress': args.gzip_json}
+    outputs = [
+        'token_allocations_output.csv',
+        'token_allocations_output' + suffix,
+        'token_allocations_hybrid_output.csv',
+        'token_allocations_hybrid_output' + suffix,
+        'token_allocations_comparison' + suffix
+    ]
+    processor.pure.export_to_csv(outputs[0])
+    processor.pure.export_to_json(outputs[1], **json_options)
+    processor.hybrid.export_to_csv(outputs[2])
+    processor.hybrid.export_to_json(outputs[3], **json_options)
+    processor.export_comparison_json(outputs[4], **json_options)
+    if args.dashboard_dir:
+        processor.export_dashboard_data(args.dashboard_dir)
+        outputs.append(f"{args.dashboard_dir}/")
+
+    print("\nProcessing complete!")
+    print("Generated files:")
+    for path in outputs:
+        print(f"  - {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Unlock Scheduler
+===============================================
+
+Merged, time-ordered stream of every unlock and vesting payment across all
+projects, for payout batching:
+
+- pool_unlock:  a milestone unlocks its token pool
+- pool_vest:    a monthly payment from an unlocked milestone pool
+- tail_vest:    a monthly tail payment
+
+Events follow the monthly timeline: month m of a project is paid on day
+start_day + m * days_per_month, and the payments of a project add up to its
+monthly timeline's vested_this_month.
+
+Each project's events are its start day plus the configuration's unit
+events, which are computed once and already sorted, so a project is just a
+cursor into that list. A heap k-way merges the project cursors lazily:
+starting a query costs O(P) (heapify, after an O(log E) bisect per
+project), and each event returned costs O(log P). Nothing is materialized
+beyond the events actually consumed.
+
+Usage:
+    python3 unlock_scheduler.py --after 45 --next 20
+    python3 unlock_scheduler.py --window 30 90 --output payouts.csv
+"""
+
+import argparse
+import bisect
+import csv
+import functools
+import heapq
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from vesting_engine import TEMPLATE_CACHE_SIZE, VestingConfig, schedule_template
+
+EVENT_KINDS = ('pool_unlock', 'pool_vest', 'tail_vest')
+TAIL_LABEL = 'tail'
+
+
+@dataclass(frozen=True)
+class ScheduledProject:
+    """A project in the scheduler: start day and category token allocations"""
+    name: str
+    start_day: int
+    project_tokens: float
+    participant_tokens: float
+    auditor_tokens: float
+
+
+@dataclass(frozen=True)
+class PayoutEvent:
+    """One unlock or payment of one project"""
+    day: int
+    project: str
+    kind: str            # pool_unlock, pool_vest, tail_vest
+    label: str           # milestone name or 'tail'
+    project_tokens: float
+    participant_tokens: float
+    auditor_tokens: float
+
+    @property
+    def total_tokens(self) -> float:
+        return self.project_tokens + self.participant_tokens + self.auditor_tokens
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def unit_events(config: VestingConfig) -> Tuple[Tuple[int, str, str, float], ...]:
+    """
+    Sorted (day offset, kind, label, fraction) events of one unit allocation.
+
+    Follows schedule_template: pools unlock only past the cliff and inside
+    the timeline, nothing vests in month 0 or before the cliff, each pool
+    pays for milestone_vesting_months from max(unlock month, 1) and the tail
+    pays after the milestone period.
+    """
+    template = schedule_template(config)
+    num_months = config.num_months
+
+    def paid(month: int) -> bool:
+        return 0 < month < num_months and template.past_cliff[month]
+
+    events = []
+    for name, unlock_month, pool_fraction, monthly_fraction in template.pools:
+        if not 0 <= unlock_month < num_months or not template.past_cliff[unlock_month]:
+            continue
+        events.append((unlock_month, 'pool_unlock', name, pool_fraction))
+        start = max(unlock_month, 1)
+        for month in range(start, start + config.milestone_vesting_months):
+            if paid(month):
+                events.append((month, 'pool_vest', name, monthly_fraction))
+
+    if config.tail_vesting_months > 0:
+        tail_fraction = config.tail_vesting_ratio / config.tail_vesting_months
+        for month in range(config.milestone_period_months + 1, num_months):
+            if paid(month):
+                events.append((month, 'tail_vest', TAIL_LABEL, tail_fraction))
+
+    # Stable sort keeps unlocks ahead of payments within a month
+    events.sort(key=lambda event: event[0])
+    return tuple((month * config.days_per_month, kind, label, fraction) for month, kind, label, fraction in events)
+
+
+class UnlockScheduler:
+    """Lazy k-way merge of every project's unlock and vesting events"""
+
+    def __init__(self, projects: Sequence[ScheduledProject], config: VestingConfig):
+        self.projects = list(projects)
+        self.config = config
+        self.events = unit_events(config)
+        self._offsets = [event[0] for event in self.events]
+
+    def __len__(self) -> int:
+        """Total number of events over all projects"""
+        return len(self.projects) * len(self.events)
+
+    def _event(self, project_index: int, event_index: int) -> PayoutEvent:
+        project = self.projects[project_index]
+        offset, kind, label, fraction = self.events[event_index]
+        return PayoutEvent(
+            day=project.start_day + offset,
+            project=project.name,
+            kind=kind,
+            label=label,
+            project_tokens=project.project_tokens * fraction,
+            participant_tokens=project.participant_tokens * fraction,
+            auditor_tokens=project.auditor_tokens * fraction
+        )
+
+    def iter_events(self, after: Optional[int] = None, before: Optional[int] = None) -> Iterator[PayoutEvent]:
+        """
+        Yield events with after <= day < before in time order.
+
+        Ties are ordered by project (input order), then by schedule order.
+        Either bound may be omitted.
+        """
+        heap = []
+        for p, project in enumerate(self.projects):
+            first = 0 if after is None else bisect.bisect_left(self._offsets, after - project.start_day)
+            if first < len(self.events):
+                heap.append((project.start_day + self._offsets[first], p, first))
+        heapq.heapify(heap)
+
+        while heap:
+            day, p, i = heap[0]
+            if before is not None and day >= before:
+                return
+            yield self._event(p, i)
+            if i + 1 < len(self.events):
+                heapq.heapreplace(heap, (self.projects[p].start_day + self._offsets[i + 1], p, i + 1))
+            else:
+                heapq.heappop(heap)
+
+    def next_events(self, after: int, count: int) -> List[PayoutEvent]:
+        """The next count events on or after day after"""
+        events = []
+        for event in self.iter_events(after=after):
+            if len(events) == count:
+                break
+            events.append(event)
+        return events
+
+    def window(self, start: int, end: int) -> List[PayoutEvent]:
+        """Every event in [start, end)"""
+        return list(self.iter_events(after=start, before=end))
+
+
+def write_events_csv(output_path: str, events: Iterator[PayoutEvent]) -> int:
+    """Write events as CSV rows; returns the number written"""
+    count = 0
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            'Day', 'Project', 'Event', 'Label',
+            'Project Tokens', 'Participant Tokens', 'Auditor Tokens', 'Total Tokens'
+        ])
+        for event in events:
+            writer.writerow([
+                event.day, event.project, event.kind, event.label,
+                f"{event.project_tokens:.2f}", f"{event.participant_tokens:.2f}",
+                f"{event.auditor_tokens:.2f}", f"{event.total_tokens:.2f}"
+            ])
+            count += 1
+    return count
+
+
+def main():
+    """Query the merged unlock and payment stream of the funded projects"""
+    from token_distribution_hybrid import HybridVestingProcessor, current_vesting_config
+
+    parser = argparse.ArgumentParser(description="Merged unlock and vesting event stream across projects")
+    parser.add_argument('--csv', default='Project-Catalyst-Fund-5-Developer-Ecosystem.csv',
+                        help='Funded projects CSV')
+    parser.add_argument('--stagger-days', type=int, default=0,
+                        help='Start projects this many days apart (CSV order)')
+    parser.add_argument('--after', type=int, default=0, help='Day from which to list events')
+    parser.add_argument('--next', type=int, default=20, dest='count', help='Number of events to list')
+    parser.add_argument('--window', type=int, nargs=2, metavar=('START', 'END'),
+                        help='List every event in [START, END) instead')
+    parser.add_argument('--output', help='Write the selected events to this CSV instead of printing them')
+    args = parser.parse_args()
+
+    processor = HybridVestingProcessor(args.csv)
+    projects = []
+    for i, project in enumerate(processor.iter_funded_projects()):
+        alloc = processor.calculate_hybrid_allocation(project, include_timeline=False)
+        projects.append(ScheduledProject(
+            alloc.proposal_name, i * args.stagger_days,
+            alloc.project_tokens, alloc.participant_tokens, alloc.auditor_tokens
+        ))
+    scheduler = UnlockScheduler(projects, current_vesting_config())
+
+    if args.window:
+        events = scheduler.iter_events(after=args.window[0], before=args.window[1])
+    else:
+        events = iter(scheduler.next_events(args.after, args.count))
+
+    if args.output:
+        count = write_events_csv(args.output, events)
+        print(f"{count} events written: {args.output}")
+        return
+
+    print(f"{'Day':>5}  {'Event':<12} {'Label':<20} {'Tokens':>12}  Project")
+    for event in events:
+        print(f"{event.day:>5}  {event.kind:<12} {event.label:<20} {event.total_tokens:>12,.2f}  {event.project}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Vectorized Vesting Engine
+========================================================
+
+Array engine for the hybrid (Cliff + Milestone + Linear) vesting model.
+Instead of walking every project month by month, the engine builds the
+unit vesting curve of the configuration once and evaluates the whole
+portfolio as (project x month x category) arrays:
+
+- new_unlocked:       tokens unlocked by milestones in each month
+- vested_this_month:  tokens vested in each month (pools + tail)
+- cumulative_vested:  running total of vested tokens
+- vested_pct:         cumulative vested as % of each category allocation
+
+Categories are ordered as in CATEGORIES (project, participant, auditor).
+
+Every amount in the model is linear in a category's token allocation, so
+the unit schedule of a configuration (amounts per token) is computed once,
+kept in an LRU cache (schedule_template) and scaled per project.
+
+NumPy is optional: the schedule templates are plain Python, and the scripts
+scale them per project when NumPy is not installed (see HAS_NUMPY).
+"""
+
+import functools
+import math
+from functools import cached_property
+from dataclasses import dataclass
+from typing import List, Tuple, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, callers check HAS_NUMPY
+    np = None
+
+HAS_NUMPY = np is not None
+
+CATEGORIES = ('project', 'participant', 'auditor')
+TEMPLATE_CACHE_SIZE = 128  # Distinct vesting configurations kept in memory
+
+
+@dataclass(frozen=True)
+class VestingConfig:
+    """Hybrid vesting parameters shared by every project in a run"""
+    cliff_period_days: int
+    milestone_period_months: int
+    tail_vesting_months: int
+    tail_vesting_ratio: float
+    milestone_vesting_months: int
+    # (milestone name, target month) pairs, in unlock order
+    milestones: Tuple[Tuple[str, int], ...]
+    days_per_month: int = 30
+    # Relative size of each milestone pool; empty means equal pools
+    pool_weights: Tuple[float, ...] = ()
+
+    @property
+    def total_duration_months(self) -> int:
+        return self.milestone_period_months + self.tail_vesting_months
+
+    @property
+    def num_months(self) -> int:
+        """Number of timeline rows (months 0..total_duration inclusive)"""
+        return self.total_duration_months + 1
+
+
+def pool_fractions(config: VestingConfig) -> Tuple[float, ...]:
+    """Fraction of an allocation in each milestone pool (the non-tail share split by pool_weights)"""
+    num_milestones = len(config.milestones)
+    weights = config.pool_weights or (1.0,) * num_milestones
+    if len(weights) != num_milestones:
+        raise ValueError(f"Expected {num_milestones} pool weights, got {len(weights)}")
+    total_weight = sum(weights)
+    share = 1.0 - config.tail_vesting_ratio
+    return tuple(share * weight / total_weight for weight in weights)
+
+
+@dataclass(frozen=True)
+class ScheduleTemplate:
+    """Unit vesting schedule of a configuration, per token of a category allocation"""
+    config: VestingConfig
+    # (milestone name, unlock month, pool fraction, monthly vest fraction)
+    pools: Tuple[Tuple[str, int, float, float], ...]
+    days_elapsed: Tuple[int, ...]
+    past_cliff: Tuple[bool, ...]
+    milestones_achieved: Tuple[Tuple[str, ...], ...]
+    unlock_fraction: Tuple[float, ...]
+    vest_fraction: Tuple[float, ...]
+    cumulative_fraction: Tuple[float, ...]
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def schedule_template(config: VestingConfig) -> ScheduleTemplate:
+    """
+    Build (or fetch from the LRU cache) the unit schedule for a configuration.
+
+    Mirrors the rules of the per-project monthly loop: milestone pools only
+    unlock once past the cliff, nothing vests in month 0, each pool vests
+    for milestone_vesting_months starting in its unlock month and tail
+    vesting runs after the milestone period.
+    """
+    num_months = config.num_months
+    days_elapsed = tuple(month * config.days_per_month for month in range(num_months))
+    past_cliff = tuple(days >= config.cliff_period_days for days in days_elapsed)
+
+    unlock_fraction = [0.0] * num_months
+    vest_fraction = [0.0] * num_months
+    milestones_achieved: List[List[str]] = [[] for _ in range(num_months)]
+
+    pools = []
+    for (name, unlock_month), pool_fraction in zip(config.milestones, pool_fractions(config)):
+        monthly_pool_fraction = pool_fraction / config.milestone_vesting_months
+        pools.append((name, unlock_month, pool_fraction, monthly_pool_fraction))
+        if not 0 <= unlock_month < num_months or not past_cliff[unlock_month]:
+            continue
+        unlock_fraction[unlock_month] += pool_fraction
+        milestones_achieved[unlock_month].append(name)
+
+        # Pool vests in its first open month and the following ones
+        start = max(unlock_month, 1)
+        for month in range(start, min(start + config.milestone_vesting_months, num_months)):
+            vest_fraction[month] += monthly_pool_fraction
+
+    if config.tail_vesting_months > 0:
+        tail_monthly_fraction = config.tail_vesting_ratio / config.tail_vesting_months
+        for month in range(config.milestone_period_months + 1, num_months):
+            vest_fraction[month] += tail_monthly_fraction
+
+    # Nothing vests before the cliff or in month 0
+    for month in range(num_months):
+        if month == 0 or not past_cliff[month]:
+            vest_fraction[month] = 0.0
+
+    cumulative_fraction = []
+    running = 0.0
+    for fraction in vest_fraction:
+        running += fraction
+        cumulative_fraction.append(running)
+
+    return ScheduleTemplate(
+        config=config,
+        pools=tuple(pools),
+        days_elapsed=days_elapsed,
+        past_cliff=past_cliff,
+        milestones_achieved=tuple(tuple(names) for names in milestones_achieved),
+        unlock_fraction=tuple(unlock_fraction),
+        vest_fraction=tuple(vest_fraction),
+        cumulative_fraction=tuple(cumulative_fraction)
+    )
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def closed_form_terms(config: VestingConfig):
+    """
+    Linear terms of the cumulative vesting curve of a configuration.
+
+    Returns (pool_terms, tail_term) where each term is (first vesting month,
+    number of vesting months, fraction vested per month). Cumulative vesting
+    at month m is then sum(rate * clamp(m - start + 1, 0, months)).
+    """
+    # First month in which anything can vest: past the cliff and after month 0
+    first_open = max(1, -(-config.cliff_period_days // config.days_per_month))
+    last_month = config.total_duration_months
+
+    pool_terms = []
+    for (_, unlock_month), pool_fraction in zip(config.milestones, pool_fractions(config)):
+        # Pools unlocking before the cliff or after the timeline never vest
+        if unlock_month < 0 or unlock_month > last_month:
+            continue
+        if unlock_month * config.days_per_month < config.cliff_period_days:
+            continue
+        start = max(unlock_month, 1)
+        months = min(config.milestone_vesting_months, last_month - start + 1)
+        pool_terms.append((start, months, pool_fraction / config.milestone_vesting_months))
+
+    tail_term = (0, 0, 0.0)
+    if config.tail_vesting_months > 0:
+        start = max(config.milestone_period_months + 1, first_open)
+        tail_term = (
+            start,
+            max(0, last_month - start + 1),
+            config.tail_vesting_ratio / config.tail_vesting_months
+        )
+
+    return tuple(pool_terms), tail_term
+
+
+def vested_fraction_at(config: VestingConfig, day: float) -> float:
+    """
+    Fraction of a category allocation vested at a given day, in closed form.
+
+    Vesting is credited at the start of each month (day month * days_per_month),
+    matching the monthly timeline; after the last month the curve stays flat
+    (also for day=inf). Raises ValueError for NaN.
+    """
+    if math.isnan(day):
+        raise ValueError("vested_fraction_at: day is NaN")
+    if day < 0:
+        return 0.0
+    # Cap before dividing so huge or infinite days land on the flat end of the curve
+    day = min(day, config.total_duration_months * config.days_per_month)
+    month = int(day // config.days_per_month)
+    pool_terms, (tail_start, tail_months, tail_rate) = closed_form_terms(config)
+
+    fraction = 0.0
+    for start, months, rate in pool_terms:
+        fraction += rate * min(max(month - start + 1, 0), months)
+    fraction += tail_rate * min(max(month - tail_start + 1, 0), tail_months)
+    return fraction
+
+
+def vested_fraction_batch(config: VestingConfig, days: Sequence[float]) -> 'np.ndarray':
+    """Vectorized vested_fraction_at over an array of days (ValueError if any is NaN)"""
+    _require_numpy()
+    days = np.asarray(days, dtype=np.float64)
+    if np.isnan(days).any():
+        raise ValueError("vested_fraction_batch: days contain NaN")
+    capped = np.minimum(days, config.total_duration_months * config.days_per_month)
+    months = np.floor(capped / config.days_per_month)
+    pool_terms, (tail_start, tail_months, tail_rate) = closed_form_terms(config)
+
+    fraction = np.zeros(days.shape)
+    for start, months_vesting, rate in pool_terms:
+        fraction += rate * np.clip(months - start + 1, 0, months_vesting)
+    fraction += tail_rate * np.clip(months - tail_start + 1, 0, tail_months)
+    return np.where(days < 0, 0.0, fraction)
+
+
+@dataclass
+class PortfolioTimeline:
+    """Vesting timelines for a whole portfolio as dense arrays"""
+    category_tokens: 'np.ndarray'     # (projects, 3)
+    days_elapsed: 'np.ndarray'        # (months,)
+    past_cliff: 'np.ndarray'          # (months,) bool
+    milestones_achieved: List[List[str]]  # per month, shared by all projects
+    new_unlocked: 'np.ndarray'        # (projects, months, 3)
+    vested_this_month: 'np.ndarray'   # (projects, months, 3)
+    cumulative_vested: 'np.ndarray'   # (projects, months, 3)
+    vested_pct: 'np.ndarray'          # (projects, months, 3)
+    total_vested_pct: 'np.ndarray'    # (projects, months)
+
+    @property
+    def num_projects(self) -> int:
+        return self.category_tokens.shape[0]
+
+    @cached_property
+    def snapshot_columns(self) -> 'np.ndarray':
+        """
+        (projects, 13, months) array with one row per float snapshot field:
+        new unlocked, vested this month, cumulative vested and vested % for
+        each category, then total vested %.
+        """
+        columns = np.concatenate([
+            self.new_unlocked.transpose(0, 2, 1),
+            self.vested_this_month.transpose(0, 2, 1),
+            self.cumulative_vested.transpose(0, 2, 1),
+            self.vested_pct.transpose(0, 2, 1),
+            self.total_vested_pct[:, None, :]
+        ], axis=1)
+        return np.ascontiguousarray(columns)
+
+    @property
+    def num_months(self) -> int:
+        return self.days_elapsed.shape[0]
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("vesting_engine requires NumPy (pip install numpy)")
+
+
+def unit_curves(config: VestingConfig):
+    """
+    Return the cached unit schedule of a configuration as NumPy arrays.
+
+    Returns (unlock_fraction, vest_fraction, past_cliff, days_elapsed,
+    milestones_achieved) where the fractions are expressed per token of a
+    category allocation.
+    """
+    _require_numpy()
+    template = schedule_template(config)
+    return (
+        np.array(template.unlock_fraction),
+        np.array(template.vest_fraction),
+        np.array(template.past_cliff),
+        np.array(template.days_elapsed),
+        [list(names) for names in template.milestones_achieved]
+    )
+
+
+def compute_portfolio_timeline(
+    category_tokens: Sequence[Sequence[float]],
+    config: VestingConfig
+) -> PortfolioTimeline:
+    """
+    Compute vesting timelines for all projects at once.
+
+    category_tokens is a (projects, 3) array-like of project, participant
+    and auditor token allocations.
+    """
+    _require_numpy()
+    tokens = np.asarray(category_tokens, dtype=np.float64).reshape(-1, len(CATEGORIES))
+    unlock_fraction, vest_fraction, past_cliff, days_elapsed, milestones_achieved = unit_curves(config)
+
+    new_unlocked = tokens[:, None, :] * unlock_fraction[None, :, None]
+    vested_this_month = tokens[:, None, :] * vest_fraction[None, :, None]
+    cumulative_vested = np.cumsum(vested_this_month, axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vested_pct = np.where(
+            tokens[:, None, :] > 0,
+            cumulative_vested / tokens[:, None, :] * 100,
+            0.0
+        )
+        total_tokens = tokens.sum(axis=1)
+        total_vested_pct = np.where(
+            total_tokens[:, None] > 0,
+            cumulative_vested.sum(axis=2) / total_tokens[:, None] * 100,
+            0.0
+        )
+
+    return PortfolioTimeline(
+        category_tokens=tokens,
+        days_elapsed=days_elapsed,
+        past_cliff=past_cliff,
+        milestones_achieved=milestones_achieved,
+        new_unlocked=new_unlocked,
+        vested_this_month=vested_this_month,
+        cumulative_vested=cumulative_vested,
+        vested_pct=vested_pct,
+        total_vested_pct=total_vested_pct
+    )
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Event-Based Vesting Engine
+=========================================================
+
+Resolution-agnostic form of the hybrid vesting model. A schedule is stored
+as a handful of sparse events instead of dense per-period rows:
+
+- cliff_end:      the cliff period is over
+- pool_unlock:    a milestone unlocks its token pool
+- segment_start:  a linear vesting segment (milestone pool or tail) begins
+- segment_end:    a linear vesting segment ends
+
+Vesting accrues continuously (per day, or per slot) along the linear
+segments, so after the cliff the cumulative vested curve is piecewise linear
+and fully described by its breakpoints. Any resolution (slots, days, weeks, months)
+is produced on demand by interpolating between breakpoints, so daily output
+for a multi-year schedule costs memory only for the window requested.
+
+Time is measured in days from the project start. Amounts are unit fractions
+of a category allocation (see vesting_engine.schedule_template); multiply by
+the category tokens to get token amounts.
+
+Relation to the monthly timeline: like vesting_engine.vested_fraction_at
+(and every other day-based API), the curve credits month m by day
+m * days_per_month. Month m's share accrues linearly over the month before
+it, [(m - 1) * dpm, m * dpm], so sampling at day m * days_per_month gives the
+cumulative value of row m exactly and days in between are interpolated.
+Nothing vests before the cliff: accrual that would fall inside it is
+released in one step at the cliff end.
+"""
+
+import bisect
+import functools
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+from vesting_engine import VestingConfig, TEMPLATE_CACHE_SIZE, np, pool_fractions
+
+SECONDS_PER_DAY = 86400
+SLOT_LENGTH_SECONDS = 1  # Cardano Shelley-era slot length
+DAYS_PER_SLOT = SLOT_LENGTH_SECONDS / SECONDS_PER_DAY
+
+
+@dataclass(frozen=True)
+class VestingEvent:
+    """A single breakpoint in a vesting schedule"""
+    day: float
+    kind: str        # cliff_end, pool_unlock, segment_start, segment_end
+    label: str       # milestone name, 'tail' or 'cliff'
+    amount: float    # unlocked fraction (pool_unlock), fraction per day (segments)
+                     # or fraction released at the cliff end (cliff_end)
+
+
+@dataclass(frozen=True)
+class EventSchedule:
+    """Sparse unit vesting schedule with piecewise-linear cumulative curve"""
+    events: Tuple[VestingEvent, ...]
+    # Breakpoints of the cumulative vested curve (piecewise linear from the first
+    # breakpoint, the cliff end; zero before it)
+    vested_days: Tuple[float, ...]
+    vested_fraction_points: Tuple[float, ...]
+    # Steps of the cumulative unlocked curve
+    unlock_days: Tuple[float, ...]
+    unlocked_fraction_points: Tuple[float, ...]
+
+    @property
+    def end_day(self) -> float:
+        """Day on which the last segment finishes vesting"""
+        return self.vested_days[-1]
+
+    def vested_fraction(self, day: float) -> float:
+        """Fraction vested at a day (any resolution), O(log events)"""
+        days = self.vested_days
+        if day < days[0]:
+            return 0.0
+        if day >= days[-1]:
+            return self.vested_fraction_points[-1]
+        i = bisect.bisect_right(days, day)
+        d0, d1 = days[i - 1], days[i]
+        v0, v1 = self.vested_fraction_points[i - 1], self.vested_fraction_points[i]
+        return v0 + (v1 - v0) * (day - d0) / (d1 - d0)
+
+    def unlocked_fraction(self, day: float) -> float:
+        """Fraction unlocked by milestones at a day"""
+        i = bisect.bisect_right(self.unlock_days, day)
+        return self.unlocked_fraction_points[i - 1] if i else 0.0
+
+    def iter_expand(
+        self,
+        start_day: float = 0.0,
+        end_day: float = None,
+        step_days: float = 1.0
+    ) -> Iterator[Tuple[float, float]]:
+        """Yield (day, cumulative vested fraction) at a fixed resolution in constant memory"""
+        if end_day is None:
+            end_day = self.end_day
+        i = 0
+        while True:
+            day = start_day + i * step_days
+            if day > end_day:
+                return
+            yield day, self.vested_fraction(day)
+            i += 1
+
+    def expand(
+        self,
+        start_day: float = 0.0,
+        end_day: float = None,
+        step_days: float = 1.0
+    ):
+        """
+        Dense (days, cumulative vested fraction) arrays at a fixed resolution.
+
+        Uses NumPy interpolation over the breakpoints when available,
+        otherwise returns two lists built from iter_expand.
+        """
+        if end_day is None:
+            end_day = self.end_day
+        if np is None:
+            pairs = list(self.iter_expand(start_day, end_day, step_days))
+            return [p[0] for p in pairs], [p[1] for p in pairs]
+
+        count = int(np.floor((end_day - start_day) / step_days + 1e-9)) + 1
+        days = start_day + np.arange(max(count, 0)) * step_days
+        vested = np.interp(days, self.vested_days, self.vested_fraction_points, left=0.0)
+        return days, vested
+
+
+def _segments(config: VestingConfig) -> List[Tuple[float, float, float, str]]:
+    """
+    Linear vesting segments as (start_day, end_day, fraction_per_day, label).
+
+    A segment crediting months [start, end) accrues over the month before
+    each credit, i.e. days [(start - 1) * dpm, (end - 1) * dpm].
+    """
+    dpm = config.days_per_month
+    num_months = config.num_months
+
+    # First month in which anything vests: past the cliff and after month 0
+    first_open = max(1, -(-config.cliff_period_days // dpm))
+
+    segments = []
+    for (name, unlock_month), pool_fraction in zip(config.milestones, pool_fractions(config)):
+        if not 0 <= unlock_month < num_months or unlock_month * dpm < config.cliff_period_days:
+            continue
+        monthly_pool_fraction = pool_fraction / config.milestone_vesting_months
+        start = max(unlock_month, 1)
+        end = min(start + config.milestone_vesting_months, num_months)
+        if end > start:
+            segments.append(((start - 1) * dpm, (end - 1) * dpm, monthly_pool_fraction / dpm, name))
+
+    if config.tail_vesting_months > 0:
+        start = max(config.milestone_period_months + 1, first_open)
+        if num_months > start:
+            tail_monthly = config.tail_vesting_ratio / config.tail_vesting_months
+            segments.append(((start - 1) * dpm, (num_months - 1) * dpm, tail_monthly / dpm, 'tail'))
+
+    return segments
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def event_schedule(config: VestingConfig) -> EventSchedule:
+    """Build (or fetch from the LRU cache) the sparse event schedule of a configuration"""
+    dpm = config.days_per_month
+    cliff_day = float(config.cliff_period_days)
+
+    # Accrual inside the cliff is released in one step at its end
+    segments = []
+    cliff_release = 0.0
+    for start, end, rate, label in _segments(config):
+        if start < cliff_day:
+            cliff_release += rate * (min(end, cliff_day) - start)
+            start = cliff_day
+        if end > start:
+            segments.append((start, end, rate, label))
+
+    events = [VestingEvent(cliff_day, 'cliff_end', 'cliff', cliff_release)]
+
+    unlock_totals = {}
+    for (name, unlock_month), pool_fraction in zip(config.milestones, pool_fractions(config)):
+        if not 0 <= unlock_month < config.num_months or unlock_month * dpm < config.cliff_period_days:
+            continue
+        day = float(unlock_month * dpm)
+        events.append(VestingEvent(day, 'pool_unlock', name, pool_fraction))
+        unlock_totals[day] = unlock_totals.get(day, 0.0) + pool_fraction
+
+    # Sweep segment boundaries to get the cumulative curve at each breakpoint
+    rate_changes = {}
+    for start, end, rate, label in segments:
+        events.append(VestingEvent(float(start), 'segment_start', label, rate))
+        events.append(VestingEvent(float(end), 'segment_end', label, rate))
+        rate_changes[start] = rate_changes.get(start, 0.0) + rate
+        rate_changes[end] = rate_changes.get(end, 0.0) - rate
+
+    vested_days = [cliff_day]
+    vested_points = [cliff_release]
+    rate = 0.0
+    for day in sorted(rate_changes):
+        if day > vested_days[-1]:
+            vested_points.append(vested_points[-1] + rate * (day - vested_days[-1]))
+            vested_days.append(float(day))
+        rate += rate_changes[day]
+
+    unlock_days = []
+    unlocked_points = []
+    running = 0.0
+    for day in sorted(unlock_totals):
+        running += unlock_totals[day]
+        unlock_days.append(day)
+        unlocked_points.append(running)
+
+    events.sort(key=lambda e: (e.day, e.kind != 'cliff_end'))
+    return EventSchedule(
+        events=tuple(events),
+        vested_days=tuple(vested_days),
+        vested_fraction_points=tuple(vested_points),
+        unlock_days=tuple(unlock_days),
+        unlocked_fraction_points=tuple(unlocked_points)
+    )
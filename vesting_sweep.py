@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Vesting Parameter Sweep
+======================================================
+
+Evaluates the hybrid vesting model for whole grids of configurations at
+once. Each configuration's unit vesting curve is built as one row of a
+(configs x months) array, following the same rules as
+vesting_engine.schedule_template, and portfolio metrics are reduced along
+the month axis:
+
+- peak_monthly_outflow:   largest number of tokens vesting in one month
+- peak_month:             month in which that peak occurs
+- months_to_half_vested:  first month by which 50% of tokens have vested (-1: never)
+- tail_share:             share of vested tokens that vest in the tail period
+- final_vested_pct:       % of tokens vested by the end of the timeline
+- unvested_tokens:        tokens never vested (pools unlocking before the cliff)
+
+All projects in a run share one schedule and every amount is linear in the
+allocation, so portfolio metrics only depend on the portfolio's total tokens.
+
+Requires NumPy.
+
+Usage:
+    python3 vesting_sweep.py --cliff-days 0 30 60 90 --tail-ratio 0.05 0.1 0.2 \\
+        --vesting-months 1 2 3 --milestone-months 1,2,4,6 2,3,5,6 --top 10
+"""
+
+import argparse
+import csv
+import itertools
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterator, List, Sequence
+
+from vesting_engine import VestingConfig, np, pool_fractions
+
+SWEEP_PARAMETERS = (
+    'cliff_period_days', 'milestone_period_months', 'tail_vesting_months',
+    'tail_vesting_ratio', 'milestone_vesting_months', 'milestone_months'
+)
+SWEEP_METRICS = (
+    'peak_monthly_outflow', 'peak_month', 'months_to_half_vested',
+    'tail_share', 'final_vested_pct', 'unvested_tokens'
+)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("vesting_sweep requires NumPy (pip install numpy)")
+
+
+def build_grid(base: VestingConfig, **grid: Sequence[Any]) -> List[VestingConfig]:
+    """
+    Expand parameter grids into configurations (cartesian product).
+
+    Keys are VestingConfig field names, plus milestone_months: sequences of
+    target months replacing those of base.milestones (names are kept).
+    Parameters not given keep their value from base.
+    """
+    unknown = set(grid) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {', '.join(sorted(unknown))}")
+
+    names = [name for name, _ in base.milestones]
+    keys = list(grid)
+    configs = []
+    for values in itertools.product(*(grid[key] for key in keys)):
+        changes = dict(zip(keys, values))
+        months = changes.pop('milestone_months', None)
+        if months is not None:
+            if len(months) != len(names):
+                raise ValueError(f"Expected {len(names)} milestone months, got {tuple(months)}")
+            changes['milestones'] = tuple(zip(names, (int(m) for m in months)))
+        configs.append(replace(base, **changes))
+    return configs
+
+
+def sweep_curves(configs: Sequence[VestingConfig]):
+    """
+    Unit vesting curves of many configurations as arrays.
+
+    Returns (vest_fraction, tail_fraction), both (configs, months) where
+    months is the longest timeline; shorter timelines are zero-padded.
+    """
+    _require_numpy()
+    if not configs:
+        raise ValueError("No configurations to sweep")
+    num_milestones = {len(c.milestones) for c in configs}
+    if len(num_milestones) != 1 or 0 in num_milestones:
+        raise ValueError("All swept configurations need the same (non-zero) number of milestones")
+    if any(c.milestone_vesting_months < 1 for c in configs):
+        raise ValueError("milestone_vesting_months must be at least 1")
+
+    cliff = np.array([c.cliff_period_days for c in configs], dtype=np.float64)[:, None]
+    days_per_month = np.array([c.days_per_month for c in configs], dtype=np.float64)[:, None]
+    milestone_period = np.array([c.milestone_period_months for c in configs])[:, None]
+    tail_months = np.array([c.tail_vesting_months for c in configs])[:, None]
+    tail_ratio = np.array([c.tail_vesting_ratio for c in configs])[:, None]
+    vesting_months = np.array([c.milestone_vesting_months for c in configs])[:, None]
+    unlock = np.array([[month for _, month in c.milestones] for c in configs])
+    num_months = np.array([c.num_months for c in configs])[:, None]
+
+    month = np.arange(int(num_months.max()))[None, :]
+    in_timeline = month < num_months
+    past_cliff = month * days_per_month >= cliff
+    # Nothing vests before the cliff, in month 0 or past the timeline
+    open_month = past_cliff & (month > 0) & in_timeline
+
+    # Milestone pools: each unlocked pool vests for vesting_months from max(unlock, 1)
+    monthly_pool_fraction = np.array([pool_fractions(c) for c in configs]) / vesting_months
+    unlocks = (unlock >= 0) & (unlock < num_months) & (unlock * days_per_month >= cliff)
+    start = np.maximum(unlock, 1)[:, :, None]
+    vesting = (
+        unlocks[:, :, None]
+        & (month[:, None, :] >= start)
+        & (month[:, None, :] < start + vesting_months[:, :, None])
+    )
+    pool_vest = (vesting * monthly_pool_fraction[:, :, None]).sum(axis=1)
+
+    # Tail: tail_vesting_ratio spread over tail_vesting_months after the milestone period
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tail_rate = np.where(tail_months > 0, tail_ratio / tail_months, 0.0)
+    tail_vest = np.where(month > milestone_period, tail_rate, 0.0)
+
+    pool_vest = np.where(open_month, pool_vest, 0.0)
+    tail_vest = np.where(open_month, tail_vest, 0.0)
+    return pool_vest + tail_vest, tail_vest
+
+
+@dataclass
+class SweepResult:
+    """Per-configuration portfolio metrics of a sweep"""
+    configs: List[VestingConfig]
+    total_tokens: float
+    monthly_outflow: 'np.ndarray'   # (configs, months) tokens vesting per month
+    metrics: Dict[str, 'np.ndarray']
+
+    def __len__(self) -> int:
+        return len(self.configs)
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """Parameters and metrics of one configuration"""
+        config = self.configs[i]
+        row = {
+            'cliff_period_days': config.cliff_period_days,
+            'milestone_period_months': config.milestone_period_months,
+            'tail_vesting_months': config.tail_vesting_months,
+            'tail_vesting_ratio': config.tail_vesting_ratio,
+            'milestone_vesting_months': config.milestone_vesting_months,
+            'milestone_months': ' '.join(str(month) for _, month in config.milestones)
+        }
+        for name in SWEEP_METRICS:
+            row[name] = self.metrics[name][i].item()
+        return row
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def ranked(self, metric: str, descending: bool = False) -> 'np.ndarray':
+        """Configuration indices ordered by a metric (ties keep grid order)"""
+        values = self.metrics[metric]
+        return np.argsort(-values if descending else values, kind='stable')
+
+    def to_csv(self, output_path: str):
+        """Write one row per configuration"""
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(SWEEP_PARAMETERS) + list(SWEEP_METRICS))
+            writer.writeheader()
+            writer.writerows(self.rows())
+
+
+def sweep_configs(configs: Sequence[VestingConfig], total_tokens: float) -> SweepResult:
+    """Evaluate portfolio metrics for every configuration in one batched pass"""
+    configs = list(configs)
+    vest_fraction, tail_fraction = sweep_curves(configs)
+    cumulative = np.cumsum(vest_fraction, axis=1)
+    final_fraction = cumulative[:, -1]
+
+    # Tolerance absorbs rounding in the running sum
+    half_vested = cumulative >= 0.5 - 1e-12
+    tail_total = tail_fraction.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tail_share = np.where(final_fraction > 0, tail_total / final_fraction, 0.0)
+
+    metrics = {
+        'peak_monthly_outflow': vest_fraction.max(axis=1) * total_tokens,
+        'peak_month': vest_fraction.argmax(axis=1),
+        'months_to_half_vested': np.where(half_vested.any(axis=1), half_vested.argmax(axis=1), -1),
+        'tail_share': tail_share,
+        'final_vested_pct': final_fraction * 100,
+        # Fully vested curves can sum to 1 - epsilon; report those as 0 unvested
+        'unvested_tokens': np.where(final_fraction < 1.0 - 1e-9, 1.0 - final_fraction, 0.0) * total_tokens
+    }
+    return SweepResult(
+        configs=configs,
+        total_tokens=total_tokens,
+        monthly_outflow=vest_fraction * total_tokens,
+        metrics=metrics
+    )
+
+
+def sweep(base: VestingConfig, total_tokens: float, **grid: Sequence[Any]) -> SweepResult:
+    """Expand parameter grids around base and evaluate every combination"""
+    return sweep_configs(build_grid(base, **grid), total_tokens)
+
+
+def _month_list(text: str) -> List[int]:
+    return [int(month) for month in text.split(',')]
+
+
+def main():
+    """Sweep vesting parameters over the Fund 5 portfolio"""
+    from token_distribution_hybrid import HybridVestingProcessor, current_vesting_config
+
+    parser = argparse.ArgumentParser(description="Sweep hybrid vesting parameters")
+    parser.add_argument('--csv', default='Project-Catalyst-Fund-5-Developer-Ecosystem.csv',
+                        help='Funded projects CSV')
+    parser.add_argument('--cliff-days', type=int, nargs='+', dest='cliff_period_days')
+    parser.add_argument('--tail-ratio', type=float, nargs='+', dest='tail_vesting_ratio')
+    parser.add_argument('--tail-months', type=int, nargs='+', dest='tail_vesting_months')
+    parser.add_argument('--milestone-period', type=int, nargs='+', dest='milestone_period_months')
+    parser.add_argument('--vesting-months', type=int, nargs='+', dest='milestone_vesting_months')
+    parser.add_argument('--milestone-months', type=_month_list, nargs='+', dest='milestone_months',
+                        help='Comma-separated target months per milestone, e.g. 1,2,4,6')
+    parser.add_argument('--sort', choices=SWEEP_METRICS, default='peak_monthly_outflow')
+    parser.add_argument('--descending', action='store_true')
+    parser.add_argument('--top', type=int, default=10, help='Configurations to print')
+    parser.add_argument('--output', help='Write all results to this CSV')
+    args = parser.parse_args()
+
+    grid = {name: getattr(args, name) for name in SWEEP_PARAMETERS if getattr(args, name)}
+    processor = HybridVestingProcessor(args.csv)
+    result = sweep(current_vesting_config(), processor.portfolio_tokens(), **grid)
+
+    print(f"Evaluated {len(result)} configurations for {result.total_tokens:,.0f} tokens")
+    print(f"{'Cliff':>6} {'Tail%':>6} {'TailM':>5} {'VestM':>5} {'Milestones':<12} "
+          f"{'PeakOutflow':>12} {'Peak':>5} {'Half':>5} {'TailShare':>9} {'Vested%':>8}")
+    for i in result.ranked(args.sort, args.descending)[:args.top]:
+        row = result.row(i)
+        print(f"{row['cliff_period_days']:>6} {row['tail_vesting_ratio'] * 100:>5.1f}% "
+              f"{row['tail_vesting_months']:>5} {row['milestone_vesting_months']:>5} "
+              f"{row['milestone_months']:<12} {row['peak_monthly_outflow']:>12,.0f} "
+              f"{row['peak_month']:>5} {row['months_to_half_vested']:>5} "
+              f"{row['tail_share']:>9.3f} {row['final_vested_pct']:>7.1f}%")
+
+    if args.output:
+        result.to_csv(args.output)
+        print(f"Sweep results written: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
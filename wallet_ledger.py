@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Wallet Ledger
+============================================
+
+Per-recipient view of the allocations. Each project's project, participant
+and auditor tokens are split across wallets by a recipient-share file, and
+the ledger answers per-wallet vested and unvested balances across all
+projects.
+
+Every recipient of a configuration follows the same unit schedule (the
+cached schedule template), so the ledger never expands timelines: a wallet
+is stored as its tokens per project start day. A balance query costs
+O(distinct start days of the wallet), one lookup in the shared cumulative
+curve each, whatever the number of projects or wallets.
+
+Recipient shares are a CSV with one row per wallet and category:
+
+    Project,Category,Wallet,Share
+    Testnet Cardanoscan Explorer,participant,addr1qx...,3
+    Testnet Cardanoscan Explorer,participant,addr1qy...,1
+    Testnet Cardanoscan Explorer,auditor,addr1qz...,1
+
+Shares are weights, normalized within each (project, category). Categories
+without recipients stay unassigned and are reported.
+
+Usage:
+    python3 wallet_ledger.py --shares recipients.csv --wallet addr1qx... --month 4
+    python3 wallet_ledger.py --shares recipients.csv --stagger-days 14 --output balances.csv
+"""
+
+import argparse
+import csv
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from vesting_engine import CATEGORIES, VestingConfig, schedule_template
+
+SHARE_COLUMNS = ('Project', 'Category', 'Wallet', 'Share')
+
+
+@dataclass(frozen=True)
+class RecipientShare:
+    """Share of one wallet in one category allocation of a project"""
+    project: str
+    category: str
+    wallet: str
+    share: float
+
+
+@dataclass
+class WalletBalance:
+    """Vested and unvested tokens of a wallet on a given day"""
+    wallet: str
+    day: int
+    total_tokens: float
+    vested_tokens: float
+    unvested_tokens: float
+    holdings: int                 # (project, category) allocations held
+
+
+def read_recipient_shares(csv_path: str) -> List[RecipientShare]:
+    """Read a recipient-share CSV (see module docstring)"""
+    shares = []
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        missing = [column for column in SHARE_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"{csv_path}: missing columns {', '.join(missing)}")
+        for line, row in enumerate(reader, start=2):
+            category = row['Category'].strip().lower()
+            if category not in CATEGORIES:
+                raise ValueError(f"{csv_path}:{line}: unknown category {row['Category']!r}")
+            share = float(row['Share'])
+            if share < 0:
+                raise ValueError(f"{csv_path}:{line}: negative share {share}")
+            shares.append(RecipientShare(row['Project'].strip(), category, row['Wallet'].strip(), share))
+    return shares
+
+
+class WalletLedger:
+    """Wallet holdings as tokens per start day over one shared unit schedule"""
+
+    def __init__(self, config: VestingConfig):
+        self.config = config
+        self.curve = schedule_template(config).cumulative_fraction
+        self.wallets: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        self.holdings: Dict[str, int] = defaultdict(int)
+        self.unassigned_tokens: Dict[str, float] = {category: 0.0 for category in CATEGORIES}
+        self.unknown_projects: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.wallets)
+
+    def add_project(self, start_day: int, category_tokens: Sequence[float],
+                    shares: Iterable[RecipientShare]):
+        """Credit a project's category allocations to its recipients"""
+        by_category: Dict[str, List[RecipientShare]] = defaultdict(list)
+        for share in shares:
+            by_category[share.category].append(share)
+
+        for category, tokens in zip(CATEGORIES, category_tokens):
+            recipients = by_category.get(category, [])
+            total_share = sum(r.share for r in recipients)
+            if total_share <= 0:
+                self.unassigned_tokens[category] += tokens
+                continue
+            for r in recipients:
+                self.wallets[r.wallet][start_day] += tokens * r.share / total_share
+                self.holdings[r.wallet] += 1
+
+    @classmethod
+    def from_allocations(cls, allocations, shares: Iterable[RecipientShare], config: VestingConfig,
+                         start_days: Optional[Sequence[int]] = None) -> 'WalletLedger':
+        """
+        Build a ledger from processor allocations (pure or hybrid).
+
+        Shares are matched to allocations by proposal name; start_days gives
+        each allocation's start day (default: all on day 0).
+        """
+        ledger = cls(config)
+        by_project: Dict[str, List[RecipientShare]] = defaultdict(list)
+        for share in shares:
+            by_project[share.project].append(share)
+
+        seen = set()
+        for i, alloc in enumerate(allocations):
+            seen.add(alloc.proposal_name)
+            ledger.add_project(
+                start_days[i] if start_days is not None else 0,
+                (alloc.project_tokens, alloc.participant_tokens, alloc.auditor_tokens),
+                by_project.get(alloc.proposal_name, ())
+            )
+        ledger.unknown_projects = sorted(set(by_project) - seen)
+        return ledger
+
+    def vested_fraction(self, elapsed_days: int) -> float:
+        """Vested fraction of an allocation elapsed_days after its start (flat after the schedule)"""
+        if elapsed_days < 0:
+            return 0.0
+        month = min(elapsed_days // self.config.days_per_month, len(self.curve) - 1)
+        return self.curve[month]
+
+    def balance(self, wallet: str, day: int) -> WalletBalance:
+        """Balance of a wallet on a day (all zero for unknown wallets)"""
+        starts = self.wallets.get(wallet, {})
+        total = sum(starts.values())
+        vested = sum(tokens * self.vested_fraction(day - start) for start, tokens in starts.items())
+        return WalletBalance(wallet, day, total, vested, total - vested, self.holdings.get(wallet, 0))
+
+    def balances(self, day: int) -> Iterator[WalletBalance]:
+        """Balances of every wallet on a day"""
+        for wallet in self.wallets:
+            yield self.balance(wallet, day)
+
+
+def write_balances_csv(output_path: str, balances: Iterable[WalletBalance]) -> int:
+    """Write wallet balances as CSV rows; returns the number written"""
+    count = 0
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Wallet', 'Day', 'Holdings', 'Total Tokens', 'Vested Tokens', 'Unvested Tokens'])
+        for b in balances:
+            writer.writerow([
+                b.wallet, b.day, b.holdings,
+                f"{b.total_tokens:.2f}", f"{b.vested_tokens:.2f}", f"{b.unvested_tokens:.2f}"
+            ])
+            count += 1
+    return count
+
+
+def main():
+    """Wallet balances of the funded projects' recipients"""
+    parser = argparse.ArgumentParser(description="Per-wallet vested and unvested balances")
+    parser.add_argument('--shares', required=True, help='Recipient-share CSV (Project, Category, Wallet, Share)')
+    parser.add_argument('--csv', default='Project-Catalyst-Fund-5-Developer-Ecosystem.csv',
+                        help='Funded projects CSV')
+    parser.add_argument('--approach', choices=('hybrid', 'pure'), default='hybrid')
+    parser.add_argument('--stagger-days', type=int, default=0,
+                        help='Start projects this many days apart (CSV order)')
+    when = parser.add_mutually_exclusive_group()
+    when.add_argument('--day', type=int, help='Day on which balances are taken')
+    when.add_argument('--month', type=int, help='Month on which balances are taken (default: end of every schedule)')
+    parser.add_argument('--wallet', action='append', help='Wallet to report (repeatable; default: all)')
+    parser.add_argument('--output', help='Write the balances to this CSV instead of printing them')
+    args = parser.parse_args()
+
+    if args.approach == 'hybrid':
+        from token_distribution_hybrid import HybridVestingProcessor, current_vesting_config as current_config
+        processor = HybridVestingProcessor(args.csv)
+        allocate = lambda project: processor.calculate_hybrid_allocation(project, include_timeline=False)
+    else:
+        from token_distribution import TokenDistributionProcessor, current_release_config as current_config
+        processor = TokenDistributionProcessor(args.csv)
+        allocate = processor.calculate_token_allocation
+    config = current_config()
+
+    allocations = [allocate(project) for project in processor.iter_funded_projects()]
+    start_days = [i * args.stagger_days for i in range(len(allocations))]
+    ledger = WalletLedger.from_allocations(allocations, read_recipient_shares(args.shares), config, start_days)
+
+    if args.day is not None:
+        day = args.day
+    elif args.month is not None:
+        day = args.month * config.days_per_month
+    else:
+        # End of the last project's schedule: everything that will vest has vested
+        day = max(start_days, default=0) + config.total_duration_months * config.days_per_month
+
+    print(f"Wallet ledger: {len(ledger):,} wallets over {len(allocations)} projects, day {day}")
+    for category, tokens in ledger.unassigned_tokens.items():
+        if tokens:
+            print(f"  Unassigned {category} tokens: {tokens:,.2f}")
+    if ledger.unknown_projects:
+        print(f"  Shares for {len(ledger.unknown_projects)} unknown project(s): {', '.join(ledger.unknown_projects)}")
+
+    balances = (ledger.balance(w, day) for w in args.wallet) if args.wallet else ledger.balances(day)
+    if args.output:
+        count = write_balances_csv(args.output, balances)
+        print(f"{count} wallet balances written: {args.output}")
+        return
+
+    print(f"\n{'Wallet':<40} {'Total':>14} {'Vested':>14} {'Unvested':>14}")
+    for b in balances:
+        print(f"{b.wallet:<40} {b.total_tokens:>14,.2f} {b.vested_tokens:>14,.2f} {b.unvested_tokens:>14,.2f}")
+
+
+if __name__ == '__main__':
+    main()
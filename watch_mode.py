@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Token Distribution Framework - Watch Mode
+=========================================
+
+Long-running regeneration of the dashboard data while the fund CSV is
+edited. Replaces rerunning both scripts and copying their outputs into
+dashboard/data by hand.
+
+- Change detection: the input files are polled (modification time and
+  size, no extra dependencies); a regeneration is skipped when the content
+  hash did not actually change.
+- Debouncing: a regeneration starts only once the inputs have been quiet
+  for --debounce seconds, so a burst of saves causes a single run.
+- Incremental work: allocations go through an allocation cache (in memory
+  by default), so only proposals whose rows changed are recalculated.
+- Atomic output: every dashboard file is written to a temporary file and
+  renamed over the old one, and unchanged files are left untouched. A
+  failed run (e.g. a half-saved CSV) leaves the previous data in place.
+
+Each run writes the sharded pure, hybrid and comparison data plus the
+single-file fallbacks (pure-milestone.json, hybrid-vesting.json); with
+--write-outputs it also rewrites the CSV / JSON outputs in the working
+directory.
+
+Usage:
+    python3 watch_mode.py
+    python3 watch_mode.py --csv funds/Fund-6.csv --dashboard-dir dashboard/data --debounce 2
+    python3 watch_mode.py --cache .allocation_cache.sqlite --write-outputs
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import os
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import dashboard_export
+from allocation_cache import AllocationCache
+from unified_engine import UnifiedProcessor
+
+DEFAULT_DEBOUNCE = 1.0        # Quiet seconds required before regenerating
+DEFAULT_POLL_INTERVAL = 0.25  # Seconds between input checks
+MEMORY_CACHE = ':memory:'
+
+# Single-file dashboard fallbacks per approach
+FALLBACK_FILENAMES = {'pure': 'pure-milestone.json', 'hybrid': 'hybrid-vesting.json'}
+
+# Outputs rewritten with --write-outputs
+OUTPUT_FILENAMES = {
+    'pure': ('token_allocations_output.csv', 'token_allocations_output.json'),
+    'hybrid': ('token_allocations_hybrid_output.csv', 'token_allocations_hybrid_output.json'),
+}
+
+
+def file_state(paths: Sequence[str]) -> Dict[str, Optional[Tuple[int, int]]]:
+    """(modification time, size) of each path, None when missing"""
+    state = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            state[path] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            state[path] = None
+    return state
+
+
+def content_hash(paths: Sequence[str]) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        with contextlib.suppress(FileNotFoundError), open(path, 'rb') as f:
+            digest.update(f.read())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class DashboardRegenerator:
+    """Recomputes allocations from the CSV and atomically replaces the dashboard data"""
+
+    def __init__(self, csv_path: str, dashboard_dir: str, cache_path: str = MEMORY_CACHE,
+                 write_outputs: bool = False):
+        self.csv_path = csv_path
+        self.dashboard_dir = dashboard_dir
+        self.cache = AllocationCache(cache_path)
+        self.write_outputs = write_outputs
+        self.last_hash: Optional[str] = None
+        self.runs = 0
+
+    def close(self):
+        self.cache.close()
+
+    def regenerate(self, force: bool = False) -> bool:
+        """Regenerate unless the CSV content is unchanged since the last run; returns True if run"""
+        digest = content_hash([self.csv_path])
+        if digest == self.last_hash and not force:
+            print(f"[{datetime.now():%H:%M:%S}] {self.csv_path} touched but unchanged, skipped")
+            return False
+
+        start = time.perf_counter()
+        unified = UnifiedProcessor(self.csv_path)
+        log = io.StringIO()
+        # The processors report every step on stdout; only the cache lines are kept
+        with contextlib.redirect_stdout(log):
+            unified.process_all_projects(self.cache)
+            unified.export_dashboard_data(self.dashboard_dir)
+            for approach, processor in (('pure', unified.pure), ('hybrid', unified.hybrid)):
+                fallback = os.path.join(self.dashboard_dir, FALLBACK_FILENAMES[approach])
+                with dashboard_export.atomic_path(fallback) as tmp:
+                    processor.export_to_json(tmp)
+                if self.write_outputs:
+                    csv_output, json_output = OUTPUT_FILENAMES[approach]
+                    with dashboard_export.atomic_path(csv_output) as tmp:
+                        processor.export_to_csv(tmp)
+                    with dashboard_export.atomic_path(json_output) as tmp:
+                        processor.export_to_json(tmp)
+
+        self.last_hash = digest
+        self.runs += 1
+        cache_lines = [line for line in log.getvalue().splitlines() if line.startswith('Allocation cache')]
+        print(f"[{datetime.now():%H:%M:%S}] Regenerated {self.dashboard_dir} from {self.csv_path}: "
+              f"{len(unified.pure.allocations)} projects in {time.perf_counter() - start:.2f}s")
+        for approach, line in zip(('pure', 'hybrid'), cache_lines):
+            print(f"  {approach}: {line}")
+        return True
+
+
+def watch(paths: List[str], on_change: Callable[[], None], debounce: float = DEFAULT_DEBOUNCE,
+          poll_interval: float = DEFAULT_POLL_INTERVAL, max_runs: Optional[int] = None):
+    """
+    Call on_change once the watched paths changed and then stayed quiet for debounce seconds.
+
+    Every change restarts the quiet period, so a burst of saves triggers one
+    call. on_change errors are reported and watching continues. Runs until
+    interrupted, or until on_change ran max_runs times.
+    """
+    last_state = file_state(paths)
+    changed_at: Optional[float] = None
+    runs = 0
+    while max_runs is None or runs < max_runs:
+        time.sleep(poll_interval)
+        state = file_state(paths)
+        if state != last_state:
+            last_state = state
+            changed_at = time.monotonic()
+            continue
+        if changed_at is not None and time.monotonic() - changed_at >= debounce:
+            changed_at = None
+            runs += 1
+            try:
+                on_change()
+            except Exception as e:
+                # Keep watching: the previous dashboard data is still intact
+                print(f"[{datetime.now():%H:%M:%S}] Regeneration failed: {type(e).__name__}: {e}")
+
+
+def main():
+    """Watch the fund CSV and keep the dashboard data up to date"""
+    parser = argparse.ArgumentParser(description="Regenerate dashboard data whenever the input CSV changes")
+    parser.add_argument('--csv', default='Project-Catalyst-Fund-5-Developer-Ecosystem.csv',
+                        help='Funded projects CSV to watch')
+    parser.add_argument('--dashboard-dir', default=os.path.join('dashboard', 'data'),
+                        help='Dashboard data directory to keep up to date')
+    parser.add_argument('--cache', default=MEMORY_CACHE,
+                        help='Allocation cache file (default: in memory for this session)')
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE,
+                        help='Seconds without further changes before regenerating')
+    parser.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                        help='Seconds between checks of the input files')
+    parser.add_argument('--write-outputs', action='store_true',
+                        help='Also rewrite the CSV / JSON outputs in the working directory')
+    args = parser.parse_args()
+
+    regenerator = DashboardRegenerator(args.csv, args.dashboard_dir, args.cache, args.write_outputs)
+    try:
+        # Start from data that matches the CSV as it is now
+        regenerator.regenerate(force=True)
+        print(f"Watching {args.csv} (debounce {args.debounce}s, Ctrl+C to stop)")
+        watch([args.csv], regenerator.regenerate, args.debounce, args.poll_interval)
+    except KeyboardInterrupt:
+        print(f"\nStopped after {regenerator.runs} regeneration(s)")
+    finally:
+        regenerator.close()
+
+
+if __name__ == '__main__':
+    main()